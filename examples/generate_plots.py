@@ -147,10 +147,14 @@ def plot_data_structure_comparison():
     # Queue vs List
     queue_times = []
     list_enqueue_times = []
+    dequeue_times = []
+    list_pop_front_times = []
     for size in sizes:
         result = compare_queue_vs_list(size, iterations=10)
         queue_times.append(result['queue_enqueue'])
         list_enqueue_times.append(result['list_append'])
+        dequeue_times.append(result['queue_dequeue'])
+        list_pop_front_times.append(result['list_pop_front'])
     
     # Linked List vs List
     ll_append_times = []
@@ -182,9 +186,11 @@ def plot_data_structure_comparison():
     plt.figure(figsize=(10, 6))
     plt.plot(sizes, queue_times, marker='o', label='Queue.enqueue()', linewidth=2)
     plt.plot(sizes, list_enqueue_times, marker='s', label='List.append()', linewidth=2)
+    plt.plot(sizes, dequeue_times, marker='^', label='Queue.dequeue()', linewidth=2)
+    plt.plot(sizes, list_pop_front_times, marker='v', label='List.pop(0)', linewidth=2)
     plt.xlabel('Number of Operations', fontsize=12)
     plt.ylabel('Total Time (seconds)', fontsize=12)
-    plt.title('Queue vs List: Enqueue/Append Performance', fontsize=14, fontweight='bold')
+    plt.title('Queue vs List: Enqueue and Dequeue Performance', fontsize=14, fontweight='bold')
     plt.legend()
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
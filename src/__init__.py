@@ -7,10 +7,31 @@ This package contains implementations of:
 - Elementary data structures (Arrays, Stacks, Queues, Linked Lists, Trees)
 """
 
-from .deterministic_algorithm import deterministic_select, find_median
-from .randomized_algorithm import randomized_select, find_median as randomized_find_median
+from .deterministic_algorithm import (
+    deterministic_select, find_median, argselect, argselect_many
+)
+from .randomized_algorithm import (
+    randomized_select,
+    find_median as randomized_find_median,
+    argselect as randomized_argselect,
+    argselect_many as randomized_argselect_many,
+)
+from .partial_sort import partial_sort, iter_sorted
+from .sharded_select import select_across
+from .counting_select import counting_select, radix_select
+from .rank_filter import median_filter, rank_filter
+from .selection_server import SelectionServer, SelectionClient
+from .selection_planner import (
+    select, select_many, batch_select, batch_select_many, SelectionPlanner
+)
+from .shared_array import SharedDynamicArray
+from .sparse_matrix import SparseMatrix
+from .matrix_parallel import (
+    Semiring, PLUS_TIMES, MIN_PLUS, MAX_PLUS, BOOLEAN, tiled_matmul, parallel_matmul
+)
 from .data_structures import (
-    DynamicArray, Matrix, Stack, Queue, LinkedList, Tree, TreeNode
+    DynamicArray, DynamicArrayView, GapBuffer, Matrix, Stack, Queue, BoundedQueue, AsyncQueue,
+    AsyncStack, PriorityQueue, IndexedPriorityQueue, LinkedList, Tree, TreeNode
 )
 
 __all__ = [
@@ -18,10 +39,44 @@ __all__ = [
     'find_median',
     'randomized_select',
     'randomized_find_median',
+    'argselect',
+    'argselect_many',
+    'randomized_argselect',
+    'randomized_argselect_many',
+    'partial_sort',
+    'iter_sorted',
+    'select_across',
+    'counting_select',
+    'radix_select',
+    'median_filter',
+    'rank_filter',
+    'select',
+    'select_many',
+    'batch_select',
+    'batch_select_many',
+    'SelectionPlanner',
+    'SelectionServer',
+    'SelectionClient',
     'DynamicArray',
+    'DynamicArrayView',
+    'GapBuffer',
+    'SharedDynamicArray',
     'Matrix',
+    'SparseMatrix',
+    'Semiring',
+    'PLUS_TIMES',
+    'MIN_PLUS',
+    'MAX_PLUS',
+    'BOOLEAN',
+    'tiled_matmul',
+    'parallel_matmul',
     'Stack',
     'Queue',
+    'BoundedQueue',
+    'AsyncQueue',
+    'AsyncStack',
+    'PriorityQueue',
+    'IndexedPriorityQueue',
     'LinkedList',
     'Tree',
     'TreeNode',
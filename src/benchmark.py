@@ -9,6 +9,12 @@ Course: MSCS532 - Data Structures and Algorithms
 """
 
 import time
+import array
+import asyncio
+import json
+import operator
+import tracemalloc
+from functools import partial
 import numpy as np
 from typing import List, Dict, Tuple, Callable, Any
 
@@ -96,6 +102,32 @@ def benchmark_selection(
     return avg_time, result
 
 
+def _average_time(
+    operation: Callable,
+    iterations: int,
+    setup: Callable = None
+) -> float:
+    """
+    Average wall-clock seconds per call of operation over iterations calls.
+    
+    When setup is given, each call is operation(setup()) and the time spent
+    in setup is excluded, so every iteration starts from fresh input.
+    """
+    times = []
+    for _ in range(iterations):
+        if setup is None:
+            start = time.perf_counter()
+            operation()
+        else:
+            args = setup()
+            start = time.perf_counter()
+            operation(args)
+        end = time.perf_counter()
+        times.append(end - start)
+    
+    return sum(times) / len(times)
+
+
 def benchmark_selection_algorithms(
     sizes: List[int],
     distributions: Dict[str, Callable],
@@ -130,10 +162,10 @@ def benchmark_selection_algorithms(
             k_values = [max(1, int(ratio * size)) for ratio in k_ratios]
             k = k_values[len(k_values) // 2]  # Use middle k value
             
-            # Benchmark deterministic
+            # Benchmark deterministic (comparison engine only, no counting shortcut)
             try:
                 time_det, _ = benchmark_selection(
-                    deterministic_select, arr, k, iterations
+                    partial(deterministic_select, counting=False), arr, k, iterations
                 )
                 results['deterministic'][dist_name].append(time_det)
             except (RecursionError, Exception) as e:
@@ -143,7 +175,7 @@ def benchmark_selection_algorithms(
             # Benchmark randomized
             try:
                 time_rand, _ = benchmark_selection(
-                    randomized_select, arr, k, iterations, seed=42
+                    partial(randomized_select, counting=False), arr, k, iterations, seed=42
                 )
                 results['randomized'][dist_name].append(time_rand)
             except (RecursionError, Exception) as e:
@@ -153,6 +185,736 @@ def benchmark_selection_algorithms(
     return results
 
 
+def compare_buffer_vs_list_selection(
+    n: int,
+    typecode: str = 'd',
+    algorithm: Callable = deterministic_select,
+    iterations: int = 3,
+    seed: int = None
+) -> Dict[str, float]:
+    """
+    Compare selecting from a typed buffer against the boxed-list path.
+    
+    The buffer path passes an array.array straight to the algorithm, which
+    partitions a typed scratch copy. The list path converts the buffer with
+    list() first, as callers had to before buffer inputs were supported.
+    
+    Args:
+        n: Number of elements
+        typecode: array.array typecode of the buffer ('d', 'q', 'i', ...)
+        algorithm: The selection function to benchmark
+        iterations: Number of iterations to average
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with average times (seconds) and peak traced memory (bytes)
+    """
+    if seed is not None:
+        np.random.seed(seed)
+    if typecode in 'fd':
+        values = np.random.random(size=n).tolist()
+    else:
+        values = np.random.randint(1, 1000, size=n).tolist()
+    buf = array.array(typecode, values)
+    del values
+    k = max(1, n // 2)
+    
+    def run(make_input):
+        times = []
+        peak = 0
+        for _ in range(iterations):
+            tracemalloc.start()
+            start = time.perf_counter()
+            algorithm(make_input(), k)
+            end = time.perf_counter()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            times.append(end - start)
+        return sum(times) / len(times), peak
+    
+    buffer_time, buffer_peak = run(lambda: buf)
+    list_time, list_peak = run(lambda: list(buf))
+    
+    return {
+        'buffer_time': buffer_time,
+        'list_time': list_time,
+        'buffer_peak_bytes': buffer_peak,
+        'list_peak_bytes': list_peak
+    }
+
+
+def compare_container_selection(
+    n: int,
+    algorithm: Callable = randomized_select,
+    iterations: int = 3,
+    seed: int = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare selecting directly from each project container against first
+    materializing it the way callers had to before selection understood them.
+    
+    The baselines are list() over DynamicArray.__getitem__, LinkedList.get(i)
+    for every index (O(n^2)) and draining a Stack/Queue with pop/dequeue and
+    refilling it (O(n^2) for the list-backed Queue).
+    
+    Args:
+        n: Number of elements per container
+        algorithm: The selection function to benchmark
+        iterations: Number of iterations to average
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary mapping container name to {'direct': ..., 'materialized': ...}
+        average times in seconds
+    """
+    try:
+        from .data_structures import DynamicArray, LinkedList, Queue, Stack
+    except ImportError:
+        from src.data_structures import DynamicArray, LinkedList, Queue, Stack
+    
+    if seed is not None:
+        np.random.seed(seed)
+    values = np.random.random(size=n).tolist()
+    k = max(1, n // 2)
+    
+    dynamic_array = DynamicArray()
+    linked_list = LinkedList()
+    stack = Stack()
+    queue = Queue()
+    for value in values:
+        dynamic_array.append(value)
+        linked_list.append(value)
+        stack.push(value)
+        queue.enqueue(value)
+    
+    def drain_stack():
+        items = []
+        while not stack.is_empty():
+            items.append(stack.pop())
+        for item in reversed(items):
+            stack.push(item)
+        return items
+    
+    def drain_queue():
+        items = []
+        while not queue.is_empty():
+            items.append(queue.dequeue())
+        for item in items:
+            queue.enqueue(item)
+        return items
+    
+    containers = {
+        'DynamicArray': (dynamic_array, lambda: [dynamic_array[i] for i in range(len(dynamic_array))]),
+        'LinkedList': (linked_list, lambda: [linked_list.get(i) for i in range(len(linked_list))]),
+        'Stack': (stack, drain_stack),
+        'Queue': (queue, drain_queue)
+    }
+    
+    results = {}
+    for name, (container, materialize) in containers.items():
+        results[name] = {
+            'direct': _average_time(lambda: algorithm(container, k), iterations),
+            'materialized': _average_time(lambda: algorithm(materialize(), k), iterations)
+        }
+    
+    return results
+
+
+def compare_partial_sort_vs_full_sort(
+    n: int,
+    k: int,
+    iterations: int = 3,
+    seed: int = None
+) -> Dict[str, float]:
+    """
+    Compare top-k listing with partial_sort and iter_sorted against sorted().
+    
+    Args:
+        n: Number of elements
+        k: Number of smallest elements to list
+        iterations: Number of iterations to average
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with average times in seconds
+    """
+    try:
+        from .partial_sort import partial_sort, iter_sorted
+    except ImportError:
+        from src.partial_sort import partial_sort, iter_sorted
+    
+    arr = generate_random_array(n, seed)
+    
+    def take_k():
+        it = iter_sorted(arr)
+        return [next(it) for _ in range(k)]
+    
+    return {
+        'partial_sort': _average_time(lambda: partial_sort(arr, k), iterations),
+        'iter_sorted': _average_time(take_k, iterations),
+        'full_sort': _average_time(lambda: sorted(arr)[:k], iterations)
+    }
+
+
+def compare_integer_selection_engines(
+    n: int,
+    value_range: int = 1000,
+    iterations: int = 3,
+    seed: int = None
+) -> Dict[str, float]:
+    """
+    Compare the counting and radix engines against comparison-based selection
+    on integers drawn from [1, value_range].
+    
+    Args:
+        n: Number of elements
+        value_range: Largest value generated
+        iterations: Number of iterations to average
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with average times in seconds per engine
+    """
+    try:
+        from .counting_select import counting_select, radix_select
+    except ImportError:
+        from src.counting_select import counting_select, radix_select
+    
+    if seed is not None:
+        np.random.seed(seed)
+    arr = np.random.randint(1, value_range + 1, size=n).tolist()
+    k = max(1, n // 2)
+    
+    engines = {
+        'counting': lambda a: counting_select(a, k),
+        'radix': lambda a: radix_select(a, k),
+        'randomized': lambda a: randomized_select(a, k, counting=False),
+        'deterministic': lambda a: deterministic_select(a, k, counting=False)
+    }
+    
+    return {
+        name: _average_time(lambda: engine(arr), iterations)
+        for name, engine in engines.items()
+    }
+
+
+def benchmark_selection_planner(
+    sizes: List[int],
+    distributions: Dict[str, Callable] = None,
+    k_ratio: float = 0.5,
+    iterations: int = 3
+) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Benchmark the selection planner's 'auto' strategy against every single
+    engine over every data generator in this module.
+    
+    Engines that do not apply to a distribution record float('inf'), as do
+    the Lomuto-partitioning engines on duplicate-heavy inputs, where they
+    degrade towards quadratic time.
+    
+    Args:
+        sizes: List of input sizes to test
+        distributions: Dictionary mapping distribution names to generator
+            functions (defaults to every generator in this module)
+        k_ratio: Ratio that determines k (k = ratio * n)
+        iterations: Number of iterations per benchmark
+        
+    Returns:
+        Dictionary mapping distribution name to {engine: [time per size]}
+    """
+    try:
+        from .selection_planner import SelectionPlanner, STRATEGIES, DUPLICATE_RATIO
+    except ImportError:
+        from src.selection_planner import SelectionPlanner, STRATEGIES, DUPLICATE_RATIO
+    
+    if distributions is None:
+        distributions = {
+            'random': lambda n: generate_random_array(n, seed=42),
+            'sorted': generate_sorted_array,
+            'reverse_sorted': generate_reverse_sorted_array,
+            'nearly_sorted': lambda n: generate_nearly_sorted_array(n, seed=42),
+            'duplicate_heavy': lambda n: generate_duplicate_heavy_array(n, seed=42)
+        }
+    
+    planner = SelectionPlanner()
+    results = {dist: {engine: [] for engine in STRATEGIES} for dist in distributions}
+    
+    for size in sizes:
+        for dist_name, dist_func in distributions.items():
+            arr = dist_func(size)
+            k = max(1, int(k_ratio * size))
+            duplicates = planner.plan(arr, [k]).signals.get('duplicates', 0.0)
+            for engine in STRATEGIES:
+                if engine in ('randomized', 'deterministic') and duplicates >= DUPLICATE_RATIO:
+                    results[dist_name][engine].append(float('inf'))
+                    continue
+                try:
+                    elapsed = _average_time(
+                        lambda: planner.select(arr, k, strategy=engine, seed=42),
+                        iterations
+                    )
+                    results[dist_name][engine].append(elapsed)
+                except Exception:
+                    results[dist_name][engine].append(float('inf'))
+    
+    return results
+
+
+def compare_matrix_median_vs_row_loop(
+    rows: int,
+    cols: int,
+    iterations: int = 3,
+    seed: int = None
+) -> Dict[str, float]:
+    """
+    Compare Matrix row/column medians and the batch API against calling
+    find_median on one extracted row or column at a time.
+    
+    Args:
+        rows: Number of matrix rows
+        cols: Number of matrix columns
+        iterations: Number of iterations to average
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with average times in seconds
+    """
+    try:
+        from .data_structures import Matrix
+        from .deterministic_algorithm import find_median
+        from .selection_planner import batch_select
+    except ImportError:
+        from src.data_structures import Matrix
+        from src.deterministic_algorithm import find_median
+        from src.selection_planner import batch_select
+    
+    if seed is not None:
+        np.random.seed(seed)
+    values = np.random.random((rows, cols)).tolist()
+    matrix = Matrix(rows, cols)
+    for i, row in enumerate(values):
+        for j, value in enumerate(row):
+            matrix[i, j] = value
+    
+    def row_loop():
+        return [find_median([matrix[i, j] for j in range(cols)]) for i in range(rows)]
+    
+    def column_loop():
+        return [find_median([matrix[i, j] for i in range(rows)]) for j in range(cols)]
+    
+    return {
+        'row_median': _average_time(lambda: matrix.median(axis=1), iterations),
+        'row_loop': _average_time(row_loop, iterations),
+        'column_median': _average_time(lambda: matrix.median(axis=0), iterations),
+        'column_loop': _average_time(column_loop, iterations),
+        'batch_select': _average_time(lambda: batch_select(values, (cols + 1) // 2), iterations)
+    }
+
+
+def compare_matrix_storage(rows: int, cols: int, iterations: int = 3) -> Dict[str, float]:
+    """
+    Compare Matrix's flat strided storage against a list of row lists.
+    
+    Measures the bytes allocated to build each layout, the time to read every
+    cell, and the time to extract a column, a transpose and a submatrix (a
+    copy for nested lists, an O(1) view plus a copy out of it for Matrix).
+    
+    Args:
+        rows: Number of matrix rows
+        cols: Number of matrix columns
+        iterations: Number of iterations to average
+        
+    Returns:
+        Dictionary with allocated bytes and average times in seconds
+    """
+    try:
+        from .data_structures import Matrix
+    except ImportError:
+        from src.data_structures import Matrix
+    
+    values = np.random.random((rows, cols)).tolist()
+    
+    def allocated(build):
+        tracemalloc.start()
+        built = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del built
+        return size
+    
+    nested = [list(row) for row in values]
+    matrix = Matrix.from_rows(values)
+    half_rows, half_cols = rows // 2, cols // 2
+    
+    return {
+        'nested_bytes': allocated(lambda: [[0.0] * cols for _ in range(rows)]),
+        'flat_bytes': allocated(lambda: Matrix(rows, cols, 0.0)),
+        'nested_access': _average_time(
+            lambda: [nested[i][j] for i in range(rows) for j in range(cols)], iterations
+        ),
+        'flat_access': _average_time(
+            lambda: [matrix[i, j] for i in range(rows) for j in range(cols)], iterations
+        ),
+        'nested_column': _average_time(lambda: [row[half_cols] for row in nested], iterations),
+        'flat_column': _average_time(lambda: matrix.column(half_cols).ravel(), iterations),
+        'nested_transpose': _average_time(lambda: [list(column) for column in zip(*nested)], iterations),
+        'flat_transpose': _average_time(lambda: matrix.T.tolist(), iterations),
+        'flat_transpose_view': _average_time(lambda: matrix.T, iterations),
+        'nested_submatrix': _average_time(
+            lambda: [row[:half_cols] for row in nested[:half_rows]], iterations
+        ),
+        'flat_submatrix_view': _average_time(
+            lambda: matrix.submatrix(0, half_rows, 0, half_cols), iterations
+        )
+    }
+
+
+def compare_matrix_arithmetic(n: int, iterations: int = 3, seed: int = None) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the NumPy and pure-Python paths of Matrix arithmetic on an n x n
+    float matrix.
+    
+    'typed' stores the cells in an array.array ('d'), so NumPy views them in
+    place; 'list' is the default list storage (NumPy for @ only); 'python'
+    holds the same values as float-subclass cells; the NumPy paths only take
+    exact int/float cells, so it runs cell by cell like any object matrix.
+    
+    Args:
+        n: Matrix side length
+        iterations: Number of iterations to average
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary mapping each operation (add, scale, matmul, transpose_matmul,
+        sum, mean) to average times in seconds for every path
+    """
+    try:
+        from .data_structures import Matrix
+    except ImportError:
+        from src.data_structures import Matrix
+    
+    rng = np.random.default_rng(seed)
+    values = rng.random(n * n).tolist()
+    
+    class Cell(float):
+        __slots__ = ()
+    
+    paths = {
+        'typed': Matrix.from_iterable(values, n, n, typecode='d'),
+        'list': Matrix.from_iterable(values, n, n),
+        'python': Matrix.from_iterable(map(Cell, values), n, n)
+    }
+    
+    operations = {
+        'add': lambda m: m + m,
+        'scale': lambda m: m * 2.5,
+        'matmul': lambda m: m @ m,
+        'transpose_matmul': lambda m: m.T @ m,
+        'sum': lambda m: m.sum(axis=0),
+        'mean': lambda m: m.mean()
+    }
+    
+    return {
+        name: {
+            path: _average_time(lambda: operation(matrix), iterations)
+            for path, matrix in paths.items()
+        }
+        for name, operation in operations.items()
+    }
+
+
+def compare_sparse_vs_dense(n: int, density: float = 0.001, iterations: int = 3, seed: int = None) -> Dict[str, float]:
+    """
+    Compare SparseMatrix against a dense Matrix of the same n x n float data.
+    
+    Args:
+        n: Matrix side length
+        density: Fraction of nonzero cells
+        iterations: Number of iterations to average
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with average times in seconds for building, matrix-vector
+        and matrix-matrix products, and the memory_usage() byte counts
+    """
+    try:
+        from .sparse_matrix import SparseMatrix
+    except ImportError:
+        from src.sparse_matrix import SparseMatrix
+    
+    rng = np.random.default_rng(seed)
+    nnz = max(1, int(n * n * density))
+    row_indices = rng.integers(0, n, nnz).tolist()
+    col_indices = rng.integers(0, n, nnz).tolist()
+    values = rng.random(nnz).tolist()
+    vector = rng.random(n).tolist()
+    
+    def build():
+        return SparseMatrix.from_coo(n, n, row_indices, col_indices, values)
+    
+    sparse = build()
+    dense = sparse.to_dense()
+    dense_rows = dense.tolist()
+    
+    return {
+        'sparse_build': _average_time(build, iterations),
+        'sparse_matvec': _average_time(lambda: sparse @ vector, iterations),
+        'dense_matvec': _average_time(
+            lambda: [sum(map(operator.mul, row, vector)) for row in dense_rows], iterations
+        ),
+        'sparse_matmul': _average_time(lambda: sparse @ sparse, iterations),
+        'dense_matmul': _average_time(lambda: dense @ dense, iterations),
+        **{f'{name}_bytes': size for name, size in sparse.memory_usage().items()}
+    }
+
+
+def compare_parallel_matmul(
+    n: int,
+    workers: Tuple[int, ...] = (1, 2, 4),
+    block_size: int = 32,
+    seed: int = None
+) -> Dict[str, float]:
+    """
+    Compare multiplying two n x n Fraction matrices with a naive triple loop
+    against the tiled kernel in one process and spread over worker processes.
+    
+    Args:
+        n: Matrix side length
+        workers: Worker counts to time parallel_matmul with
+        block_size: Side length of the output tiles
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with seconds for 'naive', 'tiled' and 'workers_<w>' for
+        every worker count, plus 'speedup_<w>' over the naive loop
+    """
+    from fractions import Fraction
+    try:
+        from .data_structures import Matrix
+        from .matrix_parallel import parallel_matmul, tiled_matmul
+    except ImportError:
+        from src.data_structures import Matrix
+        from src.matrix_parallel import parallel_matmul, tiled_matmul
+    
+    rng = np.random.default_rng(seed)
+    numerators = rng.integers(1, 100, 2 * n * n).tolist()
+    denominators = rng.integers(1, 100, 2 * n * n).tolist()
+    cells = list(map(Fraction, numerators, denominators))
+    a = Matrix.from_iterable(cells[:n * n], n, n)
+    b = Matrix.from_iterable(cells[n * n:], n, n)
+    
+    def naive():
+        result = Matrix(n, n)
+        for i in range(n):
+            for j in range(n):
+                total = 0
+                for k in range(n):
+                    total += a[i, k] * b[k, j]
+                result[i, j] = total
+        return result
+    
+    results = {
+        'naive': _average_time(naive, 1),
+        'tiled': _average_time(lambda: tiled_matmul(a, b, block_size=block_size), 1)
+    }
+    for count in workers:
+        results[f'workers_{count}'] = _average_time(
+            lambda: parallel_matmul(a, b, block_size=block_size, workers=count), 1
+        )
+        results[f'speedup_{count}'] = results['naive'] / results[f'workers_{count}']
+    return results
+
+
+def compare_memmap_column_median(rows: int, cols: int, seed: int = None) -> Dict[str, float]:
+    """
+    Compare taking one column median of a float64 matrix stored in a file
+    through Matrix.open_memmap against loading the whole file into a Matrix.
+    
+    Args:
+        rows: Number of matrix rows
+        cols: Number of matrix columns
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with seconds and peak Python heap bytes (tracemalloc) for
+        'memmap' and 'loaded'; mapped file pages live in the OS page cache
+        and are not counted
+    """
+    import os
+    import tempfile
+    try:
+        from .data_structures import Matrix
+    except ImportError:
+        from src.data_structures import Matrix
+    
+    rng = np.random.default_rng(seed)
+    column = cols // 2
+    handle, path = tempfile.mkstemp(suffix='.bin')
+    os.close(handle)
+    try:
+        rng.random((rows, cols)).tofile(path)
+        
+        def measure(func):
+            tracemalloc.start()
+            start = time.perf_counter()
+            value = func()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return elapsed, peak, value
+        
+        def mapped():
+            matrix = Matrix.open_memmap(path, rows, cols, 'd', mode='r')
+            try:
+                return matrix.column(column).median()
+            finally:
+                matrix.close()
+        
+        def loaded():
+            matrix = Matrix.from_numpy(np.fromfile(path).reshape(rows, cols))
+            return matrix.column(column).median()
+        
+        memmap_time, memmap_peak, memmap_value = measure(mapped)
+        loaded_time, loaded_peak, loaded_value = measure(loaded)
+        assert memmap_value == loaded_value
+    finally:
+        os.remove(path)
+    
+    return {
+        'memmap': memmap_time,
+        'loaded': loaded_time,
+        'memmap_peak_bytes': memmap_peak,
+        'loaded_peak_bytes': loaded_peak
+    }
+
+
+def benchmark_median_filter(
+    rows: int,
+    cols: int,
+    sizes: List[int] = None,
+    iterations: int = 1,
+    include_naive: bool = True,
+    seed: int = None
+) -> Dict[int, Dict[str, float]]:
+    """
+    Measure median filter throughput in pixels per second.
+    
+    Compares the histogram window (8-bit integer grid), the sorted window
+    (float grid) and, optionally, calling find_median on a fresh window list
+    for every pixel.
+    
+    Args:
+        rows: Number of grid rows
+        cols: Number of grid columns
+        sizes: Window side lengths to test (default 3, 9, 31)
+        iterations: Number of iterations to average
+        include_naive: Whether to time the per-pixel find_median baseline
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary mapping each window size to pixels/second per method
+    """
+    try:
+        from .deterministic_algorithm import find_median
+        from .rank_filter import median_filter
+    except ImportError:
+        from src.deterministic_algorithm import find_median
+        from src.rank_filter import median_filter
+    
+    if sizes is None:
+        sizes = [3, 9, 31]
+    if seed is not None:
+        np.random.seed(seed)
+    int_grid = np.random.randint(0, 256, size=(rows, cols)).tolist()
+    float_grid = np.random.random((rows, cols)).tolist()
+    pixels = rows * cols
+    
+    def naive(grid, size):
+        radius = size // 2
+        out = []
+        for i in range(rows):
+            window_rows = [grid[min(max(r, 0), rows - 1)] for r in range(i - radius, i + radius + 1)]
+            out.append([
+                find_median([row[min(max(c, 0), cols - 1)] for row in window_rows
+                             for c in range(j - radius, j + radius + 1)])
+                for j in range(cols)
+            ])
+        return out
+    
+    results = {}
+    for size in sizes:
+        results[size] = {
+            'histogram': pixels / _average_time(lambda: median_filter(int_grid, size), iterations),
+            'sorted_window': pixels / _average_time(lambda: median_filter(float_grid, size), iterations)
+        }
+        if include_naive:
+            results[size]['naive'] = pixels / _average_time(lambda: naive(int_grid, size), iterations)
+    
+    return results
+
+
+def benchmark_selection_server(
+    n: int,
+    queries: int = 200,
+    concurrency: int = 20,
+    seed: int = None
+) -> Dict[str, float]:
+    """
+    Compare a SelectionServer holding the dataset against shipping the whole
+    array with every request (JSON round trip plus randomized_select).
+    
+    The server is queried over a loopback socket with up to `concurrency`
+    queries in flight, so concurrent queries are coalesced into shared passes.
+    
+    Args:
+        n: Dataset size
+        queries: Number of k-th queries to answer
+        concurrency: Queries in flight at once against the server
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with seconds per query for both approaches, the server's
+        p50/p99 latency in milliseconds and its number of selection passes
+    """
+    try:
+        from .randomized_algorithm import randomized_select
+        from .selection_server import SelectionServer, SelectionClient
+    except ImportError:
+        from src.randomized_algorithm import randomized_select
+        from src.selection_server import SelectionServer, SelectionClient
+    
+    if seed is not None:
+        np.random.seed(seed)
+    data = np.random.randint(0, 10 * n, size=n).tolist()
+    ks = np.random.randint(1, n + 1, size=queries).tolist()
+    
+    start = time.perf_counter()
+    for k in ks:
+        randomized_select(json.loads(json.dumps(data)), k)
+    ship_time = (time.perf_counter() - start) / queries
+    
+    async def run_server():
+        async with SelectionServer() as server:
+            client = await SelectionClient.connect(port=server.port)
+            await client.upload('data', data)
+            start = time.perf_counter()
+            for i in range(0, queries, concurrency):
+                await asyncio.gather(*(client.kth('data', k) for k in ks[i:i + concurrency]))
+            elapsed = time.perf_counter() - start
+            stats = await client.call({'op': 'stats'})
+            await client.close()
+            return elapsed / queries, stats, server.batches
+    
+    server_time, stats, batches = asyncio.run(run_server())
+    return {
+        'ship_per_request': ship_time,
+        'server': server_time,
+        'server_p50_ms': stats['latency_ms']['p50'],
+        'server_p99_ms': stats['latency_ms']['p99'],
+        'server_batches': batches
+    }
+
+
 def benchmark_data_structure_operation(
     operation: Callable,
     iterations: int = 1000
@@ -167,14 +929,7 @@ def benchmark_data_structure_operation(
     Returns:
         Average time per operation in seconds
     """
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        operation()
-        end = time.perf_counter()
-        times.append(end - start)
-    
-    return sum(times) / len(times)
+    return _average_time(operation, iterations)
 
 
 def compare_stack_vs_list_push(n: int, iterations: int = 10) -> Dict[str, float]:
@@ -210,37 +965,641 @@ def compare_stack_vs_list_push(n: int, iterations: int = 10) -> Dict[str, float]
     }
 
 
+def compare_dynamic_array_bulk_edits(n: int, edits: int = 100, iterations: int = 3) -> Dict[str, float]:
+    """
+    Compare DynamicArray's slice-based edits against per-element shifting loops.
+    
+    The loop variants reproduce the earlier implementation: insert/delete move
+    one element per interpreter step, and extend/insert_many/delete_range are
+    spelled as repeated single-element calls.
+    
+    Args:
+        n: Number of elements in the array
+        edits: Number of mid-array edits (or bulk elements) per measurement
+        iterations: Number of iterations to average
+        
+    Returns:
+        Dictionary with average times in seconds
+    """
+    try:
+        from .data_structures import DynamicArray
+    except ImportError:
+        from src.data_structures import DynamicArray
+    
+    def loop_insert(arr, index, value):
+        if arr._size >= arr._capacity:
+            arr._resize()
+        for i in range(arr._size, index, -1):
+            arr._data[i] = arr._data[i - 1]
+        arr._data[index] = value
+        arr._size += 1
+    
+    def loop_delete(arr, index):
+        value = arr._data[index]
+        for i in range(index, arr._size - 1):
+            arr._data[i] = arr._data[i + 1]
+        arr._size -= 1
+        return value
+    
+    def filled():
+        arr = DynamicArray()
+        arr.extend(range(n))
+        return arr
+    
+    middle = n // 2
+    values = list(range(edits))
+    
+    def repeated_insert(arr):
+        for offset, value in enumerate(values):
+            loop_insert(arr, middle + offset, value)
+    
+    def repeated_delete(arr):
+        for _ in range(edits):
+            loop_delete(arr, middle)
+    
+    def append_loop(arr):
+        for value in values:
+            arr.append(value)
+    
+    edits_by_name = {
+        'insert_slice': lambda arr: [arr.insert(middle, v) for v in values],
+        'insert_loop': lambda arr: [loop_insert(arr, middle, v) for v in values],
+        'delete_slice': lambda arr: [arr.delete(middle) for _ in values],
+        'delete_loop': lambda arr: [loop_delete(arr, middle) for _ in values],
+        'insert_many': lambda arr: arr.insert_many(middle, values),
+        'insert_many_loop': repeated_insert,
+        'delete_range': lambda arr: arr.delete_range(middle, middle + edits),
+        'delete_range_loop': repeated_delete,
+        'extend': lambda arr: arr.extend(values),
+        'extend_loop': append_loop
+    }
+    return {
+        name: _average_time(edit, iterations, setup=filled)
+        for name, edit in edits_by_name.items()
+    }
+
+
+def compare_dynamic_array_dtypes(n: int, iterations: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Compare DynamicArray storage backends: boxed objects (dtype=None),
+    array.array ('q') and NumPy ('int64').
+    
+    Memory is the traced allocation retained after filling the array with n
+    freshly created integers, so the object backend pays for the int objects
+    as well as the pointer slots.
+    
+    Args:
+        n: Number of elements
+        iterations: Number of iterations to average
+        
+    Returns:
+        Dictionary mapping backend name to bytes_per_element and average
+        times (seconds) for append, extend, search (missing value) and sum
+    """
+    try:
+        from .data_structures import DynamicArray
+    except ImportError:
+        from src.data_structures import DynamicArray
+    
+    def fresh_values():
+        return (i * 7919 + 100000 for i in range(n))
+    
+    results = {}
+    for name, dtype in (('object', None), ('array', 'q'), ('numpy', 'int64')):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        arr = DynamicArray(dtype=dtype)
+        arr.extend(fresh_values())
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        
+        def append_all():
+            target = DynamicArray(dtype=dtype)
+            for value in range(n):
+                target.append(value)
+        
+        results[name] = {
+            'bytes_per_element': retained / n,
+            'append': _average_time(append_all, iterations),
+            'extend': _average_time(lambda: DynamicArray(dtype=dtype).extend(range(n)), iterations),
+            'search': _average_time(lambda: arr.search(-1), iterations),
+            'sum': _average_time(arr.sum, iterations)
+        }
+    
+    return results
+
+
+def compare_dynamic_array_growth_policies(
+    n: int,
+    policies: Dict[str, Dict[str, Any]] = None,
+    dtype: Any = 'q',
+    drain_to: float = 0.1
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare DynamicArray growth/shrink policies on a burst workload: append n
+    elements one at a time, then delete from the end in blocks until only
+    drain_to * n remain.
+    
+    Args:
+        n: Peak number of elements
+        policies: Mapping of policy name to DynamicArray keyword arguments
+            (default: doubling, 1.5x, doubling capped at 64Ki slots per step,
+            and doubling without shrinking)
+        dtype: Storage dtype passed to every array
+        drain_to: Fraction of n left after the drain phase
+        
+    Returns:
+        Dictionary mapping policy name to grow/drain times (seconds), growth
+        reallocations, peak traced memory (bytes), final capacity and the
+        bytes wasted on unused slots after the drain
+    """
+    try:
+        from .data_structures import DynamicArray
+    except ImportError:
+        from src.data_structures import DynamicArray
+    
+    if policies is None:
+        policies = {
+            'double': {},
+            'grow_1.5x': {'growth_factor': 1.5, 'shrink_threshold': 0.5},
+            'chunked': {'max_growth': 1 << 16},
+            'no_shrink': {'shrink_threshold': None}
+        }
+    keep = int(n * drain_to)
+    block = max(1, n // 100)
+    
+    results = {}
+    for name, options in policies.items():
+        arr = DynamicArray(dtype=dtype, **options)
+        tracemalloc.start()
+        start = time.perf_counter()
+        for value in range(n):
+            arr.append(value)
+        grow_time = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        growth_reallocations = arr.reallocations
+        
+        start = time.perf_counter()
+        while len(arr) > keep:
+            arr.delete_range(max(keep, len(arr) - block), len(arr))
+        drain_time = time.perf_counter() - start
+        
+        results[name] = {
+            'grow_time': grow_time,
+            'drain_time': drain_time,
+            'growth_reallocations': growth_reallocations,
+            'shrink_reallocations': arr.reallocations - growth_reallocations,
+            'peak_bytes': peak,
+            'final_capacity': arr.capacity,
+            'wasted_bytes': arr.wasted_bytes
+        }
+    
+    return results
+
+
+def compare_dynamic_array_iteration(n: int, iterations: int = 5) -> Dict[str, float]:
+    """
+    Compare iteration throughput (elements per second) of DynamicArray and
+    its slice views against a plain list.
+    
+    'indexed' is the bounds-checked __getitem__ loop that iteration used to
+    fall back to; the view rows iterate and sum the middle half of the array
+    without copying it.
+    
+    Args:
+        n: Number of elements
+        iterations: Number of iterations to average
+        
+    Returns:
+        Dictionary with elements per second for each access pattern
+    """
+    try:
+        from .data_structures import DynamicArray
+    except ImportError:
+        from src.data_structures import DynamicArray
+    
+    values = list(range(n))
+    boxed = DynamicArray()
+    boxed.extend(values)
+    typed = DynamicArray(dtype='q')
+    typed.extend(values)
+    
+    def consume(iterable):
+        for _ in iterable:
+            pass
+    
+    half = n // 2
+    quarter = n // 4
+    full_passes = {
+        'list': lambda: consume(values),
+        'dynamic_array': lambda: consume(boxed),
+        'dynamic_array_typed': lambda: consume(typed),
+        'indexed': lambda: consume(boxed[i] for i in range(n))
+    }
+    half_passes = {
+        'list_slice': lambda: consume(values[quarter:quarter + half]),
+        'view': lambda: consume(boxed[quarter:quarter + half]),
+        'list_slice_sum': lambda: sum(values[quarter:quarter + half]),
+        'view_sum': lambda: boxed[quarter:quarter + half].sum()
+    }
+    
+    results = {name: n / _average_time(run, iterations) for name, run in full_passes.items()}
+    results.update(
+        (name, half / _average_time(run, iterations)) for name, run in half_passes.items()
+    )
+    return results
+
+
+def compare_gap_buffer_vs_dynamic_array(
+    n: int,
+    edits: int = 10000,
+    locality: int = 8,
+    seed: int = None
+) -> Dict[str, float]:
+    """
+    Replay a cursor-local edit trace on a GapBuffer and a DynamicArray.
+    
+    The trace starts with n elements and a cursor in the middle. Each edit
+    moves the cursor by at most `locality` positions, then inserts at or
+    deletes at the cursor (the two are equally likely), like typing and
+    backspacing in an editor.
+    
+    Args:
+        n: Initial number of elements
+        edits: Number of edits in the trace
+        locality: Largest cursor jump between consecutive edits
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Dictionary with total trace times in seconds
+    """
+    try:
+        from .data_structures import DynamicArray, GapBuffer
+    except ImportError:
+        from src.data_structures import DynamicArray, GapBuffer
+    
+    rng = np.random.default_rng(seed)
+    trace = []
+    size, cursor = n, n // 2
+    for _ in range(edits):
+        cursor = min(max(cursor + int(rng.integers(-locality, locality + 1)), 0), size)
+        if size and cursor < size and rng.random() < 0.5:
+            trace.append(('delete', cursor))
+            size -= 1
+        else:
+            trace.append(('insert', cursor))
+            size += 1
+    
+    def filled(factory):
+        def setup():
+            container = factory()
+            container.extend(range(n))
+            return container
+        return setup
+    
+    def replay(container):
+        for op, index in trace:
+            if op == 'insert':
+                container.insert(index, index)
+            else:
+                container.delete(index)
+    
+    return {
+        'gap_buffer': _average_time(replay, 1, setup=filled(GapBuffer)),
+        'dynamic_array': _average_time(
+            replay, 1, setup=filled(partial(DynamicArray, shrink_threshold=None))
+        )
+    }
+
+
+def _sum_pickled(values: Any) -> Any:
+    """Sum an array shipped to a worker process by pickling."""
+    return sum(values)
+
+
+def _sum_shared(name: str) -> Any:
+    """Sum a SharedDynamicArray attached by name in a worker process."""
+    try:
+        from .shared_array import SharedDynamicArray
+    except ImportError:
+        from src.shared_array import SharedDynamicArray
+    
+    shared = SharedDynamicArray.attach(name)
+    try:
+        return shared.consistent_read(sum)
+    finally:
+        shared.close()
+
+
+def compare_shared_array_vs_pickle(n: int, workers: int = 4, iterations: int = 3) -> Dict[str, float]:
+    """
+    Compare fanning an array out to worker processes by pickling it with
+    every task against attaching the workers to a SharedDynamicArray by name.
+    
+    Each round sends one task per worker that sums the whole array, so the
+    pickled path copies n elements per worker while the shared path only
+    sends the segment name.
+    
+    Args:
+        n: Number of elements
+        workers: Number of worker processes (and tasks per round)
+        iterations: Number of rounds to average over
+        
+    Returns:
+        Dictionary with average seconds per round for both approaches
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    try:
+        from .shared_array import SharedDynamicArray
+    except ImportError:
+        from src.shared_array import SharedDynamicArray
+    
+    values = array.array('q', range(n))
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            SharedDynamicArray('q', initial_capacity=n) as shared:
+        shared.extend(values)
+        # Start the workers before timing
+        list(pool.map(_sum_pickled, [values[:1]] * workers))
+        
+        results['pickle'] = _average_time(
+            lambda: list(pool.map(_sum_pickled, [values] * workers)), iterations
+        )
+        results['shared_memory'] = _average_time(
+            lambda: list(pool.map(_sum_shared, [shared.name] * workers)), iterations
+        )
+    
+    return results
+
+
 def compare_queue_vs_list(n: int, iterations: int = 10) -> Dict[str, float]:
-    """Compare queue operations vs list operations."""
+    """
+    Compare queue operations vs list operations.
+    
+    Enqueue is timed against list.append, and draining the queue with
+    dequeue against list.pop(0) (O(n) per call) and collections.deque.popleft.
+    """
+    from collections import deque
     try:
         from .data_structures import Queue
     except ImportError:
         from src.data_structures import Queue
     
-    # Benchmark Queue enqueue
-    queue_times = []
-    for _ in range(iterations):
+    def filled_queue():
         queue = Queue()
-        start = time.perf_counter()
         for i in range(n):
             queue.enqueue(i)
-        end = time.perf_counter()
-        queue_times.append(end - start)
+        return queue
     
-    # Benchmark List append
-    list_times = []
-    for _ in range(iterations):
-        lst = []
-        start = time.perf_counter()
+    def enqueue_all(queue):
+        for i in range(n):
+            queue.enqueue(i)
+    
+    def append_all(lst):
         for i in range(n):
             lst.append(i)
-        end = time.perf_counter()
-        list_times.append(end - start)
+    
+    def dequeue_all(queue):
+        for _ in range(n):
+            queue.dequeue()
+    
+    def pop_front_all(lst):
+        for _ in range(n):
+            lst.pop(0)
+    
+    def popleft_all(dq):
+        for _ in range(n):
+            dq.popleft()
     
     return {
-        'queue_enqueue': sum(queue_times) / len(queue_times),
-        'list_append': sum(list_times) / len(list_times)
+        'queue_enqueue': _average_time(enqueue_all, iterations, setup=Queue),
+        'list_append': _average_time(append_all, iterations, setup=list),
+        'queue_dequeue': _average_time(dequeue_all, iterations, setup=filled_queue),
+        'list_pop_front': _average_time(pop_front_all, iterations, setup=lambda: list(range(n))),
+        'deque_popleft': _average_time(popleft_all, iterations, setup=lambda: deque(range(n)))
+    }
+
+
+def benchmark_bounded_queue_throughput(
+    n: int,
+    thread_counts: Tuple[int, ...] = (1, 2, 4, 8, 16),
+    maxsize: int = 1024,
+    batch_size: int = 64
+) -> Dict[int, Dict[str, float]]:
+    """
+    Measure items per second through a BoundedQueue shared by k producer and
+    k consumer threads, for each k in thread_counts.
+    
+    Every producer enqueues n // k items and every consumer dequeues as many.
+    'single' moves one item per lock acquisition, 'batch' moves up to
+    batch_size with enqueue_many/dequeue_many, and 'queue_module' is the
+    standard library queue.Queue with the same bound.
+    """
+    import queue
+    import threading
+    try:
+        from .data_structures import BoundedQueue
+    except ImportError:
+        from src.data_structures import BoundedQueue
+    
+    def single_producer(q, count):
+        for i in range(count):
+            q.enqueue(i)
+    
+    def single_consumer(q, count):
+        for _ in range(count):
+            q.dequeue()
+    
+    def batch_producer(q, count):
+        for start in range(0, count, batch_size):
+            q.enqueue_many(range(start, min(start + batch_size, count)))
+    
+    def batch_consumer(q, count):
+        while count:
+            count -= len(q.dequeue_many(min(batch_size, count)))
+    
+    def stdlib_producer(q, count):
+        for i in range(count):
+            q.put(i)
+    
+    def stdlib_consumer(q, count):
+        for _ in range(count):
+            q.get()
+    
+    def spawn(q, producer, consumer, k):
+        per_thread = n // k
+        threads = [threading.Thread(target=producer, args=(q, per_thread)) for _ in range(k)]
+        threads += [threading.Thread(target=consumer, args=(q, per_thread)) for _ in range(k)]
+        return threads
+    
+    def run(threads):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    cases = {
+        'single': (BoundedQueue, single_producer, single_consumer),
+        'batch': (BoundedQueue, batch_producer, batch_consumer),
+        'queue_module': (queue.Queue, stdlib_producer, stdlib_consumer)
+    }
+    
+    results = {}
+    for k in thread_counts:
+        results[k] = {
+            name: n // k * k / _average_time(
+                run, 1, setup=lambda: spawn(factory(maxsize), producer, consumer, k)
+            )
+            for name, (factory, producer, consumer) in cases.items()
+        }
+    return results
+
+
+def benchmark_async_queue_throughput(
+    n: int,
+    maxsize: int = 1024,
+    batch_size: int = 64
+) -> Dict[str, float]:
+    """
+    Measure items per second through one producer and one consumer coroutine.
+    
+    'async_queue' and 'async_stack' move single items with put/get,
+    'async_queue_batch' drains with get_many(batch_size), 'asyncio_queue' is
+    asyncio.Queue with the same bound and 'thread_wrapper' is the
+    run_in_executor approach: every enqueue/dequeue on a BoundedQueue is an
+    executor call on a two-thread pool. Each case runs in its own event loop.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    try:
+        from .data_structures import AsyncQueue, AsyncStack, BoundedQueue
+    except ImportError:
+        from src.data_structures import AsyncQueue, AsyncStack, BoundedQueue
+    
+    async def produce(put):
+        for i in range(n):
+            await put(i)
+    
+    async def consume(get):
+        for _ in range(n):
+            await get()
+    
+    async def consume_batches(get_many):
+        count = 0
+        while count < n:
+            count += len(await get_many(min(batch_size, n - count)))
+    
+    async def single(container):
+        await asyncio.gather(produce(container.put), consume(container.get))
+    
+    async def batched(queue):
+        await asyncio.gather(produce(queue.put), consume_batches(queue.get_many))
+    
+    async def thread_wrapper(wrapped):
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            async def put(value):
+                await loop.run_in_executor(pool, wrapped.enqueue, value)
+            
+            async def get():
+                return await loop.run_in_executor(pool, wrapped.dequeue)
+            
+            await asyncio.gather(produce(put), consume(get))
+    
+    cases = {
+        'async_queue': (single, AsyncQueue),
+        'async_stack': (single, AsyncStack),
+        'async_queue_batch': (batched, AsyncQueue),
+        'asyncio_queue': (single, asyncio.Queue),
+        'thread_wrapper': (thread_wrapper, BoundedQueue)
+    }
+    return {
+        name: n / _average_time(
+            lambda container: asyncio.run(pipeline(container)), 1, setup=partial(factory, maxsize)
+        )
+        for name, (pipeline, factory) in cases.items()
+    }
+
+
+def compare_priority_queues(n: int, iterations: int = 3, seed: int = None) -> Dict[str, float]:
+    """
+    Compare priority queue strategies on n random pushes followed by n pops.
+    
+    'sort_on_insert' appends and re-sorts a list on every push (pop takes the
+    front), 'heapq' uses the standard library functions, and 'd2'/'d4' are
+    PriorityQueue with those arities. 'heapify' bulk-loads the n values in
+    O(n). The 'decrease_key' entries push n entries, lower a random n/2 of
+    them and drain the queue: 'indexed_decrease_key' uses
+    IndexedPriorityQueue and 'heapq_lazy' pushes duplicates into heapq and
+    skips stale ones on pop.
+    """
+    import heapq
+    try:
+        from .data_structures import PriorityQueue, IndexedPriorityQueue
+    except ImportError:
+        from src.data_structures import PriorityQueue, IndexedPriorityQueue
+    
+    rng = np.random.default_rng(seed)
+    values = rng.random(n).tolist()
+    lowered = list(zip(rng.integers(0, n, size=n // 2).tolist(), (rng.random(n // 2) / 2).tolist()))
+    
+    def sort_on_insert():
+        lst = []
+        for value in values:
+            lst.append(value)
+            lst.sort()
+        for _ in range(n):
+            lst.pop(0)
+    
+    def with_heapq():
+        heap = []
+        for value in values:
+            heapq.heappush(heap, value)
+        for _ in range(n):
+            heapq.heappop(heap)
+    
+    def with_priority_queue(d):
+        def run():
+            heap = PriorityQueue(d=d)
+            for value in values:
+                heap.push(value)
+            for _ in range(n):
+                heap.pop()
+        return run
+    
+    def indexed():
+        queue = IndexedPriorityQueue()
+        handles = [queue.push(i, value) for i, value in enumerate(values)]
+        for i, priority in lowered:
+            if priority < queue.priority(handles[i]):
+                queue.decrease_key(handles[i], priority)
+        while queue:
+            queue.pop()
+    
+    def heapq_lazy():
+        best = list(values)
+        heap = [(value, i) for i, value in enumerate(values)]
+        heapq.heapify(heap)
+        for i, priority in lowered:
+            if priority < best[i]:
+                best[i] = priority
+                heapq.heappush(heap, (priority, i))
+        while heap:
+            priority, i = heapq.heappop(heap)
+            if priority != best[i]:
+                continue
+    
+    runs = {
+        'heapq': with_heapq,
+        'd2': with_priority_queue(2),
+        'd4': with_priority_queue(4),
+        'heapify': lambda: PriorityQueue(values, d=4),
+        'indexed_decrease_key': indexed,
+        'heapq_lazy': heapq_lazy
     }
+    if n <= 20_000:  # Re-sorting on every push is quadratic
+        runs['sort_on_insert'] = sort_on_insert
+    return {name: _average_time(run, iterations) for name, run in runs.items()}
 
 
 def compare_linked_list_vs_list(n: int, iterations: int = 10) -> Dict[str, float]:
@@ -0,0 +1,226 @@
+"""
+Counting and Radix Selection for Integer Keys
+
+This module implements non-comparison selection engines for integer data. A
+histogram over the value range finds the k-th smallest element in O(n + range)
+time, and byte-wise radix passes handle 32/64-bit integers whose range is too
+wide for a histogram. The comparison-based selection algorithms switch to the
+histogram engine automatically when they detect a narrow integer range.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import math
+from collections import Counter
+from typing import Any, List, Optional, Tuple
+
+
+# Inputs shorter than this are not worth scanning for an integer range
+AUTO_COUNTING_MIN_SIZE = 64
+
+# A range is narrow when hi - lo < AUTO_COUNTING_RANGE_FACTOR * n
+AUTO_COUNTING_RANGE_FACTOR = 4
+
+_INT_TYPECODES = frozenset('bBhHiIlLqQ')
+
+
+def int_range(arr: Any) -> Optional[Tuple[int, int]]:
+    """
+    Return (min, max) if every element of arr is a plain int, otherwise None.
+    
+    array.array inputs with an integer typecode are recognised without a type
+    scan; other sequences are checked with a C-level pass over the element types.
+    """
+    if len(arr) == 0:
+        return None
+    if isinstance(arr, array.array):
+        if arr.typecode not in _INT_TYPECODES:
+            return None
+    elif isinstance(arr, memoryview):
+        if arr.format.lstrip('@') not in _INT_TYPECODES:
+            return None
+    elif set(map(type, arr)) != {int}:
+        return None
+    return min(arr), max(arr)
+
+
+def narrow_int_range(arr: Any) -> Optional[Tuple[int, int]]:
+    """
+    Return (min, max) if arr holds integers in a range narrow enough for
+    counting_select to beat partitioning, otherwise None.
+    """
+    n = len(arr)
+    if n < AUTO_COUNTING_MIN_SIZE:
+        return None
+    bounds = int_range(arr)
+    if bounds is None or bounds[1] - bounds[0] >= AUTO_COUNTING_RANGE_FACTOR * n:
+        return None
+    return bounds
+
+
+def counting_select(arr: Any, k: int, lo: Optional[int] = None, hi: Optional[int] = None) -> int:
+    """
+    Find the k-th smallest integer with a histogram in O(n + range) time.
+    
+    Args:
+        arr: Sequence or buffer of integers
+        k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
+        lo: Optional known minimum of arr (computed if omitted)
+        hi: Optional known maximum of arr (computed if omitted)
+        
+    Returns:
+        The k-th smallest element in the array
+        
+    Raises:
+        ValueError: If k is out of range [1, len(arr)]
+        IndexError: If array is empty
+        
+    Examples:
+        >>> counting_select([404, 200, 200, 500, 301], 3)
+        301
+    """
+    n = len(arr)
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
+    if k < 1 or k > n:
+        raise ValueError(f"k must be between 1 and {n}, got {k}")
+    
+    counts = Counter(arr)
+    if lo is None or hi is None:
+        lo, hi = min(counts), max(counts)
+    
+    # Walk the whole range only when it is cheaper than sorting the distinct keys
+    distinct = len(counts)
+    if hi - lo + 1 <= distinct * max(1, math.log2(distinct)):
+        values = range(lo, hi + 1)
+    else:
+        values = sorted(counts)
+    
+    seen = 0
+    for value in values:
+        seen += counts.get(value, 0)
+        if seen >= k:
+            return value
+    raise AssertionError("histogram does not account for every element")
+
+
+def counting_select_many(arr: Any, ks: List[int]) -> List[int]:
+    """
+    Find several order statistics of integers with a single histogram.
+    
+    Args:
+        arr: Sequence or buffer of integers
+        ks: Ranks to find (1-indexed, in any order, duplicates allowed)
+        
+    Returns:
+        List of elements, in the same order as ks
+        
+    Raises:
+        ValueError: If any k is out of range [1, len(arr)]
+        IndexError: If array is empty
+        
+    Examples:
+        >>> counting_select_many([5, 1, 3, 3], [4, 1, 2])
+        [5, 1, 3]
+    """
+    n = len(arr)
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
+    for k in ks:
+        if k < 1 or k > n:
+            raise ValueError(f"k must be between 1 and {n}, got {k}")
+    
+    return select_from_counts(Counter(arr), ks)
+
+
+def select_from_counts(counts: Counter, ks: List[int]) -> List[Any]:
+    """
+    Answer order-statistic queries from a prebuilt histogram.
+    
+    Args:
+        counts: Counter mapping each value to its number of occurrences
+        ks: Ranks to find (1-indexed, in any order, duplicates allowed);
+            callers validate them against the total count
+            
+    Returns:
+        List of values, in the same order as ks
+    """
+    wanted = sorted(set(ks))
+    found = {}
+    seen = 0
+    i = 0
+    for value in sorted(counts):
+        seen += counts[value]
+        while i < len(wanted) and wanted[i] <= seen:
+            found[wanted[i]] = value
+            i += 1
+        if i == len(wanted):
+            break
+    return [found[k] for k in ks]
+
+
+def radix_select(arr: Any, k: int, bits: int = 64) -> int:
+    """
+    Find the k-th smallest signed integer with byte-wise MSD radix passes.
+    
+    Each pass histograms one byte of the candidates' offset from a common
+    prefix (most significant first), keeps only the bucket that holds rank k
+    and moves to the next byte. Leading bytes shared by every value are
+    skipped and at most bits/8 passes are made. The first pass reads arr in
+    place, and only the surviving bucket is ever copied, so each later pass
+    touches just the remaining candidates.
+    
+    Args:
+        arr: Sequence or buffer of integers that fit in a signed bits-wide word
+        k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
+        bits: Word size, 32 or 64
+        
+    Returns:
+        The k-th smallest element in the array
+        
+    Raises:
+        ValueError: If k is out of range, bits is not 32 or 64, or a value
+            does not fit in the word size
+        IndexError: If array is empty
+        
+    Examples:
+        >>> radix_select([-5, 3, 2**40, 0], 2)
+        0
+    """
+    if bits not in (32, 64):
+        raise ValueError(f"bits must be 32 or 64, got {bits}")
+    n = len(arr)
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
+    if k < 1 or k > n:
+        raise ValueError(f"k must be between 1 and {n}, got {k}")
+    
+    bias = 1 << (bits - 1)
+    lo, hi = min(arr), max(arr)
+    if lo < -bias or hi >= bias:
+        raise ValueError(f"values must fit in a signed {bits}-bit integer")
+    if lo == hi:
+        return lo
+    
+    # Bytes above the highest one where min and max differ are shared by all
+    # values; base is lo with every byte from top_shift down cleared (in the
+    # unsigned view), so each candidate lies in [base, base + 2**(shift + 8))
+    top_shift = ((((lo + bias) ^ (hi + bias)).bit_length() - 1) // 8) * 8
+    base = lo - ((lo + bias) & ((1 << (top_shift + 8)) - 1))
+    candidates = arr
+    for shift in range(top_shift, -8, -8):
+        buckets = Counter((value - base) >> shift for value in candidates)
+        seen = 0
+        for bucket in sorted(buckets):
+            if seen + buckets[bucket] >= k:
+                break
+            seen += buckets[bucket]
+        k -= seen
+        base += bucket << shift
+        if buckets[bucket] != len(candidates):
+            low, high = base, base + (1 << shift)
+            candidates = [value for value in candidates if low <= value < high]
+    
+    return base
@@ -8,7 +8,25 @@ Author: Carlos Gutierrez
 Course: MSCS532 - Data Structures and Algorithms
 """
 
-from typing import Optional, Any, List
+import array
+import asyncio
+import heapq
+import math
+import mmap
+import operator
+import os
+import struct
+import threading
+import time
+import weakref
+from collections import deque
+from itertools import chain, islice, repeat
+from typing import Optional, Any, Iterable, Iterator, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; typed arrays fall back to array.array
+    np = None
 
 
 # ============================================================================
@@ -19,35 +37,104 @@ class DynamicArray:
     """
     A dynamic array implementation with basic operations.
     
+    By default elements are stored as boxed objects in a list. Passing a
+    dtype stores them unboxed instead: an array.array typecode ('q', 'd', ...)
+    selects array.array storage and any other NumPy dtype ('int64',
+    np.float32, ...) a NumPy buffer, with sum/min/max and search vectorized.
+    
     Time Complexity:
         - Access: O(1)
         - Insertion at end: O(1) amortized
         - Insertion at index: O(n)
         - Deletion: O(n)
+        - Bulk extend/insert_many/delete_range: O(n + m), one reallocation
         - Search: O(n)
+        
+    Capacity grows by growth_factor (optionally capped at max_growth slots per
+    step) and shrinks once the load factor falls to shrink_threshold.
     """
     
-    def __init__(self, initial_capacity: int = 10):
-        """Initialize an empty dynamic array."""
+    def __init__(
+        self,
+        initial_capacity: int = 10,
+        dtype: Any = None,
+        growth_factor: float = 2.0,
+        max_growth: Optional[int] = None,
+        shrink_threshold: Optional[float] = 0.25
+    ):
+        """
+        Initialize an empty dynamic array.
+        
+        Args:
+            initial_capacity: Number of slots allocated up front; shrinking
+                never goes below it
+            dtype: None for boxed objects, an array.array typecode, or a NumPy
+                dtype (mapped to the matching typecode when NumPy is missing)
+            growth_factor: Capacity multiplier when the array is full (> 1)
+            max_growth: Optional cap on the slots added by one growth step,
+                turning geometric growth into fixed chunks for huge arrays
+            shrink_threshold: Shrink once the load factor drops to this
+                fraction (None disables shrinking); must be below
+                1 / growth_factor so a shrink is never followed by a growth
+                
+        Raises:
+            ValueError: If the growth or shrink parameters are inconsistent
+            TypeError: If dtype is not a supported typecode or NumPy dtype
+        """
+        if growth_factor <= 1:
+            raise ValueError(f"growth_factor must be greater than 1, got {growth_factor}")
+        if max_growth is not None and max_growth < 1:
+            raise ValueError(f"max_growth must be positive, got {max_growth}")
+        if shrink_threshold is not None and not 0 < shrink_threshold * growth_factor < 1:
+            raise ValueError(
+                f"shrink_threshold must be between 0 and 1/growth_factor, got {shrink_threshold}"
+            )
+        self.dtype, self._numpy = _storage_dtype(dtype)
+        self.growth_factor = growth_factor
+        self.max_growth = max_growth
+        self.shrink_threshold = shrink_threshold
+        self.reallocations = 0
+        self._views = {}
+        self._min_capacity = initial_capacity
         self._capacity = initial_capacity
         self._size = 0
-        self._data = [None] * initial_capacity
+        self._data = self._allocate(initial_capacity)
     
     def __len__(self) -> int:
         """Return the number of elements in the array."""
         return self._size
     
-    def __getitem__(self, index: int) -> Any:
-        """Get element at index."""
-        if index < 0 or index >= self._size:
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Get element at index (negative indices count from the end). A slice
+        returns a DynamicArrayView sharing this array's storage. O(1).
+        """
+        if isinstance(index, slice):
+            return DynamicArrayView(self, range(self._size)[index])
+        position = index + self._size if index < 0 else index
+        if position < 0 or position >= self._size:
             raise IndexError(f"Index {index} out of range")
-        return self._data[index]
+        value = self._data[position]
+        return value.item() if self._numpy else value
     
     def __setitem__(self, index: int, value: Any) -> None:
-        """Set element at index."""
-        if index < 0 or index >= self._size:
+        """Set element at index (negative indices count from the end)."""
+        position = index + self._size if index < 0 else index
+        if position < 0 or position >= self._size:
             raise IndexError(f"Index {index} out of range")
-        self._data[index] = value
+        if self._views:
+            self._detach_views()
+        self._data[position] = value
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the elements without bounds-checked indexing. O(n)."""
+        if self._numpy:
+            return iter(self._data[:self._size].tolist())
+        return islice(self._data, self._size)
+    
+    def __contains__(self, value: Any) -> bool:
+        """Check membership with the storage's C-level search. O(n)."""
+        return self.search(value) != -1
     
     def append(self, value: Any) -> None:
         """Append element to the end of the array. O(1) amortized."""
@@ -57,88 +144,1137 @@ class DynamicArray:
         self._size += 1
     
     def insert(self, index: int, value: Any) -> None:
-        """Insert element at index. O(n)."""
+        """Insert element at index. O(n), shifted with one slice assignment."""
         if index < 0 or index > self._size:
             raise IndexError(f"Index {index} out of range")
         
+        if self._views:
+            self._detach_views()
         if self._size >= self._capacity:
             self._resize()
         
         # Shift elements to the right
-        for i in range(self._size, index, -1):
-            self._data[i] = self._data[i - 1]
+        self._data[index + 1:self._size + 1] = self._data[index:self._size]
         
         self._data[index] = value
         self._size += 1
     
     def delete(self, index: int) -> Any:
-        """Delete element at index and return it. O(n)."""
+        """Delete element at index and return it. O(n), shifted with one slice assignment."""
         if index < 0 or index >= self._size:
             raise IndexError(f"Index {index} out of range")
+        if self._views:
+            self._detach_views()
         
         value = self._data[index]
+        if self._numpy:
+            value = value.item()
         
-        # Shift elements to the left
-        for i in range(index, self._size - 1):
-            self._data[i] = self._data[i + 1]
+        # Shift elements to the left and release the vacated slot
+        self._data[index:self._size - 1] = self._data[index + 1:self._size]
+        self._release(self._size - 1, self._size)
         
         self._size -= 1
+        self._shrink_if_sparse()
         return value
     
+    def extend(self, values) -> None:
+        """Append every element of an iterable. O(m) amortized, at most one reallocation."""
+        values = self._coerce(values)
+        m = len(values)
+        if self._size + m > self._capacity:
+            self._resize(self._size + m)
+        self._data[self._size:self._size + m] = values
+        self._size += m
+    
+    def insert_many(self, index: int, values) -> None:
+        """Insert every element of an iterable starting at index. O(n + m), at most one reallocation."""
+        if index < 0 or index > self._size:
+            raise IndexError(f"Index {index} out of range")
+        if self._views:
+            self._detach_views()
+        values = self._coerce(values)
+        m = len(values)
+        if self._size + m > self._capacity:
+            self._resize(self._size + m)
+        
+        self._data[index + m:self._size + m] = self._data[index:self._size]
+        self._data[index:index + m] = values
+        self._size += m
+    
+    def delete_range(self, start: int, stop: int) -> List[Any]:
+        """Delete the elements in [start, stop) and return them. O(n)."""
+        if start < 0 or stop > self._size or start > stop:
+            raise IndexError(f"Range [{start}, {stop}) out of range")
+        
+        if self._views:
+            self._detach_views()
+        m = stop - start
+        removed = self._data[start:stop]
+        if self.dtype is not None:
+            # NumPy slices are views, so convert before the shift overwrites them
+            removed = removed.tolist()
+        self._data[start:self._size - m] = self._data[stop:self._size]
+        self._release(self._size - m, self._size)
+        self._size -= m
+        self._shrink_if_sparse()
+        return removed
+    
+    def clear(self) -> None:
+        """Remove every element, keeping the current capacity. O(n)."""
+        if self._views:
+            self._detach_views()
+        self._release(0, self._size)
+        self._size = 0
+    
+    def reserve(self, capacity: int) -> None:
+        """Grow the capacity to at least capacity slots in one reallocation."""
+        if capacity > self._capacity:
+            self._reallocate(capacity)
+    
+    def shrink_to_fit(self) -> None:
+        """Release every unused slot, trimming list/array.array storage in place."""
+        if self._capacity > self._size:
+            self._reallocate(self._size)
+    
+    @property
+    def capacity(self) -> int:
+        """Number of allocated slots."""
+        return self._capacity
+    
+    @property
+    def wasted_bytes(self) -> int:
+        """Bytes held by allocated but unused slots."""
+        return (self._capacity - self._size) * self._slot_size()
+    
+    def search(self, value: Any) -> int:
+        """Search for value and return its index, or -1 if not found. O(n), in C."""
+        if self._numpy:
+            matches = self._data[:self._size] == value
+            if not isinstance(matches, np.ndarray) or not matches.any():
+                return -1
+            return int(matches.argmax())
+        try:
+            return self._data.index(value, 0, self._size)
+        except (ValueError, TypeError):
+            return -1
+    
+    def sum(self) -> Any:
+        """Return the sum of the elements (0 when empty). O(n)."""
+        if self._numpy:
+            return self._data[:self._size].sum().item()
+        return sum(islice(self._data, self._size))
+    
+    def min(self) -> Any:
+        """Return the smallest element. O(n)."""
+        return self._reduce(min, 'min')
+    
+    def max(self) -> Any:
+        """Return the largest element. O(n)."""
+        return self._reduce(max, 'max')
+    
+    def tolist(self) -> List[Any]:
+        """Return the elements as a list of Python objects."""
+        items = self._data[:self._size]
+        return items if self.dtype is None else items.tolist()
+    
+    def _reduce(self, builtin, method: str) -> Any:
+        """Apply min or max with the storage's fastest implementation."""
+        if self._size == 0:
+            raise ValueError(f"{method}() of empty DynamicArray")
+        if self._numpy:
+            return getattr(self._data[:self._size], method)().item()
+        return builtin(islice(self._data, self._size))
+    
+    def _allocate(self, capacity: int) -> Any:
+        """Return empty storage with the given number of slots."""
+        if self.dtype is None:
+            return [None] * capacity
+        if self._numpy:
+            return np.zeros(capacity, dtype=self.dtype)
+        return array.array(self.dtype, bytes(capacity * array.array(self.dtype).itemsize))
+    
+    def _coerce(self, values) -> Any:
+        """Convert values into a sized sequence that slice assignment accepts."""
+        if self.dtype is None:
+            return values if isinstance(values, (list, tuple)) else list(values)
+        if self._numpy:
+            if not isinstance(values, (np.ndarray, list, tuple)):
+                values = list(values)
+            return np.asarray(values, dtype=self.dtype)
+        return array.array(self.dtype, values)
+    
+    def _release(self, start: int, stop: int) -> None:
+        """Drop references held by vacated slots (object storage only)."""
+        if self.dtype is None:
+            self._data[start:stop] = [None] * (stop - start)
+    
+    def _resize(self, min_capacity: int = 0) -> None:
+        """Grow the capacity by one growth step, or to min_capacity if larger."""
+        growth = max(1, int(self._capacity * (self.growth_factor - 1)))
+        if self.max_growth is not None:
+            growth = min(growth, self.max_growth)
+        self._reallocate(max(self._capacity + growth, min_capacity))
+    
+    def _shrink_if_sparse(self) -> None:
+        """Shrink once the load factor falls to shrink_threshold (hysteresis)."""
+        if self.shrink_threshold is None or self._capacity <= self._min_capacity:
+            return
+        if self._size <= self._capacity * self.shrink_threshold:
+            self._reallocate(max(self._min_capacity, math.ceil(self._size * self.growth_factor)))
+    
+    def _reallocate(self, capacity: int) -> None:
+        """Move the elements into storage with exactly capacity slots."""
+        if capacity < self._capacity and not self._numpy:
+            del self._data[capacity:]
+        else:
+            data = self._allocate(capacity)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+        self._capacity = capacity
+        self.reallocations += 1
+    
+    def _detach_views(self) -> None:
+        """Give every live view its own copy before this array's contents change."""
+        for ref in list(self._views.values()):
+            view = ref()
+            if view is not None:
+                view._detach()
+        self._views.clear()
+    
+    def _register_view(self, view: 'DynamicArrayView') -> None:
+        """Track a view so mutations can detach it; dead views drop out automatically."""
+        key = id(view)
+        views = self._views
+        views[key] = weakref.ref(view, lambda _, key=key: views.pop(key, None))
+    
+    def _slot_size(self) -> int:
+        """Bytes per allocated slot (a pointer for object storage)."""
+        if self.dtype is None:
+            return struct.calcsize('P')
+        return self._data.itemsize
+    
+    def __str__(self) -> str:
+        """String representation of the array."""
+        return '[' + ', '.join(map(repr, self)) + ']'
+
+
+class DynamicArrayView:
+    """
+    Read-only window over a DynamicArray, created by slicing it.
+    
+    The view reads the parent's storage directly, so creating, iterating and
+    aggregating a window never copies it. Before the parent changes any
+    element the view copies its own window out (copy-on-write), so a view
+    always shows the values from the moment it was taken.
+    
+    Time Complexity:
+        - Creation and access: O(1)
+        - Iteration, search, sum/min/max: O(k) for a window of k elements
+    """
+    
+    def __init__(self, parent: DynamicArray, indices: range):
+        """Create a view of parent's elements at the given storage indices."""
+        self._data = parent._data
+        self._numpy = parent._numpy
+        self._indices = indices
+        parent._register_view(self)
+        self._parent = weakref.ref(parent)
+    
+    def __len__(self) -> int:
+        """Return the number of elements in the view."""
+        return len(self._indices)
+    
+    def __getitem__(self, index: Any) -> Any:
+        """Get element at index (negative allowed); a slice returns a sub-view."""
+        if isinstance(index, slice):
+            parent = self._parent() if self._parent is not None else None
+            if parent is None or parent._data is not self._data:
+                # Detached (or re-allocated) data is private, so the sub-view can share it freely
+                sub = object.__new__(DynamicArrayView)
+                sub._data, sub._numpy, sub._parent = self._data, self._numpy, None
+                sub._indices = self._indices[index]
+                return sub
+            return DynamicArrayView(parent, self._indices[index])
+        try:
+            position = self._indices[index]
+        except IndexError:
+            raise IndexError(f"Index {index} out of range") from None
+        value = self._data[position]
+        return value.item() if self._numpy else value
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the window without copying it. O(k)."""
+        r = self._indices
+        if self._numpy:
+            return iter(self._window().tolist())
+        if r.step > 0:
+            return islice(self._data, r.start, r.stop, r.step)
+        return map(self._data.__getitem__, r)
+    
+    def __contains__(self, value: Any) -> bool:
+        """Check membership. O(k)."""
+        if self._numpy:
+            matches = self._window() == value
+            return bool(matches.any()) if hasattr(matches, 'any') else False
+        return any(item == value for item in self)
+    
+    def sum(self) -> Any:
+        """Return the sum of the window (0 when empty). O(k)."""
+        if self._numpy:
+            return self._window().sum().item()
+        return sum(self)
+    
+    def min(self) -> Any:
+        """Return the smallest element of the window. O(k)."""
+        return self._reduce(min, 'min')
+    
+    def max(self) -> Any:
+        """Return the largest element of the window. O(k)."""
+        return self._reduce(max, 'max')
+    
+    def tolist(self) -> List[Any]:
+        """Return the window as a list of Python objects."""
+        window = self._window()
+        return window if isinstance(window, list) else window.tolist()
+    
+    def _reduce(self, builtin, method: str) -> Any:
+        """Apply min or max with the storage's fastest implementation."""
+        if not self._indices:
+            raise ValueError(f"{method}() of empty DynamicArrayView")
+        if self._numpy:
+            return getattr(self._window(), method)().item()
+        return builtin(self)
+    
+    def _window(self) -> Any:
+        """Return the window as a storage slice (a copy for list/array.array, a view for NumPy)."""
+        r = self._indices
+        stop = r.stop if r.stop >= 0 else None
+        return self._data[r.start:stop:r.step]
+    
+    def _detach(self) -> None:
+        """Copy the window into private storage (the parent is about to change)."""
+        window = self._window()
+        self._data = window.copy() if self._numpy else window
+        self._indices = range(len(window))
+        self._parent = None
+    
+    def __str__(self) -> str:
+        """String representation of the view."""
+        return '[' + ', '.join(map(repr, self)) + ']'
+
+
+
+class GapBuffer:
+    """
+    A dynamic array that keeps its free space as a gap at the cursor, for
+    edits that cluster around a moving position (text editors, reorder
+    buffers).
+    
+    Elements live in data[:gap_start] and data[gap_end:]; the gap between
+    them is where the next insertion goes. Editing at the cursor only touches
+    the gap edge, and moving the cursor slides the gap by copying just the
+    elements it passes over.
+    
+    Time Complexity:
+        - Access: O(1)
+        - Insert/delete at the cursor: O(1) amortized
+        - Move cursor: O(distance)
+        - Insert/delete at index: O(distance from the cursor)
+        - Search: O(n)
+    """
+    
+    def __init__(self, initial_capacity: int = 16):
+        """Initialize an empty gap buffer with the cursor at position 0."""
+        self._data = [None] * initial_capacity
+        self._gap_start = 0
+        self._gap_end = initial_capacity
+    
+    def __len__(self) -> int:
+        """Return the number of elements in the buffer."""
+        return len(self._data) - (self._gap_end - self._gap_start)
+    
+    @property
+    def cursor(self) -> int:
+        """Position where the next insert_at_cursor goes (the gap start)."""
+        return self._gap_start
+    
+    def __getitem__(self, index: int) -> Any:
+        """Get element at index (negative indices count from the end). O(1)."""
+        return self._data[self._position(index)]
+    
+    def __setitem__(self, index: int, value: Any) -> None:
+        """Set element at index (negative indices count from the end). O(1)."""
+        self._data[self._position(index)] = value
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the elements, skipping the gap. O(n)."""
+        return chain(islice(self._data, self._gap_start), islice(self._data, self._gap_end, None))
+    
+    def __contains__(self, value: Any) -> bool:
+        """Check membership. O(n)."""
+        return self.search(value) != -1
+    
+    def move_cursor(self, index: int) -> None:
+        """Move the cursor (and the gap) to index. O(distance)."""
+        if index < 0 or index > len(self):
+            raise IndexError(f"Index {index} out of range")
+        data = self._data
+        start, end = self._gap_start, self._gap_end
+        if index < start:
+            # Elements in [index, start) move to the back side of the gap
+            count = start - index
+            data[end - count:end] = data[index:start]
+            data[index:min(start, end - count)] = [None] * (min(start, end - count) - index)
+            self._gap_start, self._gap_end = index, end - count
+        elif index > start:
+            # Elements just after the gap move to the front side
+            count = index - start
+            data[start:index] = data[end:end + count]
+            vacated = max(end, index)
+            data[vacated:end + count] = [None] * (end + count - vacated)
+            self._gap_start, self._gap_end = index, end + count
+    
+    def insert_at_cursor(self, value: Any) -> None:
+        """Insert value at the cursor and advance past it. O(1) amortized."""
+        if self._gap_start == self._gap_end:
+            self._grow()
+        self._data[self._gap_start] = value
+        self._gap_start += 1
+    
+    def delete_before_cursor(self) -> Any:
+        """Remove and return the element before the cursor (backspace). O(1)."""
+        if self._gap_start == 0:
+            raise IndexError("No element before the cursor")
+        self._gap_start -= 1
+        value = self._data[self._gap_start]
+        self._data[self._gap_start] = None
+        return value
+    
+    def delete_at_cursor(self) -> Any:
+        """Remove and return the element after the cursor (forward delete). O(1)."""
+        if self._gap_end == len(self._data):
+            raise IndexError("No element after the cursor")
+        value = self._data[self._gap_end]
+        self._data[self._gap_end] = None
+        self._gap_end += 1
+        return value
+    
+    def insert(self, index: int, value: Any) -> None:
+        """Insert element at index, leaving the cursor after it. O(distance from the cursor)."""
+        self.move_cursor(index)
+        self.insert_at_cursor(value)
+    
+    def delete(self, index: int) -> Any:
+        """Delete element at index and return it, leaving the cursor there. O(distance from the cursor)."""
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Index {index} out of range")
+        self.move_cursor(index)
+        return self.delete_at_cursor()
+    
+    def append(self, value: Any) -> None:
+        """Append element to the end (moves the cursor to the end)."""
+        self.insert(len(self), value)
+    
+    def extend(self, values) -> None:
+        """Insert every element of an iterable at the cursor."""
+        for value in values:
+            self.insert_at_cursor(value)
+    
     def search(self, value: Any) -> int:
         """Search for value and return its index, or -1 if not found. O(n)."""
-        for i in range(self._size):
-            if self._data[i] == value:
-                return i
+        data, start, end = self._data, self._gap_start, self._gap_end
+        for lo, hi, offset in ((0, start, 0), (end, len(data), end - start)):
+            try:
+                return data.index(value, lo, hi) - offset
+            except ValueError:
+                pass
         return -1
     
-    def _resize(self) -> None:
-        """Double the capacity of the array."""
-        self._capacity *= 2
-        new_data = [None] * self._capacity
-        for i in range(self._size):
-            new_data[i] = self._data[i]
-        self._data = new_data
+    def tolist(self) -> List[Any]:
+        """Return the elements as a list."""
+        return self._data[:self._gap_start] + self._data[self._gap_end:]
+    
+    def _position(self, index: int) -> int:
+        """Translate a logical index into a storage position outside the gap."""
+        n = len(self)
+        position = index + n if index < 0 else index
+        if position < 0 or position >= n:
+            raise IndexError(f"Index {index} out of range")
+        return position if position < self._gap_start else position + self._gap_end - self._gap_start
+    
+    def _grow(self) -> None:
+        """Double the capacity, reopening the gap at the cursor."""
+        extra = max(len(self._data), 1)
+        self._data[self._gap_start:self._gap_start] = [None] * extra
+        self._gap_end += extra
     
     def __str__(self) -> str:
-        """String representation of the array."""
-        return str([self._data[i] for i in range(self._size)])
+        """String representation of the buffer."""
+        return '[' + ', '.join(map(repr, self)) + ']'
+
+
+# NumPy dtype names and the array.array typecodes that store the same values
+_NUMPY_TYPECODES = {
+    'int8': 'b', 'uint8': 'B', 'int16': 'h', 'uint16': 'H',
+    'int32': 'i', 'uint32': 'I', 'int64': 'q', 'uint64': 'Q',
+    'float32': 'f', 'float64': 'd'
+}
+
+
+def _storage_dtype(dtype: Any) -> tuple:
+    """
+    Resolve a DynamicArray dtype into (dtype, uses_numpy).
+    
+    Raises:
+        TypeError: If dtype is neither an array.array typecode nor a NumPy
+            dtype (with an array.array equivalent when NumPy is missing)
+    """
+    if dtype is None:
+        return None, False
+    if isinstance(dtype, str) and len(dtype) == 1 and dtype in array.typecodes:
+        return dtype, False
+    if np is not None:
+        return np.dtype(dtype), True
+    typecode = _NUMPY_TYPECODES.get(getattr(dtype, '__name__', str(dtype)))
+    if typecode is None:
+        raise TypeError(f"unsupported dtype {dtype!r} without NumPy")
+    return typecode, False
+
+
+# File modes accepted by Matrix.open_memmap and the mmap access they map to
+_MEMMAP_ACCESS = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'w+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+
+
+def _memmap_typecode(dtype: Any) -> str:
+    """
+    Resolve an array.array typecode or NumPy dtype name into a typecode.
+    
+    Raises:
+        ValueError: If dtype has no fixed-size numeric typecode
+    """
+    if isinstance(dtype, str) and len(dtype) == 1 and dtype in array.typecodes and dtype != 'u':
+        return dtype
+    try:
+        name = np.dtype(dtype).name if np is not None else getattr(dtype, '__name__', str(dtype))
+    except TypeError:
+        name = None
+    typecode = _NUMPY_TYPECODES.get(name)
+    if typecode is None:
+        raise ValueError(f"unsupported dtype {dtype!r} for a memory-mapped matrix")
+    return typecode
+
+
+def _axis_range(key: Any, n: int, name: str) -> tuple:
+    """
+    Return (start, count, step) for an index or slice along a matrix axis of
+    length n; a single index selects a range of length one.
+    """
+    if isinstance(key, slice):
+        start, stop, step = key.indices(n)
+        return start, len(range(start, stop, step)), step
+    if key < 0 or key >= n:
+        raise IndexError(f"{name} index {key} out of range")
+    return key, 1, 1
+
+
+def _int64_safe(a: Any, b: Any, bound) -> bool:
+    """
+    Return True if a NumPy operation on a and b cannot overflow int64: always
+    for float operands, otherwise when bound(max |a|, max |b|) fits.
+    """
+    if bound is None or a.dtype.kind == 'f' or isinstance(b, float) or getattr(b, 'dtype', a.dtype).kind == 'f':
+        return True
+    return bound(_magnitude(a), _magnitude(b)) < 1 << 63
+
+
+def _exact_numpy(a: Any, b: Any, op, bound) -> Any:
+    """
+    Apply op to NumPy operand a and b (an array or Python scalar) without
+    integer wraparound, or return None if an integer result might not fit
+    int64 (see _int64_safe). Integer operands are computed in int64, so
+    narrow or unsigned dtypes cannot wrap, and the result is narrowed back
+    to the operands' dtype when every value fits it.
+    """
+    if not _int64_safe(a, b, bound):
+        return None
+    b_dtype = getattr(b, 'dtype', None)
+    if bound is None or a.dtype.kind == 'f' or isinstance(b, float) or (b_dtype is not None and b_dtype.kind == 'f'):
+        return op(a, b)
+    target = a.dtype if b_dtype is None else np.result_type(a.dtype, b_dtype)
+    result = op(a.astype(np.int64, copy=False), b if b_dtype is None else b.astype(np.int64, copy=False))
+    if target != np.int64 and result.size:
+        info = np.iinfo(target)
+        if info.min <= result.min() and result.max() <= info.max:
+            result = result.astype(target)
+    return result
+
+
+def _true_divide(a: Any, b: Any) -> Any:
+    """operator.truediv that also raises ZeroDivisionError for NumPy operands."""
+    if np is not None and isinstance(a, np.ndarray) and not np.all(b):
+        raise ZeroDivisionError("division by zero")
+    return a / b
+
+
+def _magnitude(value: Any) -> int:
+    """Return the largest absolute value of an integer array or scalar as a Python int."""
+    if isinstance(value, int):
+        return abs(value)
+    return max(-int(value.min()), int(value.max()))
 
 
 class Matrix:
     """
-    A 2D matrix implementation with basic operations.
+    A 2D matrix stored as one flat row-major buffer with a shape and strides.
+    
+    Cell (i, j) lives at _data[offset + i * row_stride + j * col_stride], so
+    transposes, rows, columns and submatrices (including slices such as
+    matrix[1:3, ::2]) are views: matrices sharing the same buffer with a
+    different offset, shape or strides. Writes through a view change the
+    matrix it was taken from; copy() returns an independent matrix.
+    
+    Arithmetic (+, -, *, /, @) and the sum/mean/min/max reductions run in
+    NumPy over typed numeric buffers (see from_iterable's typecode) and as
+    builtin passes over list buffers, where converting to NumPy and back
+    would cost more than the operation. The matrix product converts numeric
+    lists too, since its O(n*m*p) work outweighs the copy. Other cells
+    (Fractions, Decimals, strings, ...) always use Python arithmetic.
     
     Time Complexity:
         - Access: O(1)
         - Insertion: O(1)
         - Deletion: O(1)
+        - Transpose, row, column and submatrix views: O(1)
         - Matrix operations: O(n*m) where n, m are dimensions
+        - Matrix product: O(n*m*p) for an n x m by m x p product
+        - Selection, median and quantiles per row/column: O(n*m)
+        - Median/rank filter with a w x w window: O(n*m*w)
     """
     
     def __init__(self, rows: int, cols: int, initial_value: Any = 0):
         """Initialize a matrix with given dimensions."""
         self.rows = rows
         self.cols = cols
-        self._data = [[initial_value for _ in range(cols)] for _ in range(rows)]
+        self._data = [initial_value] * (rows * cols)
+        self._offset = 0
+        self._strides = (cols, 1)
     
-    def __getitem__(self, key: tuple) -> Any:
-        """Get element at (row, col)."""
-        row, col = key
+    @classmethod
+    def _wrap(cls, data: Any, rows: int, cols: int, offset: int = 0, strides: Optional[tuple] = None) -> 'Matrix':
+        """Create a matrix over an existing flat buffer without copying it."""
+        matrix = cls.__new__(cls)
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix._data = data
+        matrix._offset = offset
+        matrix._strides = (cols, 1) if strides is None else strides
+        return matrix
+    
+    @classmethod
+    def from_rows(cls, rows: List[List[Any]]) -> 'Matrix':
+        """
+        Build a matrix from a list of equally long rows. O(n*m).
+        
+        Raises:
+            ValueError: If the rows have different lengths
+        """
+        rows = list(rows)
+        cols = len(rows[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            raise ValueError("all rows must have the same length")
+        return cls._wrap(list(chain.from_iterable(rows)), len(rows), cols)
+    
+    @classmethod
+    def from_iterable(cls, values: Any, rows: int, cols: int, typecode: Optional[str] = None) -> 'Matrix':
+        """
+        Build a rows x cols matrix from rows * cols values in row-major order. O(n*m).
+        
+        Args:
+            values: Iterable of cells in row-major order
+            rows: Number of rows
+            cols: Number of columns
+            typecode: Optional array.array typecode ('d', 'q', ...) storing the
+                cells unboxed, which lets arithmetic run in NumPy
+                
+        Raises:
+            ValueError: If the number of values does not match the shape
+        """
+        data = list(values) if typecode is None else array.array(typecode, values)
+        if len(data) != rows * cols:
+            raise ValueError(f"expected {rows * cols} values for a {rows}x{cols} matrix, got {len(data)}")
+        return cls._wrap(data, rows, cols)
+    
+    @classmethod
+    def from_numpy(cls, values: Any) -> 'Matrix':
+        """
+        Build a matrix from a 2-D NumPy array with one C-level conversion. O(n*m).
+        
+        Raises:
+            ValueError: If the array is not 2-D
+        """
+        if np is None:
+            raise ImportError("from_numpy requires NumPy")
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError(f"expected a 2-D array, got {values.ndim} dimensions")
+        rows, cols = values.shape
+        return cls._wrap(values.ravel().tolist(), rows, cols)
+    
+    @classmethod
+    def open_memmap(cls, path: str, rows: int, cols: int, dtype: Any = 'd', mode: str = 'r+') -> 'Matrix':
+        """
+        Open a rows x cols matrix stored row-major as raw binary in a file,
+        mapped into memory instead of read.
+        
+        Pages are read from disk only when cells on them are touched, so
+        row, column and submatrix views, selection on a column view
+        (matrix.column(j).median()) and the sum/mean/min/max reductions
+        work on files larger than RAM.
+        
+        Args:
+            path: File holding the cells
+            rows: Number of rows
+            cols: Number of columns
+            dtype: array.array typecode or NumPy dtype name ('float64', 'int32', ...)
+            mode: 'r' read-only, 'r+' read/write an existing file, 'w+'
+                create or overwrite a zero-filled file, 'c' copy-on-write
+                (writes are never saved)
+                
+        Raises:
+            ValueError: If the mode or dtype is not supported, or the file is
+                smaller than the matrix
+        """
+        if mode not in _MEMMAP_ACCESS:
+            raise ValueError(f"mode must be one of {sorted(_MEMMAP_ACCESS)}, got {mode!r}")
+        typecode = _memmap_typecode(dtype)
+        size = rows * cols * array.array(typecode).itemsize
+        if size == 0:
+            return cls._wrap(array.array(typecode), rows, cols)
+        
+        with open(path, {'r': 'rb', 'c': 'rb', 'r+': 'r+b', 'w+': 'w+b'}[mode]) as file:
+            if mode == 'w+':
+                file.truncate(size)
+            elif os.fstat(file.fileno()).st_size < size:
+                raise ValueError(f"{path} holds fewer than {rows}x{cols} cells of type {typecode!r}")
+            # The mapping stays valid after the file is closed
+            mapping = mmap.mmap(file.fileno(), size, access=_MEMMAP_ACCESS[mode])
+        return cls._wrap(memoryview(mapping).cast(typecode), rows, cols)
+    
+    def _mapping(self) -> Any:
+        """
+        Return the mmap behind a memory-mapped matrix (or a view of one), else None.
+        
+        Raises:
+            ValueError: If the matrix has been closed
+        """
+        if not isinstance(self._data, memoryview):
+            return None
+        try:
+            owner = self._data.obj
+        except ValueError:
+            raise ValueError("memory-mapped matrix is closed") from None
+        return owner if isinstance(owner, mmap.mmap) else None
+    
+    def flush(self) -> None:
+        """Write changes to a memory-mapped matrix back to its file; a no-op for other matrices."""
+        mapping = self._mapping()
+        if mapping is not None:
+            mapping.flush()
+    
+    def close(self) -> None:
+        """
+        Flush and unmap a memory-mapped matrix. Afterwards the matrix and
+        every view of it raise ValueError on access; a no-op for other
+        matrices and for a matrix that is already closed.
+        
+        Raises:
+            BufferError: If a NumPy array or memoryview exported from the
+                matrix is still alive. The matrix is closed regardless, and
+                the file is unmapped once the export is released
+        """
+        try:
+            mapping = self._mapping()
+        except ValueError:
+            return
+        if mapping is None:
+            return
+        mapping.flush()
+        self._data.release()
+        try:
+            mapping.close()
+        except BufferError:
+            raise BufferError(
+                "memory-mapped matrix closed, but arrays exported from it keep the file mapped until released"
+            ) from None
+    
+    @property
+    def shape(self) -> tuple:
+        """Return (rows, cols)."""
+        return self.rows, self.cols
+    
+    def _index(self, row: int, col: int) -> int:
+        """Return the buffer position of (row, col), raising IndexError if it is out of range."""
         if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
             raise IndexError(f"Index ({row}, {col}) out of range")
-        return self._data[row][col]
+        return self._offset + row * self._strides[0] + col * self._strides[1]
+    
+    def __getitem__(self, key: tuple) -> Any:
+        """Get element at (row, col), or a view if either index is a slice."""
+        row, col = key
+        if isinstance(row, slice) or isinstance(col, slice):
+            return self._view(row, col)
+        return self._data[self._index(row, col)]
     
     def __setitem__(self, key: tuple, value: Any) -> None:
         """Set element at (row, col)."""
         row, col = key
-        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
-            raise IndexError(f"Index ({row}, {col}) out of range")
-        self._data[row][col] = value
+        self._data[self._index(row, col)] = value
+    
+    def _view(self, row: Any, col: Any) -> 'Matrix':
+        """Return the view selected by a pair of slices and/or indices. O(1)."""
+        row_start, row_count, row_step = _axis_range(row, self.rows, 'row')
+        col_start, col_count, col_step = _axis_range(col, self.cols, 'column')
+        row_stride, col_stride = self._strides
+        offset = self._offset + row_start * row_stride + col_start * col_stride
+        return Matrix._wrap(self._data, row_count, col_count, offset, (row_stride * row_step, col_stride * col_step))
+    
+    def row(self, i: int) -> 'Matrix':
+        """Return row i as a 1 x cols view. O(1)."""
+        return self._view(i, slice(None))
+    
+    def column(self, j: int) -> 'Matrix':
+        """Return column j as a rows x 1 view. O(1)."""
+        return self._view(slice(None), j)
+    
+    def submatrix(self, row_start: int, row_stop: int, col_start: int, col_stop: int) -> 'Matrix':
+        """Return rows [row_start, row_stop) and columns [col_start, col_stop) as a view. O(1)."""
+        return self._view(slice(row_start, row_stop), slice(col_start, col_stop))
+    
+    def transpose(self) -> 'Matrix':
+        """Return the transpose as a view (the strides are swapped). O(1)."""
+        row_stride, col_stride = self._strides
+        return Matrix._wrap(self._data, self.cols, self.rows, self._offset, (col_stride, row_stride))
+    
+    @property
+    def T(self) -> 'Matrix':
+        """The transpose view (see transpose)."""
+        return self.transpose()
+    
+    def is_contiguous(self) -> bool:
+        """Return True if the cells fill the buffer range they span in row-major order."""
+        return self._strides == (self.cols, 1) or self.rows * self.cols <= 1
+    
+    def copy(self) -> 'Matrix':
+        """Return an independent contiguous copy. O(n*m)."""
+        return Matrix._wrap(self.ravel(), self.rows, self.cols)
+    
+    def _line(self, start: int, count: int, step: int) -> List[Any]:
+        """Return count cells starting at a buffer position, step apart, as a list."""
+        stop = start + count * step
+        cells = self._data[start:stop if stop >= 0 else None:step]
+        return cells if isinstance(cells, list) else cells.tolist()
+    
+    def _rows(self) -> List[List[Any]]:
+        """Return every row as a list, each sliced out of the buffer in one step."""
+        row_stride, col_stride = self._strides
+        return [self._line(self._offset + i * row_stride, self.cols, col_stride) for i in range(self.rows)]
+    
+    def _columns(self) -> List[List[Any]]:
+        """Return every column as a list, each sliced out of the buffer in one step."""
+        row_stride, col_stride = self._strides
+        return [self._line(self._offset + j * col_stride, self.rows, row_stride) for j in range(self.cols)]
+    
+    def ravel(self) -> List[Any]:
+        """Return every cell in row-major order as one flat list. O(n*m)."""
+        row_stride, col_stride = self._strides
+        if self.rows == 0 or self.cols == 0:
+            return []
+        if self.cols == 1:
+            return self._line(self._offset, self.rows, row_stride)
+        if self.rows == 1 or row_stride == self.cols * col_stride:
+            # The cells are evenly spaced in the buffer: one slice reads them all
+            return self._line(self._offset, self.rows * self.cols, col_stride)
+        return list(chain.from_iterable(self._rows()))
+    
+    def tolist(self) -> List[List[Any]]:
+        """Return the matrix as a list of row lists. O(n*m)."""
+        return self._rows()
+    
+    def _vectors(self, axis: Optional[int]) -> List[List[Any]]:
+        """
+        Return the vectors a reduction runs over: one flat list of every cell
+        for axis=None, the columns for axis=0 and the rows for axis=1.
+        """
+        if axis is None:
+            return [self.ravel()]
+        if axis == 0:
+            return self._columns()
+        if axis == 1:
+            return self._rows()
+        raise ValueError(f"axis must be None, 0 or 1, got {axis}")
+    
+    # ------------------------------------------------------------------
+    # Arithmetic and reductions
+    # ------------------------------------------------------------------
+    
+    def _numeric(self, copy_lists: bool = False) -> Any:
+        """
+        Return the cells as a 2-D int/float NumPy array, or None.
+        
+        Typed buffers (array.array, memoryview, NumPy) are viewed in place
+        through the matrix strides. A list buffer is converted only when
+        copy_lists is set: converting costs about as much as one builtin pass
+        over the cells, so only the O(n*m*p) matrix product pays for it.
+        """
+        if np is None or self.rows == 0 or self.cols == 0:
+            return None
+        if isinstance(self._data, list):
+            if not copy_lists:
+                return None
+            cells = self.ravel()
+            if not set(map(type, cells)) <= {int, float}:
+                return None
+            try:
+                values = np.array(cells)
+            except OverflowError:
+                return None
+            return values.reshape(self.rows, self.cols) if values.dtype.kind in 'iuf' else None
+        
+        base = self._data if isinstance(self._data, np.ndarray) else np.asarray(memoryview(self._data))
+        if base.ndim != 1 or base.dtype.kind not in 'iuf':
+            return None
+        row_stride, col_stride = self._strides
+        return np.lib.stride_tricks.as_strided(
+            base[self._offset:],
+            shape=(self.rows, self.cols),
+            strides=(row_stride * base.strides[0], col_stride * base.strides[0]),
+            writeable=False
+        )
+    
+    @classmethod
+    def _from_result(cls, values: Any, typed: bool = True) -> 'Matrix':
+        """
+        Wrap a 2-D NumPy result, keeping it unboxed in an array.array when
+        typed is set and its dtype has a matching typecode.
+        """
+        rows, cols = values.shape
+        if typed and values.dtype.char in array.typecodes:
+            return cls._wrap(array.array(values.dtype.char, values.tobytes()), rows, cols)
+        return cls._wrap(values.ravel().tolist(), rows, cols)
+    
+    def _elementwise(self, other: Any, op, int_bound=None) -> 'Matrix':
+        """
+        Apply op cell by cell against another matrix of the same shape or a
+        scalar. Typed numeric buffers run as one NumPy operation (integers
+        in int64, see _exact_numpy) unless int_bound says the result could
+        overflow int64; anything else maps op over the cells in Python.
+        """
+        if isinstance(other, Matrix):
+            if other.shape != self.shape:
+                raise ValueError(f"shape mismatch: {self.shape} and {other.shape}")
+        elif isinstance(other, (list, tuple)):
+            return NotImplemented
+        
+        a = self._numeric()
+        if a is not None:
+            if isinstance(other, Matrix):
+                b = other._numeric()
+            else:
+                b = other if type(other) in (int, float) else None
+            result = None if b is None else _exact_numpy(a, b, op, int_bound)
+            if result is not None:
+                return Matrix._from_result(result)
+        
+        right = other.ravel() if isinstance(other, Matrix) else repeat(other)
+        return Matrix._wrap(list(map(op, self.ravel(), right)), self.rows, self.cols)
+    
+    def __add__(self, other: Any) -> 'Matrix':
+        """Cellwise sum with a matrix of the same shape or a scalar. O(n*m)."""
+        return self._elementwise(other, operator.add, operator.add)
+    
+    def __radd__(self, other: Any) -> 'Matrix':
+        """Cellwise sum with a scalar on the left."""
+        return self._elementwise(other, lambda a, b: b + a, operator.add)
+    
+    def __sub__(self, other: Any) -> 'Matrix':
+        """Cellwise difference with a matrix of the same shape or a scalar. O(n*m)."""
+        return self._elementwise(other, operator.sub, operator.add)
+    
+    def __rsub__(self, other: Any) -> 'Matrix':
+        """Subtract every cell from a scalar."""
+        return self._elementwise(other, lambda a, b: b - a, operator.add)
+    
+    def __mul__(self, other: Any) -> 'Matrix':
+        """Cellwise product with a matrix of the same shape or a scalar (use @ for matmul). O(n*m)."""
+        return self._elementwise(other, operator.mul, operator.mul)
+    
+    def __rmul__(self, other: Any) -> 'Matrix':
+        """Cellwise product with a scalar on the left."""
+        return self._elementwise(other, lambda a, b: b * a, operator.mul)
+    
+    def __truediv__(self, other: Any) -> 'Matrix':
+        """
+        Cellwise true division by a matrix of the same shape or a scalar. O(n*m).
+        
+        Raises:
+            ZeroDivisionError: If any divisor is zero
+        """
+        return self._elementwise(other, _true_divide)
+    
+    def __neg__(self) -> 'Matrix':
+        """Negate every cell. O(n*m)."""
+        return self._elementwise(-1, lambda a, b: -a, operator.mul)
+    
+    def __matmul__(self, other: 'Matrix') -> 'Matrix':
+        """
+        Matrix product. O(n*m*p) for an n x m by m x p product.
+        
+        Numeric matrices are multiplied by NumPy (BLAS for floats); other
+        cells use a Python dot product of each row with each column.
+        
+        Raises:
+            ValueError: If self.cols != other.rows
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.cols != other.rows:
+            raise ValueError(f"cannot multiply {self.rows}x{self.cols} by {other.rows}x{other.cols}")
+        
+        a, b = self._numeric(copy_lists=True), other._numeric(copy_lists=True)
+        if a is not None and b is not None:
+            result = _exact_numpy(a, b, operator.matmul, lambda x, y: x * y * self.cols)
+            if result is not None:
+                return Matrix._from_result(result, typed=not isinstance(self._data, list))
+        
+        columns = other._columns()
+        cells = [sum(map(operator.mul, row, column)) for row in self._rows() for column in columns]
+        return Matrix._wrap(cells, self.rows, other.cols)
+    
+    def matmul(self, other: 'Matrix', semiring: Any = None, workers: Optional[int] = 1, block_size: int = 64) -> 'Matrix':
+        """
+        Multiply by other over a semiring in pure Python, tile by tile,
+        optionally spreading the tiles over worker processes.
+        
+        Use this for cells NumPy cannot handle (Fractions, Decimals, ...) or
+        for other semirings, e.g. MIN_PLUS for shortest paths.
+        
+        Args:
+            other: Right operand
+            semiring: A matrix_parallel.Semiring (the ordinary product by default)
+            workers: Worker processes (None uses every core, 1 stays in process)
+            block_size: Side length of the output tiles
+        """
+        try:
+            from .matrix_parallel import PLUS_TIMES, parallel_matmul
+        except ImportError:
+            from src.matrix_parallel import PLUS_TIMES, parallel_matmul
+        
+        return parallel_matmul(self, other, semiring or PLUS_TIMES, block_size, workers)
+    
+    def _reduce(self, axis: Optional[int], name: str, reducer) -> Any:
+        """
+        Reduce the whole matrix (axis=None), each column (axis=0) or each row
+        (axis=1) with the NumPy method `name` for typed numeric buffers, or
+        with reducer applied to each vector otherwise.
+        """
+        if axis not in (None, 0, 1):
+            raise ValueError(f"axis must be None, 0 or 1, got {axis}")
+        if name != 'sum' and (self.rows == 0 or self.cols == 0):
+            raise IndexError(f"Cannot take the {name} of an empty matrix")
+        
+        a = self._numeric()
+        if a is not None and (name != 'sum' or _int64_safe(a, a.size, operator.mul)):
+            return getattr(a, name)(axis=axis).tolist()
+        results = [reducer(vector) for vector in self._vectors(axis)]
+        return results[0] if axis is None else results
+    
+    def sum(self, axis: Optional[int] = None) -> Any:
+        """Sum the whole matrix, each column (axis=0) or each row (axis=1). O(n*m)."""
+        return self._reduce(axis, 'sum', sum)
+    
+    def mean(self, axis: Optional[int] = None) -> Any:
+        """Arithmetic mean of the whole matrix, each column or each row. O(n*m)."""
+        return self._reduce(axis, 'mean', lambda vector: sum(vector) / len(vector))
+    
+    def min(self, axis: Optional[int] = None) -> Any:
+        """Smallest value of the whole matrix, each column or each row. O(n*m)."""
+        return self._reduce(axis, 'min', min)
+    
+    def max(self, axis: Optional[int] = None) -> Any:
+        """Largest value of the whole matrix, each column or each row. O(n*m)."""
+        return self._reduce(axis, 'max', max)
+    
+    def select(self, k: int, axis: Optional[int] = None) -> Any:
+        """
+        Find the k-th smallest value (1-indexed) over the whole matrix, each
+        column (axis=0) or each row (axis=1). O(n*m).
+        
+        Numeric matrices are reduced along the axis with one vectorized NumPy
+        pass when NumPy is available.
+        
+        Returns:
+            A single value for axis=None, otherwise one value per column/row
+        """
+        try:
+            from .selection_planner import batch_select
+        except ImportError:
+            from src.selection_planner import batch_select
+        
+        results = batch_select(self._vectors(axis), k)
+        return results[0] if axis is None else results
+    
+    def median(self, axis: Optional[int] = None) -> Any:
+        """Find the (lower) median over the whole matrix, each column or each row. O(n*m)."""
+        n = self.rows * self.cols if axis is None else (self.rows if axis == 0 else self.cols)
+        return self.select((n + 1) // 2, axis)
+    
+    def quantiles(self, qs: List[float], axis: Optional[int] = None) -> List[Any]:
+        """
+        Find nearest-rank quantiles (each q in [0, 1]) over the whole matrix,
+        each column or each row. O(n*m).
+        
+        Returns:
+            A list with one value per q for axis=None, otherwise one such list
+            per column/row
+        """
+        try:
+            from .selection_planner import batch_select_many
+            from .selection_utils import quantile_rank
+        except ImportError:
+            from src.selection_planner import batch_select_many
+            from src.selection_utils import quantile_rank
+        
+        vectors = self._vectors(axis)
+        if not vectors:
+            return []
+        ks = [quantile_rank(q, len(vectors[0])) for q in qs]
+        results = batch_select_many(vectors, ks)
+        return results[0] if axis is None else results
+    
+    def rank_filter(self, size: int, k: int) -> 'Matrix':
+        """
+        Replace every cell with the k-th smallest value (1-indexed) of the
+        size x size window centred on it, replicating the edges. O(n*m*size).
+        
+        Returns:
+            A new matrix of the same shape
+        """
+        try:
+            from .rank_filter import rank_filter
+        except ImportError:
+            from src.rank_filter import rank_filter
+        
+        filtered = rank_filter(self._rows(), size, k)
+        return Matrix._wrap(list(chain.from_iterable(filtered)), self.rows, self.cols)
+    
+    def median_filter(self, size: int) -> 'Matrix':
+        """Apply a size x size median filter (see rank_filter). O(n*m*size)."""
+        return self.rank_filter(size, (size * size + 1) // 2)
     
     def __str__(self) -> str:
         """String representation of the matrix."""
-        return '\n'.join([' '.join(map(str, row)) for row in self._data])
+        return '\n'.join([' '.join(map(str, row)) for row in self._rows()])
 
 
 # ============================================================================
@@ -184,6 +1320,14 @@ class Stack:
         """Return the number of elements in the stack. O(1)."""
         return len(self._data)
     
+    def __len__(self) -> int:
+        """Return the number of elements in the stack."""
+        return len(self._data)
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate from the bottom to the top of the stack. O(n)."""
+        return iter(self._data)
+    
     def __str__(self) -> str:
         """String representation of the stack."""
         return str(self._data)
@@ -191,46 +1335,737 @@ class Stack:
 
 class Queue:
     """
-    Queue implementation using a dynamic array.
+    Queue implementation using a growable circular buffer.
+    
+    Elements live in a list whose capacity is a power of two; head is the
+    slot of the front element and the rear slot is (head + size) & mask, so
+    neither end ever shifts the other elements. The buffer doubles when it
+    fills up and halves when it drains to a quarter full (never below its
+    initial capacity).
     
     Time Complexity:
         - Enqueue: O(1) amortized
-        - Dequeue: O(n) (can be optimized to O(1) with circular buffer)
+        - Dequeue: O(1) amortized
         - Peek: O(1)
         - Search: O(n)
     """
     
-    def __init__(self):
-        """Initialize an empty queue."""
-        self._data = []
+    def __init__(self, initial_capacity: int = 8):
+        """Initialize an empty queue with room for initial_capacity elements (rounded up to a power of two)."""
+        capacity = 1 << max(0, initial_capacity - 1).bit_length()
+        self._data = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._mask = capacity - 1
+        self._min_capacity = capacity
+    
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the buffer."""
+        return len(self._data)
     
     def enqueue(self, value: Any) -> None:
         """Add element to the rear of the queue. O(1) amortized."""
-        self._data.append(value)
+        if self._size == len(self._data):
+            self._resize(2 * len(self._data))
+        self._data[(self._head + self._size) & self._mask] = value
+        self._size += 1
     
     def dequeue(self) -> Any:
-        """Remove and return the front element. O(n)."""
-        if self.is_empty():
+        """Remove and return the front element. O(1) amortized."""
+        if self._size == 0:
             raise IndexError("Queue is empty")
-        return self._data.pop(0)
+        head = self._head
+        value = self._data[head]
+        self._data[head] = None  # Drop the reference so the element can be freed
+        self._head = (head + 1) & self._mask
+        self._size -= 1
+        capacity = len(self._data)
+        if self._size <= capacity >> 2 and capacity > self._min_capacity:
+            self._resize(capacity >> 1)
+        return value
     
     def peek(self) -> Any:
         """Return the front element without removing it. O(1)."""
-        if self.is_empty():
+        if self._size == 0:
             raise IndexError("Queue is empty")
-        return self._data[0]
+        return self._data[self._head]
     
     def is_empty(self) -> bool:
         """Check if the queue is empty. O(1)."""
-        return len(self._data) == 0
+        return self._size == 0
     
     def size(self) -> int:
         """Return the number of elements in the queue. O(1)."""
-        return len(self._data)
+        return self._size
+    
+    def __len__(self) -> int:
+        """Return the number of elements in the queue."""
+        return self._size
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate from the front to the rear of the queue. O(n)."""
+        return iter(self._ordered())
+    
+    def _ordered(self) -> List[Any]:
+        """Return the elements from front to rear, joined from at most two slices."""
+        tail = self._head + self._size
+        if tail <= len(self._data):
+            return self._data[self._head:tail]
+        return self._data[self._head:] + self._data[:tail - len(self._data)]
+    
+    def _resize(self, capacity: int) -> None:
+        """Move the elements to the front of a buffer with the given power-of-two capacity."""
+        items = self._ordered()
+        self._data = items + [None] * (capacity - len(items))
+        self._head = 0
+        self._mask = capacity - 1
     
     def __str__(self) -> str:
         """String representation of the queue."""
-        return str(self._data)
+        return str(self._ordered())
+
+
+class BoundedQueue(Queue):
+    """
+    Thread-safe FIFO queue holding at most maxsize elements.
+    
+    Producers block in enqueue while the queue is full and consumers block in
+    dequeue while it is empty, so a fast producer cannot grow the queue
+    without bound. One lock guards the ring buffer; two conditions on it wake
+    only the side that can make progress. The batch methods take the lock
+    once per batch instead of once per element.
+    
+    Time Complexity:
+        - Enqueue/dequeue: O(1) amortized, plus any time spent waiting
+        - enqueue_many/dequeue_many: O(k) for k elements
+    """
+    
+    def __init__(self, maxsize: int):
+        """
+        Initialize an empty queue.
+        
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        super().__init__(min(maxsize, 1024))
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+    
+    def enqueue(self, value: Any, timeout: Optional[float] = None) -> None:
+        """
+        Add element to the rear, waiting while the queue is full.
+        
+        Raises:
+            TimeoutError: If no space freed up within timeout seconds
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_space, timeout):
+                raise TimeoutError("queue is full")
+            Queue.enqueue(self, value)
+            self._not_empty.notify()
+    
+    def dequeue(self, timeout: Optional[float] = None) -> Any:
+        """
+        Remove and return the front element, waiting while the queue is empty.
+        
+        Raises:
+            TimeoutError: If no element arrived within timeout seconds
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError("queue is empty")
+            value = Queue.dequeue(self)
+            self._not_full.notify()
+            return value
+    
+    def try_enqueue(self, value: Any) -> bool:
+        """Add element to the rear if there is space; return whether it was added."""
+        with self._lock:
+            if self._size >= self.maxsize:
+                return False
+            Queue.enqueue(self, value)
+            self._not_empty.notify()
+            return True
+    
+    def try_dequeue(self) -> tuple:
+        """Remove the front element if there is one; return (True, value) or (False, None)."""
+        with self._lock:
+            if self._size == 0:
+                return False, None
+            value = Queue.dequeue(self)
+            self._not_full.notify()
+            return True, value
+    
+    def enqueue_many(self, values, timeout: Optional[float] = None) -> int:
+        """
+        Add every element of an iterable, filling whatever space is free and
+        waiting for more as needed.
+        
+        The timeout bounds the total time spent waiting for space across the
+        whole call, not each individual wait.
+        
+        Returns:
+            The number of elements added, which is smaller than the number
+            given only if timeout seconds passed before all of them fit
+        """
+        values = list(values)
+        added = 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_full:
+            while added < len(values):
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not self._not_full.wait_for(self._has_space, remaining):
+                    break
+                batch = min(self.maxsize - self._size, len(values) - added)
+                for value in values[added:added + batch]:
+                    Queue.enqueue(self, value)
+                added += batch
+                self._not_empty.notify(batch)
+        return added
+    
+    def dequeue_many(self, max_n: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to max_n elements from the front, waiting until
+        at least one is available.
+        
+        Returns:
+            Between 1 and max_n elements, or an empty list if none arrived
+            within timeout seconds
+            
+        Raises:
+            ValueError: If max_n is not positive
+        """
+        if max_n < 1:
+            raise ValueError(f"max_n must be positive, got {max_n}")
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                return []
+            batch = [Queue.dequeue(self) for _ in range(min(max_n, self._size))]
+            self._not_full.notify(len(batch))
+            return batch
+    
+    def peek(self) -> Any:
+        """Return the front element without removing it. O(1)."""
+        with self._lock:
+            return Queue.peek(self)
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over a snapshot of the elements from front to rear. O(n)."""
+        with self._lock:
+            return iter(self._ordered())
+    
+    def __str__(self) -> str:
+        """String representation of the queue."""
+        with self._lock:
+            return str(self._ordered())
+    
+    def _has_space(self) -> bool:
+        """Return True if another element fits (called with the lock held)."""
+        return self._size < self.maxsize
+    
+    def _has_items(self) -> bool:
+        """Return True if the queue is not empty (called with the lock held)."""
+        return self._size > 0
+
+
+class _AsyncWaiters:
+    """
+    Waiter bookkeeping shared by AsyncQueue and AsyncStack.
+    
+    Blocked getters and putters wait in FIFO order on futures. Elements and
+    free slots are handed straight to the longest waiter, so a coroutine that
+    arrives later never overtakes one that is already waiting: while a getter
+    waits the container is empty, and while a putter waits it is full.
+    Subclasses supply _push, _pop and _push_front on their storage.
+    """
+    
+    def _init_waiters(self, maxsize: int) -> None:
+        """Set up the waiter queues; maxsize 0 means unbounded."""
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative, got {maxsize}")
+        self.maxsize = maxsize
+        self._getters = deque()  # Futures resolved with the handed-over element
+        self._putters = deque()  # (future, value) pairs waiting for a free slot
+        self._closed = False
+    
+    @property
+    def closed(self) -> bool:
+        """True once close() has been called."""
+        return self._closed
+    
+    def full(self) -> bool:
+        """Check if a put would have to wait. O(1)."""
+        return 0 < self.maxsize <= len(self)
+    
+    def try_put(self, value: Any) -> bool:
+        """
+        Add an element without waiting; return whether it was added.
+        
+        Raises:
+            RuntimeError: If the container is closed
+        """
+        if self._closed:
+            raise RuntimeError(f"{type(self).__name__} is closed")
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(value)
+                return True
+        if self.full():
+            return False
+        self._push(value)
+        return True
+    
+    def try_get(self) -> tuple:
+        """Remove the next element without waiting; return (True, value) or (False, None)."""
+        if not len(self):
+            return False, None
+        value = self._pop()
+        while self._putters:
+            putter, pending = self._putters.popleft()
+            if not putter.done():
+                self._push(pending)
+                putter.set_result(None)
+                break
+        return True, value
+    
+    async def put(self, value: Any) -> None:
+        """
+        Add an element, waiting while the container is full.
+        
+        A put cancelled after its element was accepted leaves the element in
+        the container.
+        
+        Raises:
+            RuntimeError: If the container is closed
+        """
+        if self.try_put(value):
+            return
+        putter = asyncio.get_running_loop().create_future()
+        self._putters.append((putter, value))
+        await putter
+    
+    async def get(self) -> Any:
+        """
+        Remove and return the next element, waiting while the container is empty.
+        
+        Raises:
+            IndexError: If the container is closed and drained
+        """
+        found, value = self.try_get()
+        if found:
+            return value
+        if self._closed:
+            raise IndexError(f"{type(self).__name__} is closed and empty")
+        getter = asyncio.get_running_loop().create_future()
+        self._getters.append(getter)
+        try:
+            return await getter
+        except asyncio.CancelledError:
+            if getter.done() and not getter.cancelled() and getter.exception() is None:
+                # The element arrived just before the cancellation; pass it on
+                self._requeue(getter.result())
+            raise
+    
+    async def get_many(self, max_n: int) -> List[Any]:
+        """
+        Remove and return up to max_n elements, waiting until at least one is available.
+        
+        Raises:
+            ValueError: If max_n is not positive
+            IndexError: If the container is closed and drained
+        """
+        if max_n < 1:
+            raise ValueError(f"max_n must be positive, got {max_n}")
+        batch = [await self.get()]
+        while len(batch) < max_n:
+            found, value = self.try_get()
+            if not found:
+                break
+            batch.append(value)
+        return batch
+    
+    def close(self) -> None:
+        """
+        Refuse further puts. Elements already in (or waiting to enter) the
+        container can still be taken; getters waiting on an empty container
+        get IndexError and async iteration stops once it drains.
+        """
+        self._closed = True
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_exception(IndexError(f"{type(self).__name__} is closed and empty"))
+    
+    def __aiter__(self) -> '_AsyncWaiters':
+        return self
+    
+    async def __anext__(self) -> Any:
+        try:
+            return await self.get()
+        except IndexError:
+            raise StopAsyncIteration from None
+    
+    def _requeue(self, value: Any) -> None:
+        """Give a value back to the next waiting getter, or to the front of the container."""
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(value)
+                return
+        self._push_front(value)
+
+
+class AsyncQueue(_AsyncWaiters, Queue):
+    """
+    Awaitable FIFO queue for coroutines on one event loop.
+    
+    Stores elements in the same circular buffer as Queue. put waits while
+    maxsize elements are queued (maxsize 0 means unbounded) and get waits
+    while the queue is empty; waiters are served first come, first served.
+    Use put/get rather than the inherited enqueue/dequeue, which bypass the
+    waiters. close() ends `async for` once the queue drains.
+    
+    Time Complexity:
+        - put/get: O(1) amortized, plus any time spent waiting
+        - get_many: O(k) for k elements
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        """Initialize an empty queue holding at most maxsize elements (0 for no limit)."""
+        self._init_waiters(maxsize)
+        super().__init__(min(maxsize, 1024) if maxsize else 8)
+    
+    _push = Queue.enqueue
+    _pop = Queue.dequeue
+    
+    def _push_front(self, value: Any) -> None:
+        """Insert an element in front of the head. O(1) amortized."""
+        if self._size == len(self._data):
+            self._resize(2 * len(self._data))
+        self._head = (self._head - 1) & self._mask
+        self._data[self._head] = value
+        self._size += 1
+
+
+class AsyncStack(_AsyncWaiters, Stack):
+    """
+    Awaitable LIFO stack for coroutines on one event loop.
+    
+    Stores elements in the same list as Stack; get returns the most recently
+    put element. Bounding, fair wakeups, batching, closing and async
+    iteration work as in AsyncQueue.
+    
+    Time Complexity:
+        - put/get: O(1) amortized, plus any time spent waiting
+        - get_many: O(k) for k elements
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        """Initialize an empty stack holding at most maxsize elements (0 for no limit)."""
+        self._init_waiters(maxsize)
+        super().__init__()
+    
+    _push = Stack.push
+    _pop = Stack.pop
+    _push_front = Stack.push
+
+
+# ============================================================================
+# Priority Queues
+# ============================================================================
+
+class PriorityQueue:
+    """
+    Min-priority queue on an array-backed d-ary heap.
+    
+    The children of slot i are slots d*i + 1 .. d*i + d. A wider heap is
+    shallower, so push does fewer comparisons while pop does more per level.
+    With d = 2 the layout is the one heapq uses, and the C heapq functions
+    do the sifting.
+    
+    Time Complexity:
+        - Push: O(log_d n)
+        - Pop/pushpop: O(d log_d n)
+        - Peek: O(1)
+        - heapify: O(n)
+    """
+    
+    def __init__(self, values: Iterable[Any] = (), d: int = 2):
+        """
+        Initialize the queue with the given values (heapified in O(n)).
+        
+        Raises:
+            ValueError: If d is less than 2
+        """
+        if d < 2:
+            raise ValueError(f"d must be at least 2, got {d}")
+        self.d = d
+        self._heap = []
+        self.heapify(values)
+    
+    def heapify(self, values: Iterable[Any]) -> None:
+        """Replace the contents with values, building the heap bottom-up. O(n)."""
+        self._heap = list(values)
+        if self.d == 2:
+            heapq.heapify(self._heap)
+            return
+        for i in reversed(range((len(self._heap) - 2) // self.d + 1)):
+            self._sift_down(i)
+    
+    def push(self, value: Any) -> None:
+        """Add an element. O(log_d n)."""
+        if self.d == 2:
+            heapq.heappush(self._heap, value)
+            return
+        self._heap.append(value)
+        self._sift_up(len(self._heap) - 1)
+    
+    def pop(self) -> Any:
+        """Remove and return the smallest element. O(d log_d n)."""
+        if not self._heap:
+            raise IndexError("Priority queue is empty")
+        if self.d == 2:
+            return heapq.heappop(self._heap)
+        last = self._heap.pop()
+        if not self._heap:
+            return last
+        smallest = self._heap[0]
+        self._heap[0] = last
+        self._sift_down(0)
+        return smallest
+    
+    def pushpop(self, value: Any) -> Any:
+        """Push value, then pop and return the smallest element (faster than the two calls)."""
+        if not self._heap or not self._heap[0] < value:
+            return value
+        if self.d == 2:
+            return heapq.heapreplace(self._heap, value)
+        smallest = self._heap[0]
+        self._heap[0] = value
+        self._sift_down(0)
+        return smallest
+    
+    def peek(self) -> Any:
+        """Return the smallest element without removing it. O(1)."""
+        if not self._heap:
+            raise IndexError("Priority queue is empty")
+        return self._heap[0]
+    
+    def is_empty(self) -> bool:
+        """Check if the queue is empty. O(1)."""
+        return not self._heap
+    
+    def size(self) -> int:
+        """Return the number of elements in the queue. O(1)."""
+        return len(self._heap)
+    
+    def __len__(self) -> int:
+        """Return the number of elements in the queue."""
+        return len(self._heap)
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the elements in heap (not sorted) order. O(n)."""
+        return iter(self._heap)
+    
+    def _sift_up(self, i: int) -> None:
+        """Move the element at slot i up until its parent is not larger."""
+        heap, d = self._heap, self.d
+        value = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if not value < heap[parent]:
+                break
+            heap[i] = heap[parent]
+            i = parent
+        heap[i] = value
+    
+    def _sift_down(self, i: int) -> None:
+        """Move the element at slot i down until no child is smaller."""
+        heap, d = self._heap, self.d
+        n = len(heap)
+        value = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for child in range(first + 1, min(first + d, n)):
+                if heap[child] < heap[best]:
+                    best = child
+            if not heap[best] < value:
+                break
+            heap[i] = heap[best]
+            i = best
+        heap[i] = value
+    
+    def __str__(self) -> str:
+        """String representation of the heap array."""
+        return str(self._heap)
+
+
+class IndexedPriorityQueue:
+    """
+    Min-priority queue whose entries can be reprioritized or removed.
+    
+    push returns a handle for the entry. Each entry records its own heap
+    slot, so decrease_key and remove find it in O(1) and only sift along one
+    path, which is what Dijkstra and Prim need instead of pushing duplicates.
+    
+    Time Complexity:
+        - Push/decrease_key: O(log_d n)
+        - Pop/remove: O(d log_d n)
+        - Peek/priority lookup: O(1)
+    """
+    
+    # Entry layout: [priority, handle, value, slot]
+    
+    def __init__(self, d: int = 2):
+        """
+        Initialize an empty queue on a d-ary heap.
+        
+        Raises:
+            ValueError: If d is less than 2
+        """
+        if d < 2:
+            raise ValueError(f"d must be at least 2, got {d}")
+        self.d = d
+        self._heap = []
+        self._entries = {}
+        self._next_handle = 0
+    
+    def push(self, value: Any, priority: Any) -> int:
+        """Add value with the given priority and return its handle. O(log_d n)."""
+        handle = self._next_handle
+        self._next_handle += 1
+        entry = [priority, handle, value, len(self._heap)]
+        self._entries[handle] = entry
+        self._heap.append(entry)
+        self._sift_up(entry[3])
+        return handle
+    
+    def pop(self) -> tuple:
+        """Remove the entry with the smallest priority and return (value, priority)."""
+        if not self._heap:
+            raise IndexError("Priority queue is empty")
+        entry = self._heap[0]
+        self._remove_slot(0)
+        return entry[2], entry[0]
+    
+    def peek(self) -> tuple:
+        """Return (value, priority) of the smallest entry without removing it. O(1)."""
+        if not self._heap:
+            raise IndexError("Priority queue is empty")
+        entry = self._heap[0]
+        return entry[2], entry[0]
+    
+    def priority(self, handle: int) -> Any:
+        """
+        Return the current priority of an entry. O(1).
+        
+        Raises:
+            KeyError: If the handle is not in the queue
+        """
+        return self._entries[handle][0]
+    
+    def decrease_key(self, handle: int, priority: Any) -> None:
+        """
+        Lower the priority of an entry. O(log_d n).
+        
+        Raises:
+            KeyError: If the handle is not in the queue
+            ValueError: If priority is larger than the current one
+        """
+        entry = self._entries[handle]
+        if entry[0] < priority:
+            raise ValueError(f"new priority {priority!r} is larger than {entry[0]!r}")
+        entry[0] = priority
+        self._sift_up(entry[3])
+    
+    def remove(self, handle: int) -> Any:
+        """
+        Remove an entry and return its value. O(d log_d n).
+        
+        Raises:
+            KeyError: If the handle is not in the queue
+        """
+        entry = self._entries[handle]
+        self._remove_slot(entry[3])
+        return entry[2]
+    
+    def is_empty(self) -> bool:
+        """Check if the queue is empty. O(1)."""
+        return not self._heap
+    
+    def size(self) -> int:
+        """Return the number of entries in the queue. O(1)."""
+        return len(self._heap)
+    
+    def __len__(self) -> int:
+        """Return the number of entries in the queue."""
+        return len(self._heap)
+    
+    def __contains__(self, handle: int) -> bool:
+        """Check if a handle is still in the queue. O(1)."""
+        return handle in self._entries
+    
+    def _remove_slot(self, i: int) -> None:
+        """Delete the entry at slot i, refilling the hole with the last entry."""
+        heap = self._heap
+        del self._entries[heap[i][1]]
+        last = heap.pop()
+        if i == len(heap):
+            return
+        heap[i] = last
+        last[3] = i
+        if i > 0 and last[0] < heap[(i - 1) // self.d][0]:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+    
+    def _sift_up(self, i: int) -> None:
+        """Move the entry at slot i up until its parent's priority is not larger."""
+        heap, d = self._heap, self.d
+        entry = heap[i]
+        priority = entry[0]
+        while i > 0:
+            parent = (i - 1) // d
+            above = heap[parent]
+            if not priority < above[0]:
+                break
+            heap[i] = above
+            above[3] = i
+            i = parent
+        heap[i] = entry
+        entry[3] = i
+    
+    def _sift_down(self, i: int) -> None:
+        """Move the entry at slot i down until no child has a smaller priority."""
+        heap, d = self._heap, self.d
+        n = len(heap)
+        entry = heap[i]
+        priority = entry[0]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for child in range(first + 1, min(first + d, n)):
+                if heap[child][0] < heap[best][0]:
+                    best = child
+            below = heap[best]
+            if not below[0] < priority:
+                break
+            heap[i] = below
+            below[3] = i
+            i = best
+        heap[i] = entry
+        entry[3] = i
 
 
 # ============================================================================
@@ -268,6 +2103,13 @@ class LinkedList:
         """Return the number of elements in the list."""
         return self._size
     
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values from head to tail in one traversal. O(n)."""
+        current = self.head
+        while current:
+            yield current.value
+            current = current.next
+    
     def append(self, value: Any) -> None:
         """Append element to the end of the list. O(1)."""
         new_node = ListNode(value)
@@ -9,17 +9,32 @@ Author: Carlos Gutierrez
 Course: MSCS532 - Data Structures and Algorithms
 """
 
+# Use try/except to support both relative and absolute imports
+try:
+    from .counting_select import counting_select, narrow_int_range
+    from .selection_utils import as_indexable, element_count, index_array, make_scratch
+except ImportError:
+    from src.counting_select import counting_select, narrow_int_range
+    from src.selection_utils import as_indexable, element_count, index_array, make_scratch
 
-def deterministic_select(arr: list, k: int, key=None) -> any:
+
+def deterministic_select(arr: list, k: int, key=None, in_place: bool = False, counting: bool = True) -> any:
     """
     Find the k-th smallest element in an array using deterministic selection
     (Median of Medians algorithm) in worst-case O(n) time.
     
+    Buffer-protocol inputs (array.array, memoryview, bytes, ...) are copied into
+    a typed array.array of the same format instead of a list of boxed objects.
+    Integer inputs whose value range is narrow are handed to counting_select.
+    
     Args:
-        arr: List of comparable elements
+        arr: List of comparable elements or a buffer-protocol object
         k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
         key: Optional function to extract comparison key from elements
-        
+        in_place: If True, partition arr itself (when mutable) instead of a copy
+        counting: If True and no key is given, integers with a narrow value
+            range are selected with a histogram in O(n + range) time
+            
     Returns:
         The k-th smallest element in the array
         
@@ -36,20 +51,24 @@ def deterministic_select(arr: list, k: int, key=None) -> any:
         >>> deterministic_select(arr, len(arr))
         9
     """
-    if not arr:
-        raise IndexError("Cannot select from empty array")
+    # Create a scratch copy (or reuse arr in place) to partition
+    arr_copy = make_scratch(arr, in_place)
     
-    n = len(arr)
+    n = len(arr_copy)
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
     if k < 1 or k > n:
         raise ValueError(f"k must be between 1 and {n}, got {k}")
     
+    if counting and key is None:
+        bounds = narrow_int_range(arr_copy)
+        if bounds is not None:
+            return counting_select(arr_copy, k, *bounds)
+    
     # Use key function if provided
     if key is None:
         key = lambda x: x
     
-    # Create a copy to avoid modifying the original array
-    arr_copy = list(arr)
-    
     return _deterministic_select_recursive(arr_copy, 0, n - 1, k, key)
 
 
@@ -186,7 +205,7 @@ def find_median(arr: list, key=None) -> any:
     Find the median of an array using deterministic selection.
     
     Args:
-        arr: List of comparable elements
+        arr: List of comparable elements or a buffer-protocol object
         key: Optional function to extract comparison key
         
     Returns:
@@ -198,10 +217,100 @@ def find_median(arr: list, key=None) -> any:
         >>> find_median([3, 1, 4, 1, 5, 9])
         3
     """
-    if not arr:
+    n = element_count(arr)
+    if n == 0:
         raise ValueError("Cannot find median of empty array")
     
-    n = len(arr)
     k = (n + 1) // 2  # Lower median for even-length arrays
     return deterministic_select(arr, k, key)
 
+
+
+def argselect(arr: list, k: int, key=None) -> int:
+    """
+    Find the original index of the k-th smallest element using deterministic
+    selection in worst-case O(n) time.
+    
+    Only a compact integer index array is partitioned; arr itself is never
+    copied or reordered. Ties are broken by original index, so the result is
+    the position the element would have after a stable sort.
+    
+    Args:
+        arr: Sequence of comparable elements or a buffer-protocol object
+        k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
+        key: Optional function to extract comparison key from elements
+        
+    Returns:
+        Index into arr of the k-th smallest element
+        
+    Raises:
+        ValueError: If k is out of range [1, len(arr)]
+        IndexError: If array is empty
+        
+    Examples:
+        >>> argselect([30, 10, 20], 1)
+        1
+        >>> argselect([30, 10, 20], 3)
+        0
+    """
+    return argselect_many(arr, [k], key)[0]
+
+
+def argselect_many(arr: list, ks: list, key=None) -> list:
+    """
+    Find the original indices of several order statistics in one pass.
+    
+    The index array is partitioned once, recursing only into the subranges
+    that still contain a requested rank.
+    
+    Args:
+        arr: Sequence of comparable elements or a buffer-protocol object
+        ks: Ranks to find (1-indexed, in any order, duplicates allowed)
+        key: Optional function to extract comparison key from elements
+        
+    Returns:
+        List of indices into arr, in the same order as ks
+        
+    Raises:
+        ValueError: If any k is out of range [1, len(arr)]
+        IndexError: If array is empty
+        
+    Examples:
+        >>> argselect_many([30, 10, 20, 40], [4, 1])
+        [3, 1]
+    """
+    data = as_indexable(arr)
+    n = len(data)
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
+    for k in ks:
+        if k < 1 or k > n:
+            raise ValueError(f"k must be between 1 and {n}, got {k}")
+    
+    if key is None:
+        index_key = lambda i: (data[i], i)
+    else:
+        index_key = lambda i: (key(data[i]), i)
+    
+    indices = index_array(n)
+    found = {}
+    pending = [(0, n - 1, sorted(set(ks)))]
+    while pending:
+        left, right, ranks = pending.pop()
+        if left == right:
+            found[left + 1] = indices[left]
+            continue
+        
+        pivot_index = _median_of_medians(indices, left, right, index_key)
+        pivot_index = _partition(indices, left, right, pivot_index, index_key)
+        
+        lower = [r for r in ranks if r - 1 < pivot_index]
+        upper = [r for r in ranks if r - 1 > pivot_index]
+        if len(lower) + len(upper) < len(ranks):
+            found[pivot_index + 1] = indices[pivot_index]
+        if lower:
+            pending.append((left, pivot_index - 1, lower))
+        if upper:
+            pending.append((pivot_index + 1, right, upper))
+    
+    return [found[k] for k in ks]
@@ -0,0 +1,179 @@
+"""
+Tiled and Parallel Matrix Multiplication over Semirings
+
+This module multiplies Matrix objects whose cells NumPy cannot handle
+(Fractions, Decimals, or values of a custom semiring) in pure Python.
+
+Matrix multiplication only needs an "addition" and a "multiplication", so
+the same kernel computes different things depending on the semiring:
+
+    PLUS_TIMES   (+, *)     the ordinary matrix product
+    MIN_PLUS     (min, +)   shortest paths: (D @ D)[i][j] is the shortest
+                            path of at most two hops in a distance matrix D
+    MAX_PLUS     (max, +)   longest/critical paths
+    BOOLEAN      (or, and)  reachability
+    
+The left operand is read as rows and the right one as columns, so every
+output cell is one pass over two contiguous lists. The output is split into
+block_size x block_size tiles. A tile is the unit of work handed to a worker
+process; within one process it keeps a band of rows and columns hot while
+they are reused. The operands are sent to each worker once, through the pool
+initializer, instead of with every tile.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import math
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Any, Callable, List, NamedTuple, Optional
+
+# Use try/except to support both relative and absolute imports
+try:
+    from .data_structures import Matrix
+except ImportError:
+    from src.data_structures import Matrix
+
+
+# Side length of the output tiles
+DEFAULT_BLOCK_SIZE = 64
+
+
+class Semiring(NamedTuple):
+    """
+    The operations a matrix product is computed with.
+    
+    add and multiply must be picklable (builtins or module-level functions)
+    to be used with worker processes. fold, if given, reduces an iterable
+    with add in one call (sum for +, min for min, ...) and is faster than
+    reducing with add pairwise.
+    """
+    add: Callable[[Any, Any], Any]
+    multiply: Callable[[Any, Any], Any]
+    zero: Any
+    fold: Optional[Callable[[Any], Any]] = None
+
+
+PLUS_TIMES = Semiring(operator.add, operator.mul, 0, sum)
+MIN_PLUS = Semiring(min, operator.add, math.inf, min)
+MAX_PLUS = Semiring(max, operator.add, -math.inf, max)
+BOOLEAN = Semiring(operator.or_, operator.and_, False, any)
+
+
+# Operands of the product a worker process is computing tiles for
+_operands = None
+
+
+def tiled_matmul(
+    a: Matrix,
+    b: Matrix,
+    semiring: Semiring = PLUS_TIMES,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> Matrix:
+    """
+    Multiply two matrices over a semiring tile by tile in this process.
+    
+    Args:
+        a: Left operand (n x m)
+        b: Right operand (m x p)
+        semiring: Operations to multiply with (the ordinary product by default)
+        block_size: Side length of the output tiles
+        
+    Returns:
+        The n x p product
+        
+    Raises:
+        ValueError: If a.cols != b.rows or block_size is not positive
+    """
+    return parallel_matmul(a, b, semiring, block_size, workers=1)
+
+
+def parallel_matmul(
+    a: Matrix,
+    b: Matrix,
+    semiring: Semiring = PLUS_TIMES,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    workers: Optional[int] = None
+) -> Matrix:
+    """
+    Multiply two matrices over a semiring, computing the output tiles in a
+    pool of worker processes.
+    
+    Each worker receives the operands once through the pool initializer and
+    returns whole tiles, so the work per message is block_size^2 * m
+    semiring operations.
+    
+    Args:
+        a: Left operand (n x m)
+        b: Right operand (m x p)
+        semiring: Operations to multiply with (the ordinary product by default)
+        block_size: Side length of the output tiles
+        workers: Number of worker processes (None uses every core; 1 runs in
+            this process without a pool)
+            
+    Returns:
+        The n x p product
+        
+    Raises:
+        ValueError: If a.cols != b.rows or block_size is not positive
+    """
+    if a.cols != b.rows:
+        raise ValueError(f"cannot multiply {a.rows}x{a.cols} by {b.rows}x{b.cols}")
+    if block_size < 1:
+        raise ValueError(f"block_size must be positive, got {block_size}")
+    
+    n, p = a.rows, b.cols
+    operands = (a.tolist(), b.T.tolist(), semiring)
+    tiles = [
+        (i, min(i + block_size, n), j, min(j + block_size, p))
+        for i in range(0, n, block_size)
+        for j in range(0, p, block_size)
+    ]
+    
+    if workers == 1 or len(tiles) <= 1:
+        _load_operands(*operands)
+        try:
+            results = list(map(_multiply_tile, tiles))
+        finally:
+            _load_operands(None, None, None)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_load_operands, initargs=operands) as pool:
+            results = list(pool.map(_multiply_tile, tiles))
+    
+    cells = [semiring.zero] * (n * p)
+    for (row_start, row_stop, col_start, col_stop), tile in zip(tiles, results):
+        for i, tile_row in zip(range(row_start, row_stop), tile):
+            cells[i * p + col_start:i * p + col_stop] = tile_row
+    return Matrix.from_iterable(cells, n, p)
+
+
+def _load_operands(rows: Any, columns: Any, semiring: Any) -> None:
+    """Store the operands for _multiply_tile (runs once per worker process)."""
+    global _operands
+    _operands = None if rows is None else (rows, columns, semiring)
+
+
+def _multiply_tile(tile: tuple) -> List[List[Any]]:
+    """Compute one output tile from the loaded operands."""
+    rows, columns, semiring = _operands
+    row_start, row_stop, col_start, col_stop = tile
+    tile_columns = columns[col_start:col_stop]
+    multiply = semiring.multiply
+    
+    if not tile_columns or not tile_columns[0]:
+        # Empty inner dimension: every cell is the additive identity
+        return [[semiring.zero] * len(tile_columns) for _ in range(row_start, row_stop)]
+    
+    if semiring.fold is not None:
+        fold = semiring.fold
+        return [
+            [fold(map(multiply, row, column)) for column in tile_columns]
+            for row in rows[row_start:row_stop]
+        ]
+    add = semiring.add
+    return [
+        [reduce(add, map(multiply, row, column)) for column in tile_columns]
+        for row in rows[row_start:row_stop]
+    ]
@@ -0,0 +1,210 @@
+"""
+Partial Sorting Built on Quickselect
+
+This module implements partial sorting (the k smallest elements in sorted order)
+and lazy sorted iteration. Quickselect isolates the prefix that is needed and
+only that prefix is sorted, giving O(n + k log k) expected time for a top-k
+listing instead of the O(n log n) of a full sort.
+
+That bound is asymptotic: CPython's sorted() runs its comparisons in C, so a
+Python-level quickselect only beats it through the fast paths partial_sort
+takes first (heapq.nsmallest for small k, a histogram for narrow-range ints).
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import heapq
+import random
+from collections import Counter
+from itertools import repeat
+from typing import Any, Iterator, List
+
+# Use try/except to support both relative and absolute imports
+try:
+    from .counting_select import narrow_int_range
+    from .selection_utils import make_scratch
+except ImportError:
+    from src.counting_select import narrow_int_range
+    from src.selection_utils import make_scratch
+
+
+# partial_sort uses heapq.nsmallest when k <= n // HEAP_FRACTION + HEAP_MIN_K
+HEAP_FRACTION = 32
+HEAP_MIN_K = 16
+
+
+def partial_sort(arr: list, k: int, key=None, seed=None) -> List[Any]:
+    """
+    Return the k smallest elements of an array in sorted order in expected
+    O(n + k log k) time.
+    
+    Small k (up to about n/32) goes to heapq.nsmallest, O(n log k), and
+    integers in a narrow range are counted in O(n + range); both beat
+    sorted() in CPython. Other inputs use quickselect, which only wins
+    asymptotically: for larger k, sorted(arr)[:k] is usually faster in CPython.
+    
+    Args:
+        arr: List of comparable elements or a buffer-protocol object
+        k: Number of smallest elements to return (0 <= k <= len(arr))
+        key: Optional function to extract comparison key from elements
+        seed: Optional random seed for reproducible results
+        
+    Returns:
+        List of the k smallest elements, sorted by key
+        
+    Raises:
+        ValueError: If k is out of range [0, len(arr)]
+        
+    Examples:
+        >>> partial_sort([3, 1, 4, 1, 5, 9, 2, 6], 3, seed=42)
+        [1, 1, 2]
+    """
+    scratch = make_scratch(arr)
+    n = len(scratch)
+    if k < 0 or k > n:
+        raise ValueError(f"k must be between 0 and {n}, got {k}")
+    if k == 0:
+        return []
+    if k <= n // HEAP_FRACTION + HEAP_MIN_K:
+        return heapq.nsmallest(k, scratch, key=key)
+    if key is None and narrow_int_range(scratch) is not None:
+        return _smallest_from_counts(Counter(scratch), k)
+    
+    if seed is not None:
+        random.seed(seed)
+    
+    if key is None:
+        key = lambda x: x
+    
+    _select_prefix(scratch, 0, n - 1, k - 1, key)
+    return sorted(scratch[:k], key=key)
+
+
+def iter_sorted(arr: list, key=None, seed=None, chunk_size: int = 16) -> Iterator[Any]:
+    """
+    Lazily yield the elements of an array in sorted order.
+    
+    This is incremental quicksort: a stack of pivot boundaries records how far
+    the unsorted tail has already been partitioned, so each element is only
+    partitioned again while it sits in front of the consumer. Once the next
+    unresolved run is at most chunk_size elements long it is sorted and
+    yielded as a chunk. Taking the first k elements costs expected
+    O(n + k log k) and draining the generator costs O(n log n).
+    
+    Args:
+        arr: List of comparable elements or a buffer-protocol object
+        key: Optional function to extract comparison key from elements
+        seed: Optional random seed for reproducible results
+        chunk_size: Largest run that is sorted directly instead of partitioned
+        
+    Yields:
+        Elements of arr in ascending order of key
+        
+    Examples:
+        >>> list(iter_sorted([3, 1, 2], seed=42))
+        [1, 2, 3]
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    
+    scratch = make_scratch(arr)
+    n = len(scratch)
+    
+    if seed is not None:
+        random.seed(seed)
+    
+    if key is None:
+        key = lambda x: x
+    
+    start = 0
+    bounds = [n]
+    while start < n:
+        bound = bounds[-1]
+        if bound == start:
+            bounds.pop()
+            continue
+        
+        if bound - start <= chunk_size:
+            yield from sorted(scratch[start:bound], key=key)
+            start = bound
+            bounds.pop()
+            continue
+        
+        pivot_key = key(scratch[random.randint(start, bound - 1)])
+        lt, gt = _partition3(scratch, start, bound - 1, pivot_key, key)
+        if lt == start:
+            # Nothing is smaller than the pivot: the equal run is final
+            for i in range(lt, gt + 1):
+                yield scratch[i]
+            start = gt + 1
+        else:
+            bounds.append(gt + 1)
+            bounds.append(lt)
+
+
+def _smallest_from_counts(counts: Counter, k: int) -> List[Any]:
+    """Expand the k smallest values of a histogram into a sorted list."""
+    result = []
+    for value in sorted(counts):
+        result.extend(repeat(value, min(counts[value], k - len(result))))
+        if len(result) == k:
+            break
+    return result
+
+
+def _select_prefix(arr: list, left: int, right: int, target: int, key) -> None:
+    """
+    Rearrange arr[left:right+1] so that arr[target] holds the element of that
+    rank and every element before it is no greater.
+    
+    Args:
+        arr: The array (will be modified during partitioning)
+        left: Left index of the subarray
+        right: Right index of the subarray
+        target: Absolute index whose final sorted element is wanted
+        key: Function to extract comparison key
+    """
+    while left < right:
+        pivot_key = key(arr[random.randint(left, right)])
+        lt, gt = _partition3(arr, left, right, pivot_key, key)
+        
+        if target < lt:
+            right = lt - 1
+        elif target > gt:
+            left = gt + 1
+        else:
+            return
+
+
+def _partition3(arr: list, left: int, right: int, pivot_key: Any, key) -> tuple:
+    """
+    Three-way partition of arr[left:right+1] around a pivot key.
+    
+    Elements less than the pivot go to the left, equal elements to the middle
+    and greater elements to the right, so runs of duplicates are never
+    partitioned again.
+    
+    Args:
+        arr: The array to partition
+        left: Left index of the subarray
+        right: Right index of the subarray
+        pivot_key: Comparison key of the pivot
+        key: Function to extract comparison key
+        
+    Returns:
+        Tuple (lt, gt) such that arr[lt:gt+1] are the elements equal to the pivot
+    """
+    lt, i, gt = left, left, right
+    while i <= gt:
+        item_key = key(arr[i])
+        if item_key < pivot_key:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot_key < item_key:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
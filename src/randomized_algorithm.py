@@ -11,18 +11,33 @@ Course: MSCS532 - Data Structures and Algorithms
 
 import random
 
+# Use try/except to support both relative and absolute imports
+try:
+    from .counting_select import counting_select, narrow_int_range
+    from .selection_utils import as_indexable, element_count, index_array, make_scratch
+except ImportError:
+    from src.counting_select import counting_select, narrow_int_range
+    from src.selection_utils import as_indexable, element_count, index_array, make_scratch
 
-def randomized_select(arr: list, k: int, key=None, seed=None) -> any:
+
+def randomized_select(arr: list, k: int, key=None, seed=None, in_place: bool = False, counting: bool = True) -> any:
     """
     Find the k-th smallest element in an array using randomized selection
     (Quickselect algorithm) in expected O(n) time.
     
+    Buffer-protocol inputs (array.array, memoryview, bytes, ...) are copied into
+    a typed array.array of the same format instead of a list of boxed objects.
+    Integer inputs whose value range is narrow are handed to counting_select.
+    
     Args:
-        arr: List of comparable elements
+        arr: List of comparable elements or a buffer-protocol object
         k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
         key: Optional function to extract comparison key from elements
         seed: Optional random seed for reproducible results
-        
+        in_place: If True, partition arr itself (when mutable) instead of a copy
+        counting: If True and no key is given, integers with a narrow value
+            range are selected with a histogram in O(n + range) time
+            
     Returns:
         The k-th smallest element in the array
         
@@ -39,13 +54,20 @@ def randomized_select(arr: list, k: int, key=None, seed=None) -> any:
         >>> randomized_select(arr, len(arr), seed=42)
         9
     """
-    if not arr:
-        raise IndexError("Cannot select from empty array")
+    # Create a scratch copy (or reuse arr in place) to partition
+    arr_copy = make_scratch(arr, in_place)
     
-    n = len(arr)
+    n = len(arr_copy)
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
     if k < 1 or k > n:
         raise ValueError(f"k must be between 1 and {n}, got {k}")
     
+    if counting and key is None:
+        bounds = narrow_int_range(arr_copy)
+        if bounds is not None:
+            return counting_select(arr_copy, k, *bounds)
+    
     # Set random seed if provided
     if seed is not None:
         random.seed(seed)
@@ -54,9 +76,6 @@ def randomized_select(arr: list, k: int, key=None, seed=None) -> any:
     if key is None:
         key = lambda x: x
     
-    # Create a copy to avoid modifying the original array
-    arr_copy = list(arr)
-    
     return _randomized_select_recursive(arr_copy, 0, n - 1, k, key)
 
 
@@ -134,7 +153,7 @@ def find_median(arr: list, key=None, seed=None) -> any:
     Find the median of an array using randomized selection.
     
     Args:
-        arr: List of comparable elements
+        arr: List of comparable elements or a buffer-protocol object
         key: Optional function to extract comparison key
         seed: Optional random seed for reproducible results
         
@@ -147,10 +166,105 @@ def find_median(arr: list, key=None, seed=None) -> any:
         >>> find_median([3, 1, 4, 1, 5, 9], seed=42)
         3
     """
-    if not arr:
+    n = element_count(arr)
+    if n == 0:
         raise ValueError("Cannot find median of empty array")
     
-    n = len(arr)
     k = (n + 1) // 2  # Lower median for even-length arrays
     return randomized_select(arr, k, key, seed)
 
+
+
+def argselect(arr: list, k: int, key=None, seed=None) -> int:
+    """
+    Find the original index of the k-th smallest element using randomized
+    selection in expected O(n) time.
+    
+    Only a compact integer index array is partitioned; arr itself is never
+    copied or reordered. Ties are broken by original index, so the result is
+    the position the element would have after a stable sort.
+    
+    Args:
+        arr: Sequence of comparable elements or a buffer-protocol object
+        k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
+        key: Optional function to extract comparison key from elements
+        seed: Optional random seed for reproducible results
+        
+    Returns:
+        Index into arr of the k-th smallest element
+        
+    Raises:
+        ValueError: If k is out of range [1, len(arr)]
+        IndexError: If array is empty
+        
+    Examples:
+        >>> argselect([30, 10, 20], 1, seed=42)
+        1
+        >>> argselect([30, 10, 20], 3, seed=42)
+        0
+    """
+    return argselect_many(arr, [k], key, seed)[0]
+
+
+def argselect_many(arr: list, ks: list, key=None, seed=None) -> list:
+    """
+    Find the original indices of several order statistics in one pass.
+    
+    The index array is partitioned once, recursing only into the subranges
+    that still contain a requested rank.
+    
+    Args:
+        arr: Sequence of comparable elements or a buffer-protocol object
+        ks: Ranks to find (1-indexed, in any order, duplicates allowed)
+        key: Optional function to extract comparison key from elements
+        seed: Optional random seed for reproducible results
+        
+    Returns:
+        List of indices into arr, in the same order as ks
+        
+    Raises:
+        ValueError: If any k is out of range [1, len(arr)]
+        IndexError: If array is empty
+        
+    Examples:
+        >>> argselect_many([30, 10, 20, 40], [4, 1], seed=42)
+        [3, 1]
+    """
+    data = as_indexable(arr)
+    n = len(data)
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
+    for k in ks:
+        if k < 1 or k > n:
+            raise ValueError(f"k must be between 1 and {n}, got {k}")
+    
+    if seed is not None:
+        random.seed(seed)
+    
+    if key is None:
+        index_key = lambda i: (data[i], i)
+    else:
+        index_key = lambda i: (key(data[i]), i)
+    
+    indices = index_array(n)
+    found = {}
+    pending = [(0, n - 1, sorted(set(ks)))]
+    while pending:
+        left, right, ranks = pending.pop()
+        if left == right:
+            found[left + 1] = indices[left]
+            continue
+        
+        pivot_index = random.randint(left, right)
+        pivot_index = _partition(indices, left, right, pivot_index, index_key)
+        
+        lower = [r for r in ranks if r - 1 < pivot_index]
+        upper = [r for r in ranks if r - 1 > pivot_index]
+        if len(lower) + len(upper) < len(ranks):
+            found[pivot_index + 1] = indices[pivot_index]
+        if lower:
+            pending.append((left, pivot_index - 1, lower))
+        if upper:
+            pending.append((pivot_index + 1, right, upper))
+    
+    return [found[k] for k in ks]
@@ -0,0 +1,457 @@
+"""
+Cost-Based Selection Planner
+
+This module provides a single front door, select(), that inspects cheap signals
+about the input (size, how close k is to either end, integer value range,
+sampled duplicate ratio and sampled sortedness) and dispatches to the engine
+that is fastest for it in CPython:
+
+    - 'counting':      histogram over a narrow integer range, O(n + range)
+    - 'radix':         byte-wise radix passes for large wide-range integers
+    - 'heap':          heapq.nsmallest/nlargest when k is near either end
+    - 'sort':          the built-in Timsort (C code, O(n) on presorted runs)
+    - 'randomized':    Quickselect, for large inputs with expensive comparisons
+    - 'deterministic': Median of Medians, never chosen automatically
+    
+Every call records the engine it chose in the planner's history.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import heapq
+from collections import Counter, deque
+from typing import Any, Dict, List, NamedTuple, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch selection falls back to a loop
+    np = None
+
+# Use try/except to support both relative and absolute imports
+try:
+    from .counting_select import int_range, radix_select, select_from_counts
+    from .deterministic_algorithm import deterministic_select, argselect_many as deterministic_argselect_many
+    from .randomized_algorithm import randomized_select, argselect_many as randomized_argselect_many
+    from .selection_utils import make_scratch, numeric_matrix
+except ImportError:
+    from src.counting_select import int_range, radix_select, select_from_counts
+    from src.deterministic_algorithm import deterministic_select, argselect_many as deterministic_argselect_many
+    from src.randomized_algorithm import randomized_select, argselect_many as randomized_argselect_many
+    from src.selection_utils import make_scratch, numeric_matrix
+
+
+STRATEGIES = ('auto', 'counting', 'radix', 'heap', 'sort', 'randomized', 'deterministic')
+
+# Thresholds below were calibrated on CPython 3.11 with the benchmark matrix
+# in benchmark.benchmark_selection_planner.
+
+# Inputs this small are always sorted
+SMALL_INPUT = 32
+
+# Use heapq when min(k, n - k + 1) <= n // HEAP_FRACTION + HEAP_MIN_K
+HEAP_FRACTION = 64
+HEAP_MIN_K = 16
+
+# Integer range is narrow (histogram wins) when hi - lo < COUNTING_RANGE_FACTOR * n
+COUNTING_RANGE_FACTOR = 4
+
+# Radix passes beat Timsort on wide-range integers from this size on
+RADIX_MIN_SIZE = 500_000
+
+# Quickselect beats Timsort on objects with costly comparisons from this size on
+QUICKSELECT_MIN_SIZE = 500_000
+
+# Sampled adjacent pairs in order (either direction) above this ratio count as presorted
+PRESORTED_RATIO = 0.9
+
+# Sampled duplicate ratio above which Lomuto quickselect degrades
+DUPLICATE_RATIO = 0.5
+
+# Number of elements / adjacent pairs sampled for the signals
+SAMPLE_SIZE = 64
+
+
+class SelectionPlan(NamedTuple):
+    """The engine chosen for one call and the signals that led to it."""
+    engine: str
+    n: int
+    k: int
+    signals: Dict[str, Any]
+
+
+class SelectionPlanner:
+    """
+    Chooses a selection engine per call and records every choice.
+    
+    Attributes:
+        history: The most recent SelectionPlan records, oldest first
+    """
+    
+    def __init__(self, history_size: int = 1000):
+        """Initialize a planner that keeps the last history_size plans."""
+        self.history = deque(maxlen=history_size)
+    
+    def plan(self, arr: Any, ks: List[int], key=None) -> SelectionPlan:
+        """
+        Choose the engine for selecting ranks ks from arr without running it.
+        
+        Args:
+            arr: Sequence of comparable elements (already a scratch copy)
+            ks: Requested ranks (1-indexed)
+            key: Optional function to extract comparison key from elements
+            
+        Returns:
+            A SelectionPlan naming the engine
+        """
+        return self._plan(arr, ks, key)[0]
+    
+    def _plan(self, arr: Any, ks: List[int], key) -> tuple:
+        """
+        Choose the engine and return (plan, histogram).
+        
+        The histogram is the Counter built while confirming a narrow integer
+        range; it is handed to the counting engine so the data is only
+        counted once, and it is None for every other engine.
+        """
+        n = len(arr)
+        k = ks[0] if len(ks) == 1 else ks[len(ks) // 2]
+        signals = {}
+        
+        if n <= SMALL_INPUT:
+            return SelectionPlan('sort', n, k, signals), None
+        
+        edge = max(min(r, n - r + 1) for r in ks)
+        signals['edge'] = edge
+        if len(ks) == 1 and edge <= n // HEAP_FRACTION + HEAP_MIN_K:
+            return SelectionPlan('heap', n, k, signals), None
+        
+        sample = _sample(arr, key)
+        signals['sortedness'] = _sortedness(arr, key)
+        signals['duplicates'] = _duplicate_ratio(sample)
+        if signals['sortedness'] >= PRESORTED_RATIO:
+            # Timsort merges presorted runs in O(n)
+            return SelectionPlan('sort', n, k, signals), None
+        
+        if key is None and all(type(x) is int for x in sample):
+            if max(sample) - min(sample) < COUNTING_RANGE_FACTOR * n:
+                # The sample suggests a narrow range: count once and confirm
+                # it on the distinct values only
+                counts = Counter(arr)
+                if set(map(type, counts)) == {int}:
+                    lo, hi = min(counts), max(counts)
+                    signals['int_range'] = hi - lo
+                    if hi - lo < COUNTING_RANGE_FACTOR * n:
+                        return SelectionPlan('counting', n, k, signals), counts
+            elif n >= RADIX_MIN_SIZE:
+                bounds = int_range(arr)
+                if bounds is not None and -2 ** 63 <= bounds[0] and bounds[1] < 2 ** 63:
+                    signals['int_range'] = bounds[1] - bounds[0]
+                    return SelectionPlan('radix', n, k, signals), None
+            return SelectionPlan('sort', n, k, signals), None
+        
+        numeric = key is None and all(type(x) is float for x in sample)
+        if (not numeric and n >= QUICKSELECT_MIN_SIZE
+                and signals['duplicates'] < DUPLICATE_RATIO):
+            return SelectionPlan('randomized', n, k, signals), None
+        return SelectionPlan('sort', n, k, signals), None
+    
+    def select(self, arr: Any, k: int, strategy: str = 'auto', key=None, seed=None) -> Any:
+        """
+        Find the k-th smallest element with the chosen (or planned) engine.
+        
+        Args:
+            arr: Sequence of comparable elements or a buffer-protocol object
+            k: The k-th smallest element to find (1-indexed)
+            strategy: 'auto' or one of the engine names in STRATEGIES
+            key: Optional function to extract comparison key from elements
+            seed: Optional random seed for the randomized engine
+            
+        Returns:
+            The k-th smallest element in the array
+        """
+        return self.select_many(arr, [k], strategy, key, seed)[0]
+    
+    def select_many(self, arr: Any, ks: List[int], strategy: str = 'auto', key=None, seed=None) -> List[Any]:
+        """
+        Find several order statistics with one engine run.
+        
+        Args:
+            arr: Sequence of comparable elements or a buffer-protocol object
+            ks: Ranks to find (1-indexed, in any order, duplicates allowed)
+            strategy: 'auto' or one of the engine names in STRATEGIES
+            key: Optional function to extract comparison key from elements
+            seed: Optional random seed for the randomized engine
+            
+        Returns:
+            List of elements, in the same order as ks
+            
+        Raises:
+            ValueError: If strategy is unknown, an engine does not apply to
+                the input, or any k is out of range
+            IndexError: If array is empty
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+        
+        scratch = make_scratch(arr)
+        n = len(scratch)
+        if n == 0:
+            raise IndexError("Cannot select from empty array")
+        ks = list(ks)
+        if not ks:
+            return []
+        for k in ks:
+            if k < 1 or k > n:
+                raise ValueError(f"k must be between 1 and {n}, got {k}")
+        
+        counts = None
+        if strategy == 'auto':
+            plan, counts = self._plan(scratch, ks, key)
+        else:
+            plan = SelectionPlan(strategy, n, ks[0], {})
+        if plan.engine in ('counting', 'radix'):
+            if key is not None:
+                raise ValueError(f"the {plan.engine} engine does not support a key function")
+            if counts is None and int_range(scratch) is None:
+                raise ValueError(f"the {plan.engine} engine only applies to plain integers")
+        self.history.append(plan)
+        
+        if plan.engine == 'counting':
+            return select_from_counts(counts if counts is not None else Counter(scratch), ks)
+        return _ENGINES[plan.engine](scratch, ks, key, seed)
+    
+    @property
+    def last_plan(self) -> Optional[SelectionPlan]:
+        """The plan recorded for the most recent call, or None."""
+        return self.history[-1] if self.history else None
+
+
+def _sample(arr: Any, key) -> List[Any]:
+    """Return the keys of up to SAMPLE_SIZE evenly spaced elements."""
+    n = len(arr)
+    step = max(1, n // SAMPLE_SIZE)
+    items = [arr[i] for i in range(0, n, step)][:SAMPLE_SIZE]
+    return items if key is None else [key(x) for x in items]
+
+
+def _sortedness(arr: Any, key) -> float:
+    """
+    Estimate presortedness from evenly spaced adjacent pairs.
+    
+    Returns the larger of the ascending and descending fractions, so reverse
+    sorted input (which Timsort also handles in O(n)) scores high as well.
+    """
+    n = len(arr)
+    step = max(1, (n - 1) // SAMPLE_SIZE)
+    ascending = descending = pairs = 0
+    for i in range(0, n - 1, step):
+        a, b = arr[i], arr[i + 1]
+        if key is not None:
+            a, b = key(a), key(b)
+        pairs += 1
+        if not b < a:
+            ascending += 1
+        if not a < b:
+            descending += 1
+    return max(ascending, descending) / pairs if pairs else 1.0
+
+
+def _duplicate_ratio(sample: List[Any]) -> float:
+    """Return the fraction of repeated keys in a sample (0.0 if unhashable)."""
+    if not sample:
+        return 0.0
+    try:
+        return 1 - len(set(sample)) / len(sample)
+    except TypeError:
+        return 0.0
+
+
+def _run_radix(arr, ks, key, seed):
+    """Engine: radix passes per rank."""
+    return [radix_select(arr, k) for k in ks]
+
+
+def _run_heap(arr, ks, key, seed):
+    """Engine: heapq.nsmallest or nlargest, whichever end k is closer to."""
+    n = len(arr)
+    results = []
+    for k in ks:
+        if k <= n - k + 1:
+            results.append(heapq.nsmallest(k, arr, key=key)[-1])
+        else:
+            results.append(heapq.nlargest(n - k + 1, arr, key=key)[-1])
+    return results
+
+
+def _run_sort(arr, ks, key, seed):
+    """Engine: one Timsort answers every rank."""
+    ordered = sorted(arr, key=key)
+    return [ordered[k - 1] for k in ks]
+
+
+def _run_randomized(arr, ks, key, seed):
+    """Engine: Quickselect (index-array multi-select for several ranks)."""
+    if len(ks) == 1:
+        return [randomized_select(arr, ks[0], key=key, seed=seed, in_place=True, counting=False)]
+    return [arr[i] for i in randomized_argselect_many(arr, ks, key=key, seed=seed)]
+
+
+def _run_deterministic(arr, ks, key, seed):
+    """Engine: Median of Medians (index-array multi-select for several ranks)."""
+    if len(ks) == 1:
+        return [deterministic_select(arr, ks[0], key=key, in_place=True, counting=False)]
+    return [arr[i] for i in deterministic_argselect_many(arr, ks, key=key)]
+
+
+# The counting engine is dispatched in select_many so it can reuse the plan's histogram
+_ENGINES = {
+    'radix': _run_radix,
+    'heap': _run_heap,
+    'sort': _run_sort,
+    'randomized': _run_randomized,
+    'deterministic': _run_deterministic,
+}
+
+
+# Planner used by the module-level select() and select_many()
+default_planner = SelectionPlanner()
+
+
+def select(arr: Any, k: int, strategy: str = 'auto', key=None, seed=None) -> Any:
+    """
+    Find the k-th smallest element, letting the planner pick the engine.
+    
+    Args:
+        arr: Sequence of comparable elements or a buffer-protocol object
+        k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
+        strategy: 'auto' (default) or an engine name from STRATEGIES
+        key: Optional function to extract comparison key from elements
+        seed: Optional random seed for the randomized engine
+        
+    Returns:
+        The k-th smallest element in the array
+        
+    Raises:
+        ValueError: If k is out of range or strategy does not apply
+        IndexError: If array is empty
+        
+    Examples:
+        >>> select([3, 1, 4, 1, 5, 9, 2, 6], 4)
+        3
+        >>> default_planner.last_plan.engine
+        'sort'
+    """
+    return default_planner.select(arr, k, strategy, key, seed)
+
+
+def select_many(arr: Any, ks: List[int], strategy: str = 'auto', key=None, seed=None) -> List[Any]:
+    """
+    Find several order statistics with a single engine run.
+    
+    Args:
+        arr: Sequence of comparable elements or a buffer-protocol object
+        ks: Ranks to find (1-indexed, in any order, duplicates allowed)
+        strategy: 'auto' (default) or an engine name from STRATEGIES
+        key: Optional function to extract comparison key from elements
+        seed: Optional random seed for the randomized engine
+        
+    Returns:
+        List of elements, in the same order as ks
+        
+    Examples:
+        >>> select_many([30, 10, 20, 40], [1, 4])
+        [10, 40]
+    """
+    return default_planner.select_many(arr, ks, strategy, key, seed)
+
+
+def batch_select(sequences: List[Any], ks: Any, key=None) -> List[Any]:
+    """
+    Run one independent selection per sequence in a single call.
+    
+    Equally long numeric sequences (without a key) are selected together with
+    one vectorized NumPy pass; anything else goes through select() per
+    sequence.
+    
+    Args:
+        sequences: Sequences of comparable elements
+        ks: One rank applied to every sequence, or a list with one rank per
+            sequence (1-indexed)
+        key: Optional function to extract comparison key from elements
+        
+    Returns:
+        List with the selected element of each sequence
+        
+    Raises:
+        ValueError: If ks does not match sequences or a k is out of range
+        IndexError: If a sequence is empty
+        
+    Examples:
+        >>> batch_select([[3, 1, 2], [9, 7, 8]], 1)
+        [1, 7]
+        >>> batch_select([[3, 1, 2], [9, 7, 8]], [3, 2])
+        [3, 8]
+    """
+    sequences = list(sequences)
+    if isinstance(ks, int):
+        ks = [ks] * len(sequences)
+    elif len(ks) != len(sequences):
+        raise ValueError(f"expected {len(sequences)} ranks, got {len(ks)}")
+    for seq, k in zip(sequences, ks):
+        _check_rank(len(seq), k)
+    
+    if key is None:
+        matrix = numeric_matrix(sequences)
+        if matrix is not None:
+            if len(set(ks)) == 1:
+                column = ks[0] - 1
+                return np.partition(matrix, column, axis=1)[:, column].tolist()
+            rows = np.arange(len(sequences))
+            return np.sort(matrix, axis=1)[rows, np.array(ks) - 1].tolist()
+    
+    return [default_planner.select(seq, k, key=key) for seq, k in zip(sequences, ks)]
+
+
+def batch_select_many(sequences: List[Any], ks: List[int], key=None) -> List[List[Any]]:
+    """
+    Select the same set of ranks from every sequence in a single call.
+    
+    Args:
+        sequences: Sequences of comparable elements
+        ks: Ranks to find in each sequence (1-indexed)
+        key: Optional function to extract comparison key from elements
+        
+    Returns:
+        One list per sequence with the elements for ks, in order
+        
+    Raises:
+        ValueError: If a k is out of range
+        IndexError: If a sequence is empty
+        
+    Examples:
+        >>> batch_select_many([[3, 1, 2], [9, 7, 8]], [1, 3])
+        [[1, 3], [7, 9]]
+    """
+    sequences = list(sequences)
+    ks = list(ks)
+    for seq in sequences:
+        for k in ks:
+            _check_rank(len(seq), k)
+    
+    if key is None and ks:
+        matrix = numeric_matrix(sequences)
+        if matrix is not None:
+            columns = [k - 1 for k in ks]
+            partitioned = np.partition(matrix, sorted(set(columns)), axis=1)
+            return partitioned[:, columns].tolist()
+    
+    return [default_planner.select_many(seq, ks, key=key) for seq in sequences]
+
+
+def _check_rank(n: int, k: int) -> None:
+    """Raise the selection errors for an empty sequence or an out-of-range k."""
+    if n == 0:
+        raise IndexError("Cannot select from empty array")
+    if k < 1 or k > n:
+        raise ValueError(f"k must be between 1 and {n}, got {k}")
@@ -0,0 +1,415 @@
+"""
+Asyncio Selection Query Service
+
+This module serves order-statistic queries over named in-memory datasets on a
+TCP socket. The protocol is one JSON object per line in each direction:
+
+    {"op": "upload", "name": "latency", "data": [12, 7, 31, ...]}
+    {"op": "kth", "name": "latency", "k": 10, "id": 1}
+    {"op": "median", "name": "latency", "id": 2}
+    {"op": "quantiles", "name": "latency", "qs": [0.5, 0.99], "id": 3}
+    {"op": "drop", "name": "latency"}
+    {"op": "stats"}
+    
+Every response echoes the request "id" (if any) and carries "ok", either
+"result" or "error", and "latency_ms". Requests on one connection are handled
+concurrently, so responses may arrive out of order; clients match them by id.
+
+Datasets are uploaded once and stored compactly (array.array for numbers).
+Queries against the same dataset that arrive while a batch is pending are
+coalesced into one select_many pass. Large batches run in a process pool so
+the event loop keeps accepting queries; small ones are cheaper to run inline
+than to ship to a worker. A numeric dataset is copied into shared memory the
+first time a worker needs it and workers keep it attached, so each batch
+sends only the segment name and the ranks. Large non-numeric datasets cannot
+live in shared memory and are still pickled to the worker with each batch.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# Use try/except to support both relative and absolute imports
+try:
+    from .selection_planner import select_many
+    from .selection_utils import quantile_rank
+    from .shared_array import SharedDynamicArray
+except ImportError:
+    from src.selection_planner import select_many
+    from src.selection_utils import quantile_rank
+    from src.shared_array import SharedDynamicArray
+
+
+# Batches over datasets smaller than this run on the event loop thread
+INLINE_MAX_SIZE = 20_000
+
+# Largest accepted request line (uploads carry the whole dataset)
+MAX_LINE_BYTES = 1 << 26
+
+
+# Shared datasets this worker process has attached, by segment name
+_ATTACHED: Dict[str, SharedDynamicArray] = {}
+
+
+def _run_batch(data: Any, ks: List[int]) -> List[Any]:
+    """Answer a coalesced batch of ranks; runs inline or in the executor."""
+    return select_many(data, ks)
+
+
+def _run_shared_batch(segment: str, ks: List[int], live: Tuple[str, ...]) -> List[Any]:
+    """
+    Answer a coalesced batch of ranks over a dataset in shared memory; runs
+    in a worker process.
+    
+    The worker stays attached between batches. Attachments to segments not
+    in live (dropped or replaced datasets) are closed first.
+    """
+    for name in [name for name in _ATTACHED if name not in live]:
+        _ATTACHED.pop(name).close()
+    shared = _ATTACHED.get(segment)
+    if shared is None:
+        shared = _ATTACHED[segment] = SharedDynamicArray.attach(segment)
+    return shared.consistent_read(lambda view: select_many(view, ks))
+
+
+def _compact(values: List[Any]) -> Any:
+    """Store a dataset as array.array when it is purely int or float."""
+    types = set(map(type, values))
+    if types == {float}:
+        return array.array('d', values)
+    if types == {int}:
+        try:
+            return array.array('q', values)
+        except OverflowError:
+            pass
+    return list(values)
+
+
+class SelectionServer:
+    """
+    Order-statistic query server over named in-memory datasets.
+    
+    Args:
+        executor: Executor for large batches; a ProcessPoolExecutor is created
+            (and shut down on close) when omitted
+        max_workers: Worker count for the default process pool
+        coalesce_delay: Seconds a new batch waits for more queries to join it
+            (0 still coalesces queries that are already queued on the loop)
+        history_size: Number of recent query latencies kept in history
+    """
+    
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        coalesce_delay: float = 0.0,
+        history_size: int = 1000
+    ):
+        self.datasets: Dict[str, Any] = {}
+        self.coalesce_delay = coalesce_delay
+        self.history = deque(maxlen=history_size)
+        self.batches = 0
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        self._pending: Dict[str, List[Tuple[List[int], asyncio.Future]]] = {}
+        self._shared: Dict[str, SharedDynamicArray] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+    
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        """Start listening; port 0 picks a free port (see the port property)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_LINE_BYTES
+        )
+    
+    @property
+    def port(self) -> int:
+        """Port the server is listening on."""
+        return self._server.sockets[0].getsockname()[1]
+    
+    async def close(self) -> None:
+        """
+        Stop listening, close open connections once their in-flight requests
+        are answered and shut down the executor if the server created it.
+        """
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for name in list(self._shared):
+            self._release(name)
+    
+    async def __aenter__(self) -> 'SelectionServer':
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read request lines and answer each one in its own task."""
+        connection = asyncio.current_task()
+        self._connections[connection] = writer
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.ensure_future(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            del self._connections[connection]
+            writer.close()
+    
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        """Handle one request line and write its response."""
+        start = time.perf_counter()
+        request = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            result = await self.handle(request)
+            response = {'ok': True, 'result': result}
+        except Exception as error:
+            # Any failure is reported to the client instead of dropping the request
+            message = error.args[0] if isinstance(error, KeyError) and error.args else str(error)
+            response = {'ok': False, 'error': f"{type(error).__name__}: {message}"}
+        
+        latency = time.perf_counter() - start
+        if 'id' in request:
+            response['id'] = request['id']
+        response['latency_ms'] = latency * 1000
+        self.history.append((request.get('op'), request.get('name'), latency))
+        
+        writer.write(json.dumps(response).encode() + b'\n')
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+    
+    async def handle(self, request: Dict[str, Any]) -> Any:
+        """
+        Execute one decoded request and return its result.
+        
+        Raises:
+            KeyError: If a required field or the dataset is missing
+            ValueError: If the operation is unknown or a rank is out of range
+        """
+        op = request.get('op')
+        if op == 'stats':
+            return self.stats()
+        name = request['name']
+        if op == 'upload':
+            return self.upload(name, request['data'])
+        if op == 'drop':
+            if self.datasets.pop(name, None) is None:
+                raise KeyError(f"unknown dataset {name!r}")
+            self._release(name)
+            return True
+        
+        data = self._dataset(name)
+        n = len(data)
+        if op == 'kth':
+            ks = [request['k']]
+        elif op == 'median':
+            ks = [(n + 1) // 2]  # Lower median for even-length datasets
+        elif op == 'quantiles':
+            ks = [quantile_rank(q, n) for q in request['qs']]
+        else:
+            raise ValueError(f"unknown op {op!r}")
+        
+        for k in ks:
+            if not isinstance(k, int) or isinstance(k, bool) or k < 1 or k > n:
+                raise ValueError(f"k must be between 1 and {n}, got {k}")
+        
+        values = await self._query(name, ks)
+        return values if op == 'quantiles' else values[0]
+    
+    def upload(self, name: str, data: List[Any]) -> int:
+        """Store (or replace) a dataset and return its size."""
+        if not isinstance(data, list) or not data:
+            raise ValueError("data must be a non-empty list")
+        self._release(name)
+        self.datasets[name] = _compact(data)
+        return len(data)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return dataset sizes, the batch count and recent latency figures."""
+        latencies = sorted(entry[2] for entry in self.history)
+        summary = {
+            'datasets': {name: len(data) for name, data in self.datasets.items()},
+            'requests': len(latencies),
+            'batches': self.batches
+        }
+        if latencies:
+            summary['latency_ms'] = {
+                'p50': latencies[quantile_rank(0.5, len(latencies)) - 1] * 1000,
+                'p99': latencies[quantile_rank(0.99, len(latencies)) - 1] * 1000,
+                'max': latencies[-1] * 1000
+            }
+        return summary
+    
+    def _dataset(self, name: str) -> Any:
+        """Return a stored dataset, raising KeyError if it does not exist."""
+        try:
+            return self.datasets[name]
+        except KeyError:
+            raise KeyError(f"unknown dataset {name!r}") from None
+    
+    def _share(self, name: str, data: array.array) -> str:
+        """Copy a numeric dataset into shared memory (once) and return the segment name."""
+        shared = self._shared.get(name)
+        if shared is None:
+            shared = SharedDynamicArray(data.typecode, len(data))
+            shared.extend(data)
+            self._shared[name] = shared
+        return shared.name
+    
+    def _release(self, name: str) -> None:
+        """Destroy a dataset's shared copy, if it has one."""
+        shared = self._shared.pop(name, None)
+        if shared is not None:
+            shared.unlink()
+    
+    async def _query(self, name: str, ks: List[int]) -> List[Any]:
+        """Queue ranks for the dataset's next batch and wait for the answers."""
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.get(name)
+        if pending is None:
+            pending = self._pending[name] = []
+            asyncio.ensure_future(self._flush(name))
+        pending.append((ks, future))
+        return await future
+    
+    async def _flush(self, name: str) -> None:
+        """Run one select_many pass for every query queued against a dataset."""
+        # Yield so queries already scheduled on the loop can join this batch
+        await asyncio.sleep(self.coalesce_delay)
+        batch = self._pending.pop(name)
+        
+        ks = sorted({k for query_ks, _ in batch for k in query_ks})
+        try:
+            data = self._dataset(name)
+            loop = asyncio.get_running_loop()
+            if len(data) < INLINE_MAX_SIZE:
+                values = _run_batch(data, ks)
+            elif not isinstance(self._executor, ProcessPoolExecutor):
+                # Threads share the dataset already
+                values = await loop.run_in_executor(self._executor, _run_batch, data, ks)
+            elif isinstance(data, array.array):
+                segment = self._share(name, data)
+                live = tuple(shared.name for shared in self._shared.values())
+                values = await loop.run_in_executor(self._executor, _run_shared_batch, segment, ks, live)
+            else:
+                # Object datasets cannot live in shared memory and are pickled
+                values = await loop.run_in_executor(self._executor, _run_batch, data, ks)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        
+        self.batches += 1
+        answers = dict(zip(ks, values))
+        for query_ks, future in batch:
+            if not future.done():
+                future.set_result([answers[k] for k in query_ks])
+
+
+class SelectionClient:
+    """
+    Client for SelectionServer that can have many queries in flight on one
+    connection.
+    """
+    
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting: Dict[int, asyncio.Future] = {}
+        self._listener = asyncio.ensure_future(self._listen())
+    
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = 0) -> 'SelectionClient':
+        """Open a connection to a running server."""
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES)
+        return cls(reader, writer)
+    
+    async def close(self) -> None:
+        """Close the connection."""
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._listener.cancel()
+    
+    async def request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and return the full response object."""
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps(dict(request, id=request_id)).encode() + b'\n')
+        await self._writer.drain()
+        return await future
+    
+    async def call(self, request: Dict[str, Any]) -> Any:
+        """Send a request and return its result, raising RuntimeError on failure."""
+        response = await self.request(request)
+        if not response['ok']:
+            raise RuntimeError(response['error'])
+        return response['result']
+    
+    async def upload(self, name: str, data: List[Any]) -> int:
+        """Upload a dataset and return its size."""
+        return await self.call({'op': 'upload', 'name': name, 'data': list(data)})
+    
+    async def kth(self, name: str, k: int) -> Any:
+        """Return the k-th smallest element of a dataset."""
+        return await self.call({'op': 'kth', 'name': name, 'k': k})
+    
+    async def median(self, name: str) -> Any:
+        """Return the lower median of a dataset."""
+        return await self.call({'op': 'median', 'name': name})
+    
+    async def quantiles(self, name: str, qs: List[float]) -> List[Any]:
+        """Return nearest-rank quantiles of a dataset."""
+        return await self.call({'op': 'quantiles', 'name': name, 'qs': list(qs)})
+    
+    async def _listen(self) -> None:
+        """Route responses to the futures waiting for them."""
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._waiting.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection closed"))
+            self._waiting.clear()
@@ -0,0 +1,214 @@
+"""
+Shared helpers for the selection algorithms.
+
+This module normalizes the inputs accepted by the deterministic and randomized
+selection algorithms. Plain sequences are copied into a list, while
+buffer-protocol objects (array.array, memoryview, bytes, bytearray, ...) are
+copied into a typed array.array scratch buffer of the same format so that the
+elements are never boxed all at once. The project's own containers are read
+through their backing storage or a single traversal instead of per-element
+indexing.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import math
+from collections.abc import MutableSequence
+from typing import Any, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; callers fall back to pure Python
+    np = None
+
+# Use try/except to support both relative and absolute imports
+try:
+    from .data_structures import DynamicArray, DynamicArrayView, GapBuffer, LinkedList, Queue, Stack
+    from .shared_array import SharedDynamicArray
+except ImportError:
+    from src.data_structures import DynamicArray, DynamicArrayView, GapBuffer, LinkedList, Queue, Stack
+    from src.shared_array import SharedDynamicArray
+
+
+_ARRAY_TYPECODES = frozenset(array.typecodes)
+
+
+def is_buffer(arr: Any) -> bool:
+    """Return True if arr exposes the buffer protocol (array.array, memoryview, bytes, ...)."""
+    if isinstance(arr, (array.array, memoryview, bytes, bytearray)):
+        return True
+    if isinstance(arr, (list, tuple, str)):
+        return False
+    try:
+        memoryview(arr)
+    except TypeError:
+        return False
+    return True
+
+
+def element_count(arr: Any) -> int:
+    """Return the number of elements in arr, counting every cell of a multi-dimensional buffer."""
+    if is_buffer(arr):
+        view = memoryview(arr)
+        return view.nbytes // view.itemsize if view.itemsize else 0
+    return len(arr)
+
+
+def _native_typecode(view: memoryview) -> Any:
+    """Return the array.array typecode matching a memoryview format, or None."""
+    fmt = view.format
+    if fmt.startswith('@'):
+        fmt = fmt[1:]
+    return fmt if fmt in _ARRAY_TYPECODES else None
+
+
+def container_items(arr: Any, in_place: bool = False) -> Any:
+    """
+    Return the elements of a DynamicArray (or a view of one),
+    SharedDynamicArray, GapBuffer, LinkedList, Stack or Queue as a sequence that selection can partition, or
+    None for any other input.
+    
+    A DynamicArray is sliced out of its backing storage in one C-level copy,
+    which keeps the typecode of array.array storage; NumPy storage becomes a
+    typed scratch copy. With in_place=True list and array.array storage
+    release their spare capacity and are partitioned directly, and NumPy
+    storage is partitioned through a view. A GapBuffer is joined from the
+    two slices around its gap, linked lists, stacks and queues are drained
+    with a single traversal, and views are sliced out of the
+    shared storage (in_place does not apply to either). A SharedDynamicArray
+    is copied out with a consistent snapshot, so the writer may keep
+    appending while selection runs.
+    """
+    if isinstance(arr, DynamicArray):
+        if in_place:
+            arr._detach_views()
+        storage = arr._data
+        if isinstance(storage, (list, array.array)):
+            if in_place and arr._size:
+                arr.shrink_to_fit()
+                return arr._data
+            return storage[:arr._size]
+        return make_scratch(storage[:arr._size], in_place)
+    if isinstance(arr, DynamicArrayView):
+        window = arr._window()
+        return window if isinstance(window, (list, array.array)) else make_scratch(window)
+    if isinstance(arr, SharedDynamicArray):
+        return arr.snapshot()
+    if isinstance(arr, GapBuffer):
+        return arr.tolist()
+    if isinstance(arr, (LinkedList, Stack, Queue)):
+        return list(arr)
+    return None
+
+
+def as_indexable(arr: Any) -> Any:
+    """
+    Return a random-access view of arr without copying its elements.
+    
+    Multi-dimensional C-contiguous buffers are flattened with memoryview.cast,
+    the project's containers are read with container_items (a reference copy)
+    and iterables without __getitem__ are materialized as a list.
+    """
+    items = container_items(arr)
+    if items is not None:
+        return items
+    if is_buffer(arr):
+        view = memoryview(arr)
+        if view.ndim == 1:
+            return arr
+        typecode = _native_typecode(view)
+        if view.c_contiguous and typecode is not None:
+            return view.cast('B').cast(typecode)
+        return make_scratch(arr)
+    if not hasattr(arr, '__getitem__'):
+        return list(arr)
+    return arr
+
+
+def index_array(n: int) -> array.array:
+    """Return a compact array.array holding the indices 0..n-1."""
+    return array.array('q', range(n))
+
+
+def make_scratch(arr: Any, in_place: bool = False) -> Any:
+    """
+    Return a mutable, indexable sequence that selection can partition.
+    
+    Args:
+        arr: A sequence of comparable elements or a buffer-protocol object
+        in_place: If True, partition arr itself when it is mutable (a
+            MutableSequence or writable buffer) instead of copying it
+            
+    Returns:
+        arr itself (in-place mode), a typed array.array copy for buffers with a
+        native format, the elements of a project container (see
+        container_items), or a list copy for everything else
+    """
+    items = container_items(arr, in_place)
+    if items is not None:
+        return items
+    if not is_buffer(arr):
+        return arr if in_place and isinstance(arr, MutableSequence) else list(arr)
+    
+    view = memoryview(arr)
+    typecode = _native_typecode(view)
+    if typecode is None:
+        # Formats array.array cannot represent (structs, bools, ...) are boxed
+        return view.tolist() if view.ndim == 1 else list(_flatten(view.tolist()))
+    
+    if in_place and not view.readonly and view.ndim == 1:
+        return arr if isinstance(arr, array.array) else view
+    
+    scratch = array.array(typecode)
+    scratch.frombytes(view.cast('B') if view.c_contiguous else view.tobytes())
+    return scratch
+
+
+def _flatten(nested: list):
+    """Yield the leaves of a nested list produced by memoryview.tolist()."""
+    for item in nested:
+        if isinstance(item, list):
+            yield from _flatten(item)
+        else:
+            yield item
+
+
+def quantile_rank(q: float, n: int) -> int:
+    """
+    Return the 1-indexed nearest rank of quantile q among n elements.
+    
+    Uses the lower nearest-rank definition, so q=0.5 gives the same lower
+    median as find_median.
+    """
+    if not 0 <= q <= 1:
+        raise ValueError(f"quantile must be between 0 and 1, got {q}")
+    return max(1, math.ceil(q * n))
+
+
+def numeric_matrix(rows: List[Any]) -> Any:
+    """
+    Return rows as a 2-D NumPy array if they are equally long and purely
+    numeric (int or float, not bool), otherwise None.
+    
+    Always returns None when NumPy is not installed.
+    """
+    if np is None or not rows:
+        return None
+    width = len(rows[0])
+    if width == 0 or any(len(row) != width for row in rows):
+        return None
+    if not all(isinstance(row, array.array) for row in rows):
+        types = set()
+        for row in rows:
+            types.update(map(type, row))
+        if not types <= {int, float}:
+            return None
+    try:
+        matrix = np.array(rows)
+    except (OverflowError, ValueError):
+        return None
+    if matrix.ndim != 2 or matrix.dtype.kind not in 'iuf':
+        return None
+    return matrix
@@ -0,0 +1,282 @@
+"""
+Selection Across Multiple Sequences
+
+This module finds the k-th smallest element across several sequences (shards)
+without concatenating them. Sorted shards are searched by narrowing a window in
+each shard with binary search; unsorted shards are narrowed with sample-pivot
+counting rounds until the remaining candidates are few enough to select
+directly.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import math
+import random
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, List, Optional
+
+# Use try/except to support both relative and absolute imports
+try:
+    from .partial_sort import _select_prefix
+    from .selection_utils import as_indexable
+except ImportError:
+    from src.partial_sort import _select_prefix
+    from src.selection_utils import as_indexable
+
+
+# Candidate sets at most this large are gathered and selected directly
+GATHER_THRESHOLD = 2048
+
+# Smallest number of elements sampled per counting round on unsorted shards
+SAMPLE_SIZE = 256
+
+
+def select_across(
+    sequences: List[Any],
+    k: int,
+    key=None,
+    assume_sorted: Optional[bool] = None,
+    seed=None
+) -> Any:
+    """
+    Find the k-th smallest element across several sequences without
+    materializing their concatenation.
+    
+    For sorted shards every round costs O(m log n) binary searches (m shards of
+    length at most n) and discards at least a quarter of the remaining
+    elements. Unsorted shards are narrowed with one counting pass per round
+    around two pivots drawn from a random sample.
+    
+    Args:
+        sequences: Sequences (lists, tuples or buffer-protocol objects)
+        k: The k-th smallest element to find (1-indexed, so k=1 is the minimum)
+        key: Optional function to extract comparison key from elements
+        assume_sorted: True if every shard is sorted by key, False if not, or
+            None to check each shard with a linear scan
+        seed: Optional random seed for reproducible results
+        
+    Returns:
+        The k-th smallest element of all sequences combined
+        
+    Raises:
+        ValueError: If k is out of range [1, total length]
+        IndexError: If all sequences are empty
+        
+    Examples:
+        >>> select_across([[1, 4, 7], [2, 5, 8], [3, 6, 9]], 5, assume_sorted=True)
+        5
+        >>> select_across([[7, 1, 4], [8, 2], [9, 3, 6, 5]], 5, seed=42)
+        5
+    """
+    shards = [as_indexable(seq) for seq in sequences]
+    n = sum(len(shard) for shard in shards)
+    if n == 0:
+        raise IndexError("Cannot select from empty sequences")
+    if k < 1 or k > n:
+        raise ValueError(f"k must be between 1 and {n}, got {k}")
+    
+    if seed is not None:
+        random.seed(seed)
+    
+    if key is None:
+        key = lambda x: x
+    
+    if assume_sorted is None:
+        assume_sorted = all(_is_sorted(shard, key) for shard in shards)
+    
+    if assume_sorted:
+        return _select_sorted(shards, k, key)
+    return _select_unsorted(shards, n, k, key)
+
+
+def _is_sorted(seq: Any, key) -> bool:
+    """Check whether a sequence is sorted by key. O(n), stops at the first inversion."""
+    previous = None
+    for i, item in enumerate(seq):
+        current = key(item)
+        if i and current < previous:
+            return False
+        previous = current
+    return True
+
+
+def _select_sorted(shards: List[Any], k: int, key) -> Any:
+    """
+    Select across sorted shards by narrowing a [lo, hi) window in each one.
+    
+    Each round picks the weighted median of the window midpoints as pivot, so
+    at least a quarter of the remaining elements lie on each side of it.
+    Binary searches count the elements below and up to the pivot in every
+    window, and the windows shrink to the side that holds rank k.
+    
+    Args:
+        shards: Sorted sequences
+        k: The k-th smallest element to find (1-indexed)
+        key: Function to extract comparison key
+        
+    Returns:
+        The k-th smallest element
+    """
+    lo = [0] * len(shards)
+    hi = [len(shard) for shard in shards]
+    
+    while True:
+        remaining = sum(h - l for l, h in zip(lo, hi))
+        if remaining <= GATHER_THRESHOLD:
+            candidates = [shard[j] for shard, l, h in zip(shards, lo, hi) for j in range(l, h)]
+            return _select_candidates(candidates, k, key)
+        
+        # Weighted median of the window midpoints
+        midpoints = []
+        for shard, l, h in zip(shards, lo, hi):
+            if l < h:
+                item = shard[(l + h) // 2]
+                midpoints.append((key(item), h - l, item))
+        midpoints.sort(key=lambda entry: entry[0])
+        weight = 0
+        for pivot_key, size, pivot in midpoints:
+            weight += size
+            if 2 * weight >= remaining:
+                break
+        
+        below = [bisect_left(shard, pivot_key, l, h, key=key) for shard, l, h in zip(shards, lo, hi)]
+        upto = [bisect_right(shard, pivot_key, l, h, key=key) for shard, l, h in zip(shards, lo, hi)]
+        less = sum(b - l for b, l in zip(below, lo))
+        less_or_equal = sum(u - l for u, l in zip(upto, lo))
+        
+        if k <= less:
+            hi = below
+        elif k > less_or_equal:
+            k -= less_or_equal
+            lo = upto
+        else:
+            return pivot
+
+
+def _select_unsorted(shards: List[Any], n: int, k: int, key) -> Any:
+    """
+    Select across unsorted shards with sample-pivot counting rounds
+    (Floyd-Rivest style).
+    
+    The candidate set is the elements whose key lies inside a (possibly
+    unbounded) interval. Each round sorts a random sample of about count^(2/3)
+    candidates and takes two pivots bracketing the expected position of rank k.
+    One pass over the shards counts the candidates below and above the pivots
+    and gathers only those between them. Rank k lands between the pivots with
+    high probability, in which case the gathered elements are selected
+    directly; otherwise the interval shrinks to the side holding rank k and
+    another round runs.
+    
+    Args:
+        shards: Sequences in arbitrary order
+        n: Total number of elements
+        k: The k-th smallest element to find (1-indexed)
+        key: Function to extract comparison key
+        
+    Returns:
+        The k-th smallest element
+    """
+    bounds = _Interval()
+    count = n
+    offsets = list(accumulate(len(shard) for shard in shards))
+    
+    while True:
+        if count <= GATHER_THRESHOLD:
+            candidates = [item for shard in shards for item in shard if bounds.contains(key(item))]
+            return _select_candidates(candidates, k, key)
+        
+        sample_size = min(count, max(SAMPLE_SIZE, int(count ** (2 / 3))))
+        sample = _draw_sample(shards, offsets, sample_size, bounds, key)
+        if not sample:
+            # The candidates are too sparse to sample: make the next round gather them
+            count = GATHER_THRESHOLD
+            continue
+        sample.sort(key=key)
+        s = len(sample)
+        rank = (k * s) // count
+        spread = int(math.sqrt(s * math.log(count))) + 1
+        low_item = sample[max(0, rank - spread)]
+        high_item = sample[min(s - 1, rank + spread)]
+        low_key, high_key = key(low_item), key(high_item)
+        
+        below = above = 0
+        between = []
+        bounded = bounds.is_bounded()
+        for shard in shards:
+            for item in shard:
+                item_key = key(item)
+                if bounded and not bounds.contains(item_key):
+                    continue
+                if item_key < low_key:
+                    below += 1
+                elif high_key < item_key:
+                    above += 1
+                else:
+                    between.append(item)
+        
+        if below < k <= below + len(between):
+            if not low_key < high_key:
+                # Every element between the pivots shares the same key
+                return low_item
+            return _select_candidates(between, k - below, key)
+        
+        if k <= below:
+            bounds.hi, bounds.hi_inclusive = low_key, False
+            count = below
+        else:
+            k -= below + len(between)
+            bounds.lo, bounds.lo_inclusive = high_key, False
+            count = above
+
+
+def _select_candidates(candidates: List[Any], k: int, key) -> Any:
+    """Select the k-th smallest gathered candidate with three-way quickselect."""
+    _select_prefix(candidates, 0, len(candidates) - 1, k - 1, key)
+    return candidates[k - 1]
+
+
+def _draw_sample(shards: List[Any], offsets: List[int], size: int, bounds: '_Interval', key) -> List[Any]:
+    """
+    Draw a random sample of candidates by global position.
+    
+    Positions whose element falls outside the candidate interval are rejected,
+    with at most 20 attempts per requested element.
+    """
+    n = offsets[-1]
+    sample = []
+    for _ in range(20 * size):
+        position = random.randrange(n)
+        shard_index = bisect_right(offsets, position)
+        start = offsets[shard_index - 1] if shard_index else 0
+        item = shards[shard_index][position - start]
+        if bounds.contains(key(item)):
+            sample.append(item)
+            if len(sample) == size:
+                break
+    return sample
+
+
+class _Interval:
+    """Interval of keys with optional, inclusive or exclusive bounds."""
+    
+    def __init__(self):
+        self.lo = None
+        self.lo_inclusive = True
+        self.hi = None
+        self.hi_inclusive = True
+    
+    def is_bounded(self) -> bool:
+        """Return True if either bound is set."""
+        return self.lo is not None or self.hi is not None
+    
+    def contains(self, item_key: Any) -> bool:
+        """Return True if item_key lies inside the interval."""
+        if self.lo is not None:
+            if item_key < self.lo or (not self.lo_inclusive and not self.lo < item_key):
+                return False
+        if self.hi is not None:
+            if self.hi < item_key or (not self.hi_inclusive and not item_key < self.hi):
+                return False
+        return True
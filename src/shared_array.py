@@ -0,0 +1,346 @@
+"""
+Shared-Memory Dynamic Array
+
+This module implements a typed dynamic array stored in
+multiprocessing.shared_memory segments, so worker processes can attach to it
+by name and read it without the contents being pickled to them.
+
+Two segments are used:
+
+    - a small control block holding a version counter, the size, the
+      capacity, the typecode and the name of the current data segment
+    - the data segment, replaced by a larger one when the array grows
+    
+The protocol is single-writer/multi-reader with a sequence lock: the writer
+makes the version odd before a change and even again afterwards, and readers
+retry any read during which the version was odd or changed.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import struct
+import sys
+import time
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Iterator, List, Optional
+
+# version, size, capacity, typecode, data segment name
+_CONTROL = struct.Struct('<QQQ8s64s')
+
+
+# Largest number of attempts consistent_read makes before giving up
+MAX_READ_RETRIES = 1000
+
+
+class SharedDynamicArray:
+    """
+    A typed dynamic array in shared memory with one writer and any number of
+    readers in other processes.
+    
+    Create the array in the writer, pass `name` to the workers, and attach
+    there with SharedDynamicArray.attach(name). Readers get zero-copy
+    memoryviews of the contents through consistent_read or view.
+    
+    Time Complexity:
+        - Access: O(1)
+        - Append: O(1) amortized
+        - Attach: O(1) (no element is copied)
+        - Snapshot: O(n) byte copy
+    """
+    
+    def __init__(self, typecode: str = 'q', initial_capacity: int = 1024, name: Optional[str] = None):
+        """
+        Create a new shared array (the writer side).
+        
+        Args:
+            typecode: array.array typecode of the elements
+            initial_capacity: Number of slots allocated up front
+            name: Optional name for the control segment (generated if omitted)
+        """
+        itemsize = array.array(typecode).itemsize
+        self.typecode = typecode
+        self.writable = True
+        self._itemsize = itemsize
+        self._version = 0
+        self._generation = 0
+        self._retired = []
+        self._control = shared_memory.SharedMemory(name=name, create=True, size=_CONTROL.size)
+        self._data = self._create_segment(max(1, initial_capacity))
+        self._capacity = max(1, initial_capacity)
+        self._size = 0
+        self._elements = self._data.buf.cast(typecode)
+        self._publish()
+    
+    @classmethod
+    def attach(cls, name: str) -> 'SharedDynamicArray':
+        """
+        Attach to an existing shared array by name (the reader side).
+        
+        Raises:
+            FileNotFoundError: If no shared array with that name exists
+        """
+        self = cls.__new__(cls)
+        self.writable = False
+        self._retired = []
+        self._control = _attach_segment(name)
+        self._data = None
+        self._elements = None
+        version, _, _, typecode, _ = _CONTROL.unpack_from(self._control.buf)
+        self.typecode = typecode.rstrip(b'\0').decode()
+        self._itemsize = array.array(self.typecode).itemsize
+        self._version = version
+        self._begin_read()
+        return self
+    
+    @property
+    def name(self) -> str:
+        """Name to pass to attach()."""
+        return self._control.name
+    
+    @property
+    def version(self) -> int:
+        """Current version; it changes whenever the writer changes the array."""
+        return _CONTROL.unpack_from(self._control.buf)[0]
+    
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        if self.writable:
+            return self._size
+        return _CONTROL.unpack_from(self._control.buf)[1]
+    
+    def __getitem__(self, index: int) -> Any:
+        """Get element at index (negative indices count from the end)."""
+        def get(view):
+            n = len(view)
+            position = index + n if index < 0 else index
+            if position < 0 or position >= n:
+                raise IndexError(f"Index {index} out of range")
+            return view[position]
+        return self.consistent_read(get)
+    
+    def __setitem__(self, index: int, value: Any) -> None:
+        """Set element at index (writer only)."""
+        self._check_writable()
+        position = index + self._size if index < 0 else index
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Index {index} out of range")
+        with self._writing():
+            self._elements[position] = value
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over a consistent snapshot of the elements."""
+        return iter(self.snapshot())
+    
+    def append(self, value: Any) -> None:
+        """Append element to the end (writer only). O(1) amortized."""
+        self._check_writable()
+        with self._writing():
+            if self._size == self._capacity:
+                self._reallocate(2 * self._capacity)
+            self._elements[self._size] = value
+            self._size += 1
+    
+    def extend(self, values) -> None:
+        """Append every element of an iterable with one byte copy (writer only)."""
+        self._check_writable()
+        values = array.array(self.typecode, values)
+        m = len(values)
+        with self._writing():
+            if self._size + m > self._capacity:
+                self._reallocate(max(2 * self._capacity, self._size + m))
+            start = self._size * self._itemsize
+            self._data.buf[start:start + m * self._itemsize] = memoryview(values).cast('B')
+            self._size += m
+    
+    def clear(self) -> None:
+        """Remove every element, keeping the capacity (writer only)."""
+        self._check_writable()
+        with self._writing():
+            self._size = 0
+    
+    def consistent_read(self, func: Callable[[memoryview], Any]) -> Any:
+        """
+        Run func on a zero-copy memoryview of the elements and return its
+        result, retrying until no write overlapped the read.
+        
+        The view is released when func returns, so func must not keep it.
+        
+        Raises:
+            RuntimeError: If the writer kept changing the array for
+                MAX_READ_RETRIES attempts
+        """
+        for _ in range(MAX_READ_RETRIES):
+            version, size = self._begin_read()
+            view = self._elements[:size]
+            try:
+                result = func(view)
+            finally:
+                view.release()
+            if self.version == version:
+                return result
+        raise RuntimeError("shared array kept changing during the read")
+    
+    def view(self) -> memoryview:
+        """
+        Return a zero-copy memoryview of the current elements.
+        
+        Unlike consistent_read, nothing stops the writer from changing the
+        elements while the view is in use; compare version before and after,
+        and release the view when done.
+        """
+        _, size = self._begin_read()
+        return self._elements[:size]
+    
+    def snapshot(self) -> array.array:
+        """Return a consistent array.array copy of the elements (one byte copy)."""
+        def copy(view):
+            result = array.array(self.typecode)
+            result.frombytes(view.cast('B'))
+            return result
+        return self.consistent_read(copy)
+    
+    def tolist(self) -> List[Any]:
+        """Return a consistent copy of the elements as a list."""
+        return self.consistent_read(memoryview.tolist)
+    
+    def close(self) -> None:
+        """Detach from the shared segments (they stay alive for other processes)."""
+        if self._elements is not None:
+            self._elements.release()
+            self._elements = None
+        for segment in self._retired + [self._data, self._control]:
+            if segment is not None:
+                segment.close()
+        self._retired = []
+        self._data = None
+    
+    def unlink(self) -> None:
+        """Close and destroy the shared segments (writer only)."""
+        self._check_writable()
+        control, data = self._control, self._data
+        self.close()
+        for segment in (data, control):
+            _unlink_segment(segment)
+    
+    def __enter__(self) -> 'SharedDynamicArray':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        if self.writable:
+            self.unlink()
+        else:
+            self.close()
+    
+    def __str__(self) -> str:
+        """String representation of the array."""
+        return str(self.tolist())
+    
+    def _check_writable(self) -> None:
+        """Raise if this handle is a reader."""
+        if not self.writable:
+            raise PermissionError("attached shared arrays are read-only")
+    
+    @contextmanager
+    def _writing(self):
+        """Make the version odd for the duration of a change, then publish it."""
+        self._version += 1
+        self._publish()
+        try:
+            yield
+        finally:
+            self._version += 1
+            self._publish()
+    
+    def _publish(self) -> None:
+        """Write the current state into the control block."""
+        _CONTROL.pack_into(self._control.buf, 0, self._version, self._size, self._capacity,
+                           self.typecode.encode(), self._data.name.encode())
+    
+    def _create_segment(self, capacity: int) -> shared_memory.SharedMemory:
+        """Create a data segment named after the control block and a generation number."""
+        self._generation += 1
+        segment = shared_memory.SharedMemory(
+            name=f"{self._control.name}_{self._generation}", create=True, size=capacity * self._itemsize
+        )
+        return segment
+    
+    def _reallocate(self, capacity: int) -> None:
+        """Move the elements into a new, larger data segment and retire the old one."""
+        new = self._create_segment(capacity)
+        used = self._size * self._itemsize
+        new.buf[:used] = self._data.buf[:used]
+        self._elements.release()
+        old = self._data
+        self._data, self._capacity = new, capacity
+        self._elements = new.buf.cast(self.typecode)
+        old.close()
+        # Readers that still map the old segment keep it alive until they detach
+        _unlink_segment(old)
+    
+    def _begin_read(self) -> tuple:
+        """
+        Wait for a stable (even) version, follow the writer to its current
+        data segment and return (version, size).
+        """
+        if self.writable:
+            return self._version, self._size
+        while True:
+            version, size, _, _, data_name = _CONTROL.unpack_from(self._control.buf)
+            if version % 2:
+                time.sleep(0)
+                continue
+            data_name = data_name.rstrip(b'\0').decode()
+            if self._data is None or self._data.name != data_name:
+                try:
+                    self._remap(data_name)
+                except FileNotFoundError:
+                    # The writer replaced the segment while we looked it up
+                    continue
+            if self.version == version:
+                return version, size
+    
+    def _remap(self, data_name: str) -> None:
+        """Attach to a new data segment, closing the previous one when possible."""
+        segment = _attach_segment(data_name)
+        if self._elements is not None:
+            self._elements.release()
+        if self._data is not None:
+            self._retired.append(self._data)
+        self._data = segment
+        self._elements = segment.buf.cast(self.typecode)
+        # Segments whose views callers still hold stay open until close()
+        still_open = []
+        for old in self._retired:
+            try:
+                old.close()
+            except BufferError:
+                still_open.append(old)
+        self._retired = still_open
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to a shared memory segment without letting this process's
+    resource tracker destroy it when the process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    segment = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(segment._name, 'shared_memory')
+    return segment
+
+
+def _unlink_segment(segment: shared_memory.SharedMemory) -> None:
+    """
+    Destroy a segment this process created.
+    
+    Worker processes share their parent's resource tracker, so a worker's
+    unregister in _attach_segment may already have dropped the creator's
+    registration. Registering again (a no-op if it is still there) keeps
+    the unregister inside unlink() from failing in the tracker.
+    """
+    resource_tracker.register(segment._name, 'shared_memory')
+    segment.unlink()
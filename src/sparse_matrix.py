@@ -0,0 +1,354 @@
+"""
+Sparse Matrix
+
+This module implements a sparse matrix that only stores its nonzero cells.
+Edits go into a coordinate (COO) dictionary keyed by (row, col); products and
+row/column iteration use compressed sparse row (CSR) and column (CSC) arrays
+built from it on demand and cached until the next edit:
+
+    indptr[i]:indptr[i + 1]   positions of row i's (or column i's) entries
+    indices[p]                column (or row) of entry p
+    values[p]                 value of entry p
+    
+A 100k x 100k matrix with a million nonzeros therefore costs memory for the
+million entries only, where a dense Matrix would need ten billion cells.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import operator
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Use try/except to support both relative and absolute imports
+try:
+    from .data_structures import Matrix
+except ImportError:
+    from src.data_structures import Matrix
+
+
+class SparseMatrix:
+    """
+    A sparse 2D matrix with the same get/set interface as Matrix.
+    
+    Cells that were never set (or were set to 0) read as 0 and take no memory.
+    
+    Time Complexity:
+        - Access/insertion/deletion: O(1) average (dictionary)
+        - CSR/CSC conversion: O(nnz log nnz), cached until the next edit
+        - Matrix-vector product: O(rows + nnz)
+        - Sparse-sparse product: O(rows + flops), flops being the number of
+          nonzero multiplications
+    """
+    
+    def __init__(self, rows: int, cols: int):
+        """Initialize an all-zero sparse matrix with given dimensions."""
+        self.rows = rows
+        self.cols = cols
+        self._entries: Dict[Tuple[int, int], Any] = {}
+        self._csr: Optional[tuple] = None
+        self._csc: Optional[tuple] = None
+    
+    @classmethod
+    def from_dense(cls, dense: Any) -> 'SparseMatrix':
+        """
+        Build a sparse matrix from a Matrix or a list of equal-length rows,
+        keeping only the nonzero cells. O(rows * cols).
+        """
+        rows = dense.tolist() if isinstance(dense, Matrix) else [list(row) for row in dense]
+        cols = len(rows[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            raise ValueError("all rows must have the same length")
+        sparse = cls(len(rows), cols)
+        entries = sparse._entries
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                if value != 0:
+                    entries[i, j] = value
+        return sparse
+    
+    @classmethod
+    def from_coo(cls, rows: int, cols: int, row_indices: Any, col_indices: Any, values: Any) -> 'SparseMatrix':
+        """
+        Build a sparse matrix from coordinate triplets; values at repeated
+        coordinates are summed. O(nnz).
+        
+        Raises:
+            ValueError: If the three sequences have different lengths
+            IndexError: If a coordinate is out of range
+        """
+        row_indices, col_indices, values = list(row_indices), list(col_indices), list(values)
+        if not len(row_indices) == len(col_indices) == len(values):
+            raise ValueError("row_indices, col_indices and values must have the same length")
+        sparse = cls(rows, cols)
+        for row, col, value in zip(row_indices, col_indices, values):
+            sparse.add(row, col, value)
+        return sparse
+    
+    @property
+    def shape(self) -> tuple:
+        """Return (rows, cols)."""
+        return self.rows, self.cols
+    
+    @property
+    def nnz(self) -> int:
+        """Number of stored (nonzero) cells."""
+        return len(self._entries)
+    
+    @property
+    def density(self) -> float:
+        """Fraction of cells that are nonzero."""
+        cells = self.rows * self.cols
+        return len(self._entries) / cells if cells else 0.0
+    
+    def _check(self, row: int, col: int) -> None:
+        """Raise IndexError if (row, col) is out of range."""
+        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
+            raise IndexError(f"Index ({row}, {col}) out of range")
+    
+    def __getitem__(self, key: tuple) -> Any:
+        """Get element at (row, col). O(1)."""
+        row, col = key
+        self._check(row, col)
+        return self._entries.get((row, col), 0)
+    
+    def __setitem__(self, key: tuple, value: Any) -> None:
+        """Set element at (row, col); setting 0 removes the entry. O(1)."""
+        row, col = key
+        self._check(row, col)
+        if value == 0:
+            if self._entries.pop((row, col), None) is None:
+                return
+        else:
+            self._entries[row, col] = value
+        self._csr = self._csc = None
+    
+    def add(self, row: int, col: int, value: Any) -> None:
+        """Add value to the cell at (row, col), as when assembling from triplets. O(1)."""
+        self._check(row, col)
+        self[row, col] = self._entries.get((row, col), 0) + value
+    
+    def items(self) -> Iterator[Tuple[int, int, Any]]:
+        """Iterate over (row, col, value) for every nonzero cell in row-major order."""
+        indptr, indices, values = self.to_csr()
+        for i in range(self.rows):
+            for p in range(indptr[i], indptr[i + 1]):
+                yield i, indices[p], values[p]
+    
+    # ------------------------------------------------------------------
+    # Compressed formats
+    # ------------------------------------------------------------------
+    
+    def to_csr(self) -> tuple:
+        """
+        Return (indptr, indices, values) in compressed sparse row form.
+        
+        indptr and indices are array.array('q'); values is a list. The result
+        is cached until the next edit and must not be modified.
+        """
+        if self._csr is None:
+            self._csr = _compress(self._entries, self.rows, by_column=False)
+        return self._csr
+    
+    def to_csc(self) -> tuple:
+        """Return (indptr, indices, values) in compressed sparse column form (see to_csr)."""
+        if self._csc is None:
+            self._csc = _compress(self._entries, self.cols, by_column=True)
+        return self._csc
+    
+    def row(self, i: int) -> List[Tuple[int, Any]]:
+        """Return the nonzero cells of row i as (col, value) pairs in column order. O(nnz in row)."""
+        if i < 0 or i >= self.rows:
+            raise IndexError(f"row index {i} out of range")
+        indptr, indices, values = self.to_csr()
+        start, stop = indptr[i], indptr[i + 1]
+        return list(zip(indices[start:stop], values[start:stop]))
+    
+    def column(self, j: int) -> List[Tuple[int, Any]]:
+        """Return the nonzero cells of column j as (row, value) pairs in row order. O(nnz in column)."""
+        if j < 0 or j >= self.cols:
+            raise IndexError(f"column index {j} out of range")
+        indptr, indices, values = self.to_csc()
+        start, stop = indptr[j], indptr[j + 1]
+        return list(zip(indices[start:stop], values[start:stop]))
+    
+    def iter_rows(self) -> Iterator[List[Tuple[int, Any]]]:
+        """Iterate over every row's nonzero (col, value) pairs."""
+        for i in range(self.rows):
+            yield self.row(i)
+    
+    # ------------------------------------------------------------------
+    # Products
+    # ------------------------------------------------------------------
+    
+    def matvec(self, vector: Any) -> List[Any]:
+        """
+        Return self @ vector for a sequence of length cols, one CSR row at a
+        time. O(rows + nnz).
+        
+        Raises:
+            ValueError: If the vector length does not match cols
+        """
+        if len(vector) != self.cols:
+            raise ValueError(f"vector length {len(vector)} does not match {self.cols} columns")
+        indptr, indices, values = self.to_csr()
+        fetch = vector.__getitem__
+        return [
+            sum(map(operator.mul, values[indptr[i]:indptr[i + 1]], map(fetch, indices[indptr[i]:indptr[i + 1]])))
+            for i in range(self.rows)
+        ]
+    
+    def rmatvec(self, vector: Any) -> List[Any]:
+        """
+        Return vector @ self for a sequence of length rows, one CSC column at
+        a time. O(cols + nnz).
+        
+        Raises:
+            ValueError: If the vector length does not match rows
+        """
+        if len(vector) != self.rows:
+            raise ValueError(f"vector length {len(vector)} does not match {self.rows} rows")
+        indptr, indices, values = self.to_csc()
+        fetch = vector.__getitem__
+        return [
+            sum(map(operator.mul, values[indptr[j]:indptr[j + 1]], map(fetch, indices[indptr[j]:indptr[j + 1]])))
+            for j in range(self.cols)
+        ]
+    
+    def __matmul__(self, other: Any) -> Any:
+        """
+        Multiply by a SparseMatrix (sparse result, Gustavson's row-by-row
+        algorithm), a dense Matrix (dense result) or a vector (list result).
+        
+        Raises:
+            ValueError: If the inner dimensions do not match
+        """
+        if isinstance(other, SparseMatrix):
+            return self._matmul_sparse(other)
+        if isinstance(other, Matrix):
+            return self._matmul_dense(other)
+        if isinstance(other, (list, tuple, array.array)):
+            return self.matvec(other)
+        return NotImplemented
+    
+    def __rmatmul__(self, other: Any) -> Any:
+        """Multiply a vector on the left (see rmatvec)."""
+        if isinstance(other, (list, tuple, array.array)):
+            return self.rmatvec(other)
+        return NotImplemented
+    
+    def _matmul_sparse(self, other: 'SparseMatrix') -> 'SparseMatrix':
+        """Sparse product: each output row accumulates scaled rows of other."""
+        if self.cols != other.rows:
+            raise ValueError(f"cannot multiply {self.rows}x{self.cols} by {other.rows}x{other.cols}")
+        a_ptr, a_indices, a_values = self.to_csr()
+        b_ptr, b_indices, b_values = other.to_csr()
+        result = SparseMatrix(self.rows, other.cols)
+        entries = result._entries
+        for i in range(self.rows):
+            accumulator = {}
+            for p in range(a_ptr[i], a_ptr[i + 1]):
+                k, a = a_indices[p], a_values[p]
+                for q in range(b_ptr[k], b_ptr[k + 1]):
+                    j = b_indices[q]
+                    accumulator[j] = accumulator.get(j, 0) + a * b_values[q]
+            for j, value in accumulator.items():
+                if value != 0:
+                    entries[i, j] = value
+        return result
+    
+    def _matmul_dense(self, other: Matrix) -> Matrix:
+        """
+        Sparse-dense product: each output row combines the rows of other
+        selected by the row's nonzeros, one column at a time.
+        """
+        if self.cols != other.rows:
+            raise ValueError(f"cannot multiply {self.rows}x{self.cols} by {other.rows}x{other.cols}")
+        indptr, indices, values = self.to_csr()
+        dense_rows = other.tolist()
+        result = []
+        for i in range(self.rows):
+            start, stop = indptr[i], indptr[i + 1]
+            if start == stop:
+                result.append([0] * other.cols)
+                continue
+            coefficients = values[start:stop]
+            selected = [dense_rows[k] for k in indices[start:stop]]
+            result.append([sum(map(operator.mul, coefficients, column)) for column in zip(*selected)])
+        return Matrix.from_rows(result) if result else Matrix(0, other.cols)
+    
+    def transpose(self) -> 'SparseMatrix':
+        """Return the transpose as a new sparse matrix. O(nnz)."""
+        result = SparseMatrix(self.cols, self.rows)
+        result._entries = {(col, row): value for (row, col), value in self._entries.items()}
+        # The CSC form of this matrix is the CSR form of its transpose
+        result._csr = self._csc
+        result._csc = self._csr
+        return result
+    
+    @property
+    def T(self) -> 'SparseMatrix':
+        """The transpose (see transpose)."""
+        return self.transpose()
+    
+    # ------------------------------------------------------------------
+    # Conversion and memory
+    # ------------------------------------------------------------------
+    
+    def to_dense(self) -> Matrix:
+        """Return the matrix as a dense Matrix. O(rows * cols)."""
+        dense = Matrix(self.rows, self.cols)
+        for (row, col), value in self._entries.items():
+            dense[row, col] = value
+        return dense
+    
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Report approximate bytes used by the COO dictionary, the CSR arrays
+        (built if needed) and a dense Matrix of the same shape.
+        
+        The dense figure counts only the flat list of cell references a
+        dense Matrix allocates, so it is computed without allocating it.
+        Stored values are counted once, in 'values'.
+        """
+        indptr, indices, values = self.to_csr()
+        pointer = sys.getsizeof([None]) - sys.getsizeof([])
+        coo = sys.getsizeof(self._entries) + sum(sys.getsizeof(key) for key in self._entries)
+        csr = sys.getsizeof(indptr) + sys.getsizeof(indices) + sys.getsizeof(values)
+        return {
+            'coo': coo,
+            'csr': csr,
+            'values': sum(sys.getsizeof(value) for value in values),
+            'dense': sys.getsizeof([]) + pointer * self.rows * self.cols
+        }
+    
+    def __str__(self) -> str:
+        """String representation listing the nonzero cells."""
+        cells = ', '.join(f"({row}, {col}): {value}" for row, col, value in self.items())
+        return f"SparseMatrix({self.rows}x{self.cols}, {{{cells}}})"
+
+
+def _compress(entries: Dict[Tuple[int, int], Any], n: int, by_column: bool) -> tuple:
+    """
+    Compress COO entries into (indptr, indices, values) grouped by row, or by
+    column when by_column is set, with indices sorted within each group.
+    """
+    if by_column:
+        keys = sorted(entries, key=lambda key: (key[1], key[0]))
+        major, minor = 1, 0
+    else:
+        keys = sorted(entries)
+        major, minor = 0, 1
+    
+    counts = [0] * (n + 1)
+    for key in keys:
+        counts[key[major] + 1] += 1
+    for i in range(n):
+        counts[i + 1] += counts[i]
+    
+    indptr = array.array('q', counts)
+    indices = array.array('q', [key[minor] for key in keys])
+    values = [entries[key] for key in keys]
+    return indptr, indices, values
@@ -0,0 +1,141 @@
+"""
+Unit tests for counting and radix selection.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import random
+
+import pytest
+from src.counting_select import (
+    counting_select, counting_select_many, radix_select, int_range, narrow_int_range
+)
+
+
+class TestCountingSelect:
+    """Test cases for counting_select function."""
+    
+    def test_basic(self):
+        """Test selection over HTTP-status-like values."""
+        arr = [404, 200, 200, 500, 301]
+        assert counting_select(arr, 1) == 200
+        assert counting_select(arr, 2) == 200
+        assert counting_select(arr, 3) == 301
+        assert counting_select(arr, 5) == 500
+    
+    def test_negative_values(self):
+        """Test values below zero."""
+        arr = [-3, 5, -1, 0, 2]
+        assert counting_select(arr, 1) == -3
+        assert counting_select(arr, 3) == 0
+    
+    def test_sparse_range(self):
+        """Test few distinct values spread over a wide range."""
+        arr = [10 ** 9, 1, 10 ** 6, 1]
+        assert counting_select(arr, 3) == 10 ** 6
+    
+    def test_known_bounds(self):
+        """Test passing precomputed bounds."""
+        arr = [3, 1, 2]
+        assert counting_select(arr, 2, lo=1, hi=3) == 2
+    
+    def test_matches_sorted(self):
+        """Test against sorted() on random inputs."""
+        rng = random.Random(5)
+        arr = [rng.randint(1, 1000) for _ in range(2000)]
+        expected = sorted(arr)
+        for k in [1, 500, 1000, 2000]:
+            assert counting_select(arr, k) == expected[k - 1]
+    
+    def test_errors(self):
+        """Test empty input and invalid k."""
+        with pytest.raises(IndexError):
+            counting_select([], 1)
+        with pytest.raises(ValueError):
+            counting_select([1, 2], 3)
+
+
+class TestCountingSelectMany:
+    """Test cases for counting_select_many function."""
+    
+    def test_several_ranks(self):
+        """Test ranks in any order with duplicates."""
+        assert counting_select_many([5, 1, 3, 3], [4, 1, 2, 2]) == [5, 1, 3, 3]
+    
+    def test_errors(self):
+        """Test empty input and invalid k."""
+        with pytest.raises(IndexError):
+            counting_select_many([], [1])
+        with pytest.raises(ValueError):
+            counting_select_many([1], [0])
+
+
+class TestRadixSelect:
+    """Test cases for radix_select function."""
+    
+    def test_basic(self):
+        """Test signed 64-bit values."""
+        arr = [-5, 3, 2 ** 40, 0]
+        assert radix_select(arr, 1) == -5
+        assert radix_select(arr, 2) == 0
+        assert radix_select(arr, 4) == 2 ** 40
+    
+    def test_extremes(self):
+        """Test the smallest and largest 64-bit and 32-bit values."""
+        arr = [2 ** 63 - 1, -2 ** 63, 0]
+        assert radix_select(arr, 1) == -2 ** 63
+        assert radix_select(arr, 3) == 2 ** 63 - 1
+        assert radix_select([2 ** 31 - 1, -2 ** 31], 1, bits=32) == -2 ** 31
+    
+    def test_all_equal(self):
+        """Test identical values."""
+        assert radix_select([7] * 10, 5) == 7
+    
+    def test_matches_sorted(self):
+        """Test against sorted() on random wide-range inputs."""
+        rng = random.Random(9)
+        arr = [rng.randint(-2 ** 50, 2 ** 50) for _ in range(1000)]
+        expected = sorted(arr)
+        for k in [1, 333, 1000]:
+            assert radix_select(arr, k) == expected[k - 1]
+    
+    def test_typed_buffers_with_shared_prefix(self):
+        """Test array/memoryview inputs clustered across zero and near a wide offset."""
+        rng = random.Random(4)
+        for center in (0, -2 ** 40, 2 ** 62):
+            values = [center + rng.randint(-70000, 70000) for _ in range(500)]
+            expected = sorted(values)
+            buf = array.array('q', values)
+            for k in [1, 250, 500]:
+                assert radix_select(buf, k) == expected[k - 1]
+                assert radix_select(memoryview(buf), k) == expected[k - 1]
+            assert buf.tolist() == values
+    
+    def test_errors(self):
+        """Test invalid word size and out-of-range values."""
+        with pytest.raises(ValueError):
+            radix_select([1], 1, bits=16)
+        with pytest.raises(ValueError):
+            radix_select([2 ** 31], 1, bits=32)
+        with pytest.raises(IndexError):
+            radix_select([], 1)
+
+
+class TestRangeDetection:
+    """Test cases for integer range detection."""
+    
+    def test_int_range(self):
+        """Test int_range on lists and arrays."""
+        assert int_range([3, 1, 2]) == (1, 3)
+        assert int_range(array.array('i', [5, -5])) == (-5, 5)
+        assert int_range([1, 2.0]) is None
+        assert int_range([True, 1]) is None
+        assert int_range(array.array('d', [1.0])) is None
+    
+    def test_narrow_int_range(self):
+        """Test that only long inputs with a narrow range qualify."""
+        assert narrow_int_range([1, 2, 3]) is None
+        assert narrow_int_range(list(range(100))) == (0, 99)
+        assert narrow_int_range([0, 10 ** 9] * 50) is None
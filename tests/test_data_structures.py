@@ -5,9 +5,18 @@ Author: Carlos Gutierrez
 Course: MSCS532 - Data Structures and Algorithms
 """
 
+import array
+import asyncio
+import random
+import threading
+import time
+from fractions import Fraction
+
 import pytest
+from src.deterministic_algorithm import deterministic_select
 from src.data_structures import (
-    DynamicArray, Matrix, Stack, Queue, LinkedList, Tree, TreeNode
+    DynamicArray, DynamicArrayView, GapBuffer, Matrix, Stack, Queue, BoundedQueue, AsyncQueue,
+    AsyncStack, PriorityQueue, IndexedPriorityQueue, LinkedList, Tree, TreeNode
 )
 
 
@@ -65,7 +74,386 @@ class TestDynamicArray:
         arr.append(1)
         with pytest.raises(IndexError):
             _ = arr[1]
+    
+    def test_iteration(self):
+        """Test iteration stops at the size, not the capacity."""
+        arr = DynamicArray(initial_capacity=8)
+        for value in [3, 1, 2]:
+            arr.append(value)
+        assert list(arr) == [3, 1, 2]
+    
+    def test_insert_delete_shift(self):
+        """Test mid-array insert/delete across a resize keep the order."""
+        arr = DynamicArray(initial_capacity=2)
+        arr.extend([1, 2, 4])
+        arr.insert(2, 3)
+        arr.insert(0, 0)
+        assert list(arr) == [0, 1, 2, 3, 4]
+        assert arr.delete(1) == 1
+        assert list(arr) == [0, 2, 3, 4]
+        assert arr._data[4] is None
+    
+    def test_extend(self):
+        """Test extend from lists and generators with one reallocation."""
+        arr = DynamicArray(initial_capacity=2)
+        arr.append(0)
+        arr.extend(x for x in range(1, 20))
+        assert list(arr) == list(range(20))
+        assert arr._capacity >= 20
+        arr.extend([])
+        assert len(arr) == 20
+    
+    def test_insert_many(self):
+        """Test inserting a block at the front, middle and end."""
+        arr = DynamicArray(initial_capacity=1)
+        arr.extend([1, 5])
+        arr.insert_many(1, [2, 3, 4])
+        arr.insert_many(0, (0,))
+        arr.insert_many(len(arr), [6])
+        assert list(arr) == [0, 1, 2, 3, 4, 5, 6]
+        with pytest.raises(IndexError):
+            arr.insert_many(8, [1])
+    
+    def test_delete_range(self):
+        """Test deleting a block returns it and clears the vacated slots."""
+        arr = DynamicArray()
+        arr.extend(range(8))
+        assert arr.delete_range(2, 5) == [2, 3, 4]
+        assert list(arr) == [0, 1, 5, 6, 7]
+        assert arr._data[5:8] == [None] * 3
+        assert arr.delete_range(1, 1) == []
+        with pytest.raises(IndexError):
+            arr.delete_range(3, 6)
+    
+    def test_clear(self):
+        """Test clear keeps the capacity and accepts new elements."""
+        arr = DynamicArray(initial_capacity=4)
+        arr.extend([1, 2, 3])
+        arr.clear()
+        assert len(arr) == 0 and arr._capacity == 4
+        arr.append(9)
+        assert list(arr) == [9]
+    
+    def test_zero_capacity(self):
+        """Test an array created with no capacity can still grow."""
+        arr = DynamicArray(initial_capacity=0)
+        arr.append(1)
+        arr.insert(0, 0)
+        assert list(arr) == [0, 1]
+
+
+class TestDynamicArrayDtype:
+    """Test cases for DynamicArray with typed array.array / NumPy storage."""
+    
+    DTYPES = ['q', 'd', 'int64', 'float32']
+    
+    def test_same_api_as_object_storage(self):
+        """Test every typed backend behaves like the default list storage."""
+        for dtype in self.DTYPES:
+            typed = DynamicArray(initial_capacity=2, dtype=dtype)
+            boxed = DynamicArray(initial_capacity=2)
+            for arr in (typed, boxed):
+                arr.extend([5, 3, 9])
+                arr.append(1)
+                arr.insert(1, 7)
+                arr.insert_many(0, (2, 4))
+                arr.delete(2)
+                arr[0] = 6
+            assert typed.tolist() == boxed.tolist(), dtype
+            assert list(typed) == boxed.tolist(), dtype
+            assert typed.delete_range(1, 3) == boxed.delete_range(1, 3), dtype
+            assert typed.tolist() == boxed.tolist(), dtype
+    
+    def test_storage_types(self):
+        """Test typecodes use array.array and other dtypes use NumPy."""
+        np = pytest.importorskip('numpy')
+        assert isinstance(DynamicArray(dtype='q')._data, array.array)
+        assert DynamicArray(dtype='int64')._data.dtype == np.int64
+        assert isinstance(DynamicArray()._data, list)
+    
+    def test_python_scalars(self):
+        """Test NumPy storage hands back Python numbers."""
+        arr = DynamicArray(dtype='int64')
+        arr.extend([4, 5])
+        assert type(arr[0]) is int
+        assert type(arr.sum()) is int
+        assert str(arr) == '[4, 5]'
+    
+    def test_search(self):
+        """Test vectorized search ignores the unused capacity."""
+        for dtype in self.DTYPES + [None]:
+            arr = DynamicArray(initial_capacity=16, dtype=dtype)
+            arr.extend([3, 1, 4, 1])
+            assert arr.search(1) == 1
+            assert arr.search(0) == -1
+            assert arr.search('x') == -1
+    
+    def test_reductions(self):
+        """Test sum, min and max."""
+        for dtype in self.DTYPES + [None]:
+            arr = DynamicArray(dtype=dtype)
+            assert arr.sum() == 0
+            with pytest.raises(ValueError):
+                arr.min()
+            arr.extend([3, -2, 8])
+            assert (arr.sum(), arr.min(), arr.max()) == (9, -2, 8)
+    
+    def test_selection_over_typed_storage(self):
+        """Test selection reads typed storage and can partition it in place."""
+        for dtype in self.DTYPES:
+            arr = DynamicArray(dtype=dtype)
+            arr.extend([5, 3, 9, 1, 7])
+            assert deterministic_select(arr, 2) == 3
+            assert arr.tolist() == [5, 3, 9, 1, 7]
+            assert deterministic_select(arr, 5, in_place=True) == 9
+            assert sorted(arr) == [1, 3, 5, 7, 9]
+    
+    def test_invalid_dtype(self):
+        """Test unknown dtypes are rejected."""
+        with pytest.raises(TypeError):
+            DynamicArray(dtype='not-a-dtype')
+
+
+class TestDynamicArrayCapacity:
+    """Test cases for DynamicArray growth, shrinking and capacity metrics."""
+    
+    def test_growth_factor(self):
+        """Test 1.5x growth."""
+        arr = DynamicArray(initial_capacity=4, growth_factor=1.5)
+        arr.extend(range(4))
+        arr.append(4)
+        assert arr.capacity == 6
+        assert arr.reallocations == 1
+    
+    def test_capped_growth(self):
+        """Test doubling capped at a fixed chunk of slots."""
+        arr = DynamicArray(initial_capacity=100, max_growth=10)
+        arr.extend(range(100))
+        arr.append(100)
+        assert arr.capacity == 110
+    
+    def test_shrink_hysteresis(self):
+        """Test the array shrinks only once the load factor reaches 1/4."""
+        arr = DynamicArray(initial_capacity=4)
+        arr.extend(range(64))
+        capacity = arr.capacity
+        while len(arr) > capacity // 4 + 1:
+            arr.delete(len(arr) - 1)
+        assert arr.capacity == capacity
+        arr.delete(0)
+        assert arr.capacity == 2 * len(arr)
+        assert arr.tolist() == list(range(1, 17))
+        arr.append(99)
+        assert arr.capacity == 32
+    
+    def test_shrink_respects_initial_capacity(self):
+        """Test shrinking never goes below the initial capacity."""
+        arr = DynamicArray(initial_capacity=16)
+        arr.extend(range(40))
+        arr.delete_range(0, 40)
+        assert arr.capacity == 16
+    
+    def test_no_shrink(self):
+        """Test shrink_threshold=None keeps the peak capacity."""
+        arr = DynamicArray(initial_capacity=2, shrink_threshold=None)
+        arr.extend(range(100))
+        arr.delete_range(0, 99)
+        assert arr.capacity == 100
+    
+    def test_reserve_and_shrink_to_fit(self):
+        """Test explicit capacity management."""
+        for dtype in (None, 'q', 'int64'):
+            arr = DynamicArray(initial_capacity=2, dtype=dtype)
+            arr.reserve(1000)
+            assert arr.capacity == 1000
+            arr.extend(range(1000))
+            assert arr.reallocations == 1
+            arr.reserve(10)
+            assert arr.capacity == 1000
+            arr.delete_range(500, 1000)
+            arr.shrink_to_fit()
+            assert arr.capacity == len(arr) == 500
+            assert arr.wasted_bytes == 0
+            assert arr.tolist() == list(range(500))
+    
+    def test_wasted_bytes(self):
+        """Test unused slots are reported in bytes per storage type."""
+        assert DynamicArray(initial_capacity=10, dtype='q').wasted_bytes == 80
+        assert DynamicArray(initial_capacity=10, dtype='f').wasted_bytes == 40
+        arr = DynamicArray(initial_capacity=10)
+        arr.append(1)
+        assert arr.wasted_bytes == 9 * 8
+    
+    def test_invalid_policy(self):
+        """Test inconsistent growth/shrink parameters are rejected."""
+        with pytest.raises(ValueError):
+            DynamicArray(growth_factor=1)
+        with pytest.raises(ValueError):
+            DynamicArray(max_growth=0)
+        with pytest.raises(ValueError):
+            DynamicArray(growth_factor=2, shrink_threshold=0.5)
+
+
+class TestDynamicArrayView:
+    """Test cases for DynamicArray slicing views and the iteration protocol."""
+    
+    def _filled(self, dtype=None):
+        """Build an array holding 0..9."""
+        arr = DynamicArray(dtype=dtype)
+        arr.extend(range(10))
+        return arr
+    
+    def test_negative_indexing(self):
+        """Test negative indices for access and assignment."""
+        arr = self._filled()
+        assert arr[-1] == 9 and arr[-10] == 0
+        arr[-2] = 80
+        assert arr[8] == 80
+        with pytest.raises(IndexError):
+            _ = arr[-11]
+    
+    def test_contains_and_str(self):
+        """Test membership and the string form."""
+        for dtype in (None, 'q', 'int64'):
+            arr = self._filled(dtype)
+            assert 3 in arr and 10 not in arr
+            assert str(arr) == str(list(range(10)))
+        assert str(DynamicArray()) == '[]'
+    
+    def test_slices_share_storage(self):
+        """Test slicing returns views over the parent's storage."""
+        arr = self._filled()
+        view = arr[2:8:2]
+        assert isinstance(view, DynamicArrayView)
+        assert view._data is arr._data
+        assert list(view) == [2, 4, 6]
+        assert view[-1] == 6 and len(view) == 3
+        assert list(arr[::-3]) == [9, 6, 3, 0]
+        assert list(view[1:]) == [4, 6]
+    
+    def test_copy_on_write(self):
+        """Test views keep their values when the parent changes."""
+        for dtype in (None, 'q', 'int64'):
+            arr = self._filled(dtype)
+            view = arr[0:4]
+            reversed_view = arr[::-1]
+            arr[0] = 100
+            arr.insert(0, -1)
+            arr.delete_range(0, 5)
+            assert view.tolist() == [0, 1, 2, 3], dtype
+            assert reversed_view.tolist() == list(range(9, -1, -1)), dtype
+            assert view._data is not arr._data
+    
+    def test_append_keeps_sharing(self):
+        """Test appending past the view does not force a copy."""
+        arr = DynamicArray(initial_capacity=16)
+        arr.extend(range(10))
+        view = arr[:5]
+        arr.append(10)
+        assert view._data is arr._data
+        assert str(view) == '[0, 1, 2, 3, 4]'
+    
+    def test_aggregation_and_selection(self):
+        """Test views feed reductions and selection directly."""
+        for dtype in (None, 'q', 'int64'):
+            arr = DynamicArray(dtype=dtype)
+            arr.extend([5, 3, 9, 1, 7, 2])
+            window = arr[1:5]
+            assert (window.sum(), window.min(), window.max()) == (20, 1, 9)
+            assert 9 in window and 5 not in window
+            assert deterministic_select(window, 2) == 3
+            assert arr.tolist() == [5, 3, 9, 1, 7, 2]
+        with pytest.raises(ValueError):
+            arr[3:3].min()
+    
+    def test_in_place_selection_detaches_views(self):
+        """Test partitioning the parent in place does not disturb its views."""
+        arr = DynamicArray()
+        arr.extend([5, 3, 9, 1, 7])
+        view = arr[:3]
+        deterministic_select(arr, 1, in_place=True)
+        assert view.tolist() == [5, 3, 9]
+    
+    def test_dead_views_are_forgotten(self):
+        """Test the parent does not keep references to discarded views."""
+        arr = self._filled()
+        for _ in range(100):
+            arr[1:3].sum()
+        assert len(arr._views) == 0
+
 
+class TestGapBuffer:
+    """Test cases for GapBuffer."""
+    
+    def test_matches_list_under_random_edits(self):
+        """Test random inserts, deletes and cursor moves against a list."""
+        rng = random.Random(42)
+        buffer, expected = GapBuffer(initial_capacity=1), []
+        for _ in range(500):
+            roll = rng.random()
+            if roll < 0.4:
+                index = rng.randint(0, len(expected))
+                buffer.insert(index, roll)
+                expected.insert(index, roll)
+            elif roll < 0.6 and expected:
+                index = rng.randrange(len(expected))
+                assert buffer.delete(index) == expected.pop(index)
+            elif roll < 0.8:
+                buffer.move_cursor(rng.randint(0, len(expected)))
+            else:
+                buffer.append(roll)
+                expected.append(roll)
+            assert list(buffer) == expected
+        assert buffer.tolist() == expected and len(buffer) == len(expected)
+    
+    def test_cursor_editing(self):
+        """Test typing and deleting around the cursor."""
+        buffer = GapBuffer(initial_capacity=2)
+        buffer.extend('hello')
+        buffer.move_cursor(0)
+        buffer.insert_at_cursor('>')
+        assert buffer.cursor == 1
+        buffer.move_cursor(len(buffer))
+        assert buffer.delete_before_cursor() == 'o'
+        buffer.move_cursor(2)
+        assert buffer.delete_at_cursor() == 'e'
+        assert ''.join(buffer) == '>hll'
+        assert all(slot is None for slot in buffer._data[buffer._gap_start:buffer._gap_end])
+    
+    def test_indexing_api(self):
+        """Test access, assignment, negative indices, search and membership."""
+        buffer = GapBuffer()
+        buffer.extend([1, 2, 3, 4])
+        buffer.move_cursor(2)
+        assert [buffer[i] for i in range(4)] == [1, 2, 3, 4]
+        assert buffer[-1] == 4
+        buffer[3] = 40
+        assert buffer.search(40) == 3 and buffer.search(2) == 1
+        assert 3 in buffer and 5 not in buffer
+        assert str(buffer) == '[1, 2, 3, 40]'
+    
+    def test_errors(self):
+        """Test out-of-range indices and edits at the ends."""
+        buffer = GapBuffer()
+        with pytest.raises(IndexError):
+            buffer.delete_before_cursor()
+        with pytest.raises(IndexError):
+            buffer.delete_at_cursor()
+        buffer.append(1)
+        with pytest.raises(IndexError):
+            _ = buffer[1]
+        with pytest.raises(IndexError):
+            buffer.move_cursor(2)
+        with pytest.raises(IndexError):
+            buffer.delete(1)
+    
+    def test_selection(self):
+        """Test selection reads a gap buffer directly."""
+        buffer = GapBuffer()
+        buffer.extend([5, 3, 9, 1, 7])
+        buffer.move_cursor(2)
+        assert deterministic_select(buffer, 2) == 3
+        assert list(buffer) == [5, 3, 9, 1, 7]
 
 class TestMatrix:
     """Test cases for Matrix."""
@@ -91,6 +479,299 @@ class TestMatrix:
         matrix = Matrix(2, 2)
         with pytest.raises(IndexError):
             _ = matrix[3, 0]
+        with pytest.raises(IndexError):
+            matrix.row(2)
+    
+    def test_constructors(self):
+        """Test the bulk constructors build a flat row-major buffer."""
+        matrix = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+        assert matrix.shape == (2, 3) and matrix._data == [1, 2, 3, 4, 5, 6]
+        assert Matrix.from_iterable(range(6), 3, 2).tolist() == [[0, 1], [2, 3], [4, 5]]
+        with pytest.raises(ValueError):
+            Matrix.from_rows([[1, 2], [3]])
+        with pytest.raises(ValueError):
+            Matrix.from_iterable(range(5), 3, 2)
+    
+    def test_from_numpy(self):
+        """Test a 2-D NumPy array becomes a matrix of Python scalars."""
+        np = pytest.importorskip('numpy')
+        matrix = Matrix.from_numpy(np.arange(6).reshape(2, 3))
+        assert matrix.tolist() == [[0, 1, 2], [3, 4, 5]]
+        assert type(matrix[1, 2]) is int
+        with pytest.raises(ValueError):
+            Matrix.from_numpy(np.arange(3))
+    
+    def test_views_share_storage(self):
+        """Test rows, columns, submatrices and transposes are views."""
+        matrix = Matrix.from_iterable(range(12), 3, 4)
+        assert matrix.row(1).tolist() == [[4, 5, 6, 7]]
+        assert matrix.column(2).ravel() == [2, 6, 10]
+        assert matrix.submatrix(1, 3, 1, 3).tolist() == [[5, 6], [9, 10]]
+        transposed = matrix.T
+        assert transposed.shape == (4, 3)
+        assert transposed.tolist() == [list(column) for column in zip(*matrix.tolist())]
+        for view in (matrix.row(1), matrix.column(2), matrix.submatrix(1, 3, 1, 3), transposed):
+            assert view._data is matrix._data
+        transposed[3, 2] = 99
+        matrix.submatrix(1, 3, 1, 3)[0, 0] = 50
+        assert matrix[2, 3] == 99 and matrix[1, 1] == 50
+    
+    def test_strided_slices(self):
+        """Test slices with steps, including reversed axes."""
+        matrix = Matrix.from_iterable(range(12), 3, 4)
+        assert matrix[::2, ::-2].tolist() == [[3, 1], [11, 9]]
+        assert matrix[::-1, 1].ravel() == [9, 5, 1]
+        assert matrix[1:, :].T[::-1, :].tolist() == [[7, 11], [6, 10], [5, 9], [4, 8]]
+        assert matrix[0:0, :].tolist() == []
+    
+    def test_copy_is_independent(self):
+        """Test copy() detaches from the original storage."""
+        matrix = Matrix.from_rows([[1, 2], [3, 4]])
+        copied = matrix.T.copy()
+        copied[0, 1] = 30
+        assert copied.tolist() == [[1, 30], [2, 4]] and copied.is_contiguous()
+        assert matrix.tolist() == [[1, 2], [3, 4]]
+
+
+class TestMatrixSelection:
+    """Test cases for Matrix selection, median and quantiles."""
+    
+    def _grid(self, values):
+        """Build a Matrix from a list of rows."""
+        matrix = Matrix(len(values), len(values[0]))
+        for i, row in enumerate(values):
+            for j, value in enumerate(row):
+                matrix[i, j] = value
+        return matrix
+    
+    def test_select_whole_matrix(self):
+        """Test selection over every cell."""
+        matrix = self._grid([[5, 1, 9], [3, 7, 2]])
+        assert matrix.select(1) == 1
+        assert matrix.select(6) == 9
+    
+    def test_select_axis(self):
+        """Test per-column (axis=0) and per-row (axis=1) selection."""
+        matrix = self._grid([[5, 1, 9], [3, 7, 2]])
+        assert matrix.select(1, axis=0) == [3, 1, 2]
+        assert matrix.select(3, axis=1) == [9, 7]
+    
+    def test_median(self):
+        """Test lower medians over rows, columns and the whole matrix."""
+        matrix = self._grid([[4.0, 1.5, 3.0, 2.0], [8.0, 6.0, 7.0, 5.0]])
+        assert matrix.median(axis=1) == [2.0, 6.0]
+        assert matrix.median(axis=0) == [4.0, 1.5, 3.0, 2.0]
+        assert matrix.median() == 4.0
+    
+    def test_quantiles(self):
+        """Test nearest-rank quantiles per row."""
+        matrix = self._grid([[10, 20, 30, 40, 50], [5, 4, 3, 2, 1]])
+        assert matrix.quantiles([0, 0.5, 1], axis=1) == [[10, 30, 50], [1, 3, 5]]
+        assert matrix.quantiles([0.1]) == [1]
+    
+    def test_object_cells(self):
+        """Test non-numeric cells use the pure-Python path."""
+        matrix = self._grid([['b', 'a'], ['d', 'c']])
+        assert matrix.select(1, axis=1) == ['a', 'c']
+        assert matrix.median(axis=0) == ['b', 'a']
+    
+    def test_invalid_arguments(self):
+        """Test invalid axis, k and quantile values."""
+        matrix = self._grid([[1, 2], [3, 4]])
+        with pytest.raises(ValueError):
+            matrix.select(1, axis=2)
+        with pytest.raises(ValueError):
+            matrix.select(3, axis=1)
+        with pytest.raises(ValueError):
+            matrix.quantiles([1.5])
+    
+    def test_median_filter(self):
+        """Test a 3x3 median filter removes an isolated outlier."""
+        matrix = self._grid([[1, 1, 1], [1, 99, 1], [1, 1, 1]])
+        filtered = matrix.median_filter(3)
+        assert filtered.tolist() == [[1, 1, 1], [1, 1, 1], [1, 1, 1]]
+        assert matrix[1, 1] == 99
+    
+    def test_rank_filter(self):
+        """Test min and max rank filters with edge replication."""
+        matrix = self._grid([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        assert matrix.rank_filter(3, 1).tolist() == [[1.0, 1.0, 2.0], [1.0, 1.0, 2.0]]
+        assert matrix.rank_filter(3, 9).tolist() == [[5.0, 6.0, 6.0], [5.0, 6.0, 6.0]]
+    
+    def test_view_selection(self):
+        """Test reductions over transposed and strided views."""
+        matrix = self._grid([[5, 1, 9], [3, 7, 2]])
+        assert matrix.T.select(1, axis=1) == [3, 1, 2]
+        assert matrix[:, ::2].median(axis=0) == [3, 2]
+        assert matrix.T.median_filter(1).tolist() == [[5, 3], [1, 7], [9, 2]]
+
+
+class TestMatrixArithmetic:
+    """Test cases for Matrix arithmetic and reductions."""
+    
+    def test_elementwise(self):
+        """Test cellwise operators with matrices and scalars on either side."""
+        matrix = Matrix.from_rows([[1, 2], [3, 4]])
+        assert (matrix + matrix).tolist() == [[2, 4], [6, 8]]
+        assert (10 - matrix).tolist() == [[9, 8], [7, 6]]
+        assert (matrix * 2.5).tolist() == [[2.5, 5.0], [7.5, 10.0]]
+        assert (matrix / 2).tolist() == [[0.5, 1.0], [1.5, 2.0]]
+        assert (-matrix.T).tolist() == [[-1, -3], [-2, -4]]
+        with pytest.raises(ValueError):
+            matrix + Matrix(2, 3)
+    
+    def test_matmul(self):
+        """Test the matrix product, including transposed and strided views."""
+        matrix = Matrix.from_iterable(range(6), 2, 3)
+        assert (matrix @ matrix.T).tolist() == [[5, 14], [14, 50]]
+        assert (matrix.T @ matrix[:, ::2]).tolist() == [[9, 15], [12, 22], [15, 29]]
+        with pytest.raises(ValueError):
+            matrix @ matrix
+    
+    def test_reductions(self):
+        """Test sum, mean, min and max over the matrix, columns and rows."""
+        matrix = Matrix.from_rows([[1, 5, 3], [4, 2, 6]])
+        assert matrix.sum() == 21 and type(matrix.sum()) is int
+        assert matrix.sum(axis=0) == [5, 7, 9]
+        assert matrix.mean(axis=1) == [3.0, 4.0]
+        assert matrix.min(axis=0) == [1, 2, 3]
+        assert matrix.max() == 6
+        with pytest.raises(ValueError):
+            matrix.sum(axis=2)
+        with pytest.raises(IndexError):
+            Matrix(0, 3).max()
+        assert Matrix(0, 3).sum(axis=0) == [0, 0, 0]
+    
+    def test_typed_storage(self):
+        """Test typed buffers run through NumPy and stay unboxed."""
+        pytest.importorskip('numpy')
+        matrix = Matrix.from_iterable(range(6), 2, 3, typecode='q')
+        assert isinstance(matrix._data, array.array)
+        doubled = matrix[::-1, ::-1] * 2
+        assert isinstance(doubled._data, array.array)
+        assert doubled.tolist() == [[10, 8, 6], [4, 2, 0]]
+        assert (matrix.T @ matrix).tolist() == [[9, 12, 15], [12, 17, 22], [15, 22, 29]]
+        assert matrix.T.sum(axis=1) == [3, 5, 7] and type(matrix.sum()) is int
+    
+    def test_int64_overflow_falls_back(self):
+        """Test integer results that overflow int64 are computed exactly."""
+        matrix = Matrix.from_iterable([2 ** 62, 1, 1, 1], 2, 2, typecode='q')
+        assert (matrix + matrix)[0, 0] == 2 ** 63
+        assert (matrix @ matrix)[0, 0] == 2 ** 124 + 1
+        assert matrix.sum() == 2 ** 62 + 3
+    
+    def test_narrow_integer_types_do_not_wrap(self):
+        """Test int32 and unsigned typed matrices give exact results instead of wrapping."""
+        signed = Matrix.from_iterable([2 ** 31 - 1, -2 ** 31], 1, 2, typecode='i')
+        assert (signed + 1).tolist() == [[2 ** 31, -2 ** 31 + 1]]
+        assert (signed @ Matrix.from_iterable([2, 1], 2, 1, typecode='i')).tolist() == [[2 ** 31 - 2]]
+        unsigned = Matrix.from_iterable([200, 3], 1, 2, typecode='B')
+        assert (unsigned + 100).tolist() == [[300, 103]]
+        assert (unsigned - 5).tolist() == [[195, -2]]
+        assert (unsigned - unsigned[:, ::-1]).tolist() == [[197, -197]]
+        assert (unsigned + 1).tolist() == [[201, 4]]
+    
+    def test_division_by_zero(self):
+        """Test list and typed buffers both raise ZeroDivisionError."""
+        for typecode in (None, 'd', 'q'):
+            matrix = Matrix.from_iterable([1, 2], 1, 2, typecode=typecode)
+            with pytest.raises(ZeroDivisionError):
+                matrix / 0
+            with pytest.raises(ZeroDivisionError):
+                matrix / Matrix.from_iterable([1, 0], 1, 2, typecode=typecode)
+    
+    def test_object_cells(self):
+        """Test Fractions and strings use Python arithmetic."""
+        half = Fraction(1, 2)
+        matrix = Matrix.from_rows([[half, 1], [2, half]])
+        assert (matrix @ matrix).tolist() == [[Fraction(9, 4), 1], [2, Fraction(9, 4)]]
+        assert matrix.mean() == Fraction(1, 1)
+        assert ('x' + Matrix.from_rows([['a', 'b']])).tolist() == [['xa', 'xb']]
+
+
+class TestMatrixMemmap:
+    """Test cases for memory-mapped matrices."""
+    
+    def test_write_flush_reopen(self, tmp_path):
+        """Test cells written through a mapping persist after flush."""
+        path = str(tmp_path / 'grid.bin')
+        matrix = Matrix.open_memmap(path, 4, 3, 'float64', mode='w+')
+        assert matrix.tolist() == [[0.0] * 3] * 4
+        for i in range(4):
+            matrix[i, 1] = float(i * i)
+        matrix.T[2, 3] = -1.0
+        matrix.flush()
+        matrix.close()
+        
+        reopened = Matrix.open_memmap(path, 4, 3, 'd', mode='r')
+        assert reopened.column(1).ravel() == [0.0, 1.0, 4.0, 9.0]
+        assert reopened[3, 2] == -1.0
+        with pytest.raises(TypeError):
+            reopened[0, 0] = 1.0
+        reopened.close()
+    
+    def test_selection_and_reductions(self, tmp_path):
+        """Test column selection and reductions read the mapped file."""
+        path = str(tmp_path / 'grid.bin')
+        values = list(range(60))
+        random.Random(7).shuffle(values)
+        with open(path, 'wb') as file:
+            array.array('q', values).tofile(file)
+        matrix = Matrix.open_memmap(path, 12, 5, 'q', mode='r')
+        expected = Matrix.from_iterable(values, 12, 5)
+        assert matrix.column(2).median() == expected.column(2).median()
+        assert matrix.median(axis=0) == expected.median(axis=0)
+        assert matrix.sum(axis=1) == expected.sum(axis=1)
+        assert matrix.submatrix(2, 5, 1, 3).max() == expected.submatrix(2, 5, 1, 3).max()
+        assert (matrix.T @ matrix).tolist() == (expected.T @ expected).tolist()
+        matrix.close()
+    
+    def test_copy_on_write(self, tmp_path):
+        """Test mode 'c' never writes changes back to the file."""
+        path = str(tmp_path / 'grid.bin')
+        Matrix.open_memmap(path, 2, 2, 'i', mode='w+').close()
+        private = Matrix.open_memmap(path, 2, 2, 'i', mode='c')
+        private[0, 0] = 5
+        private.flush()
+        assert private[0, 0] == 5
+        private.close()
+        assert Matrix.open_memmap(path, 2, 2, 'i', mode='r')[0, 0] == 0
+    
+    def test_invalid_arguments(self, tmp_path):
+        """Test unknown modes and dtypes and files that are too small."""
+        path = str(tmp_path / 'grid.bin')
+        Matrix.open_memmap(path, 2, 2, 'd', mode='w+').close()
+        with pytest.raises(ValueError):
+            Matrix.open_memmap(path, 2, 2, 'd', mode='a')
+        with pytest.raises(ValueError):
+            Matrix.open_memmap(path, 2, 2, 'u')
+        with pytest.raises(ValueError):
+            Matrix.open_memmap(path, 3, 2, 'd', mode='r')
+    
+    def test_close_with_live_view_and_export(self, tmp_path):
+        """Test close reports a live exported array and views fail cleanly afterwards."""
+        np = pytest.importorskip('numpy')
+        path = str(tmp_path / 'grid.bin')
+        matrix = Matrix.open_memmap(path, 2, 2, 'd', mode='w+')
+        view = matrix.row(1)
+        matrix[1, 0] = 2.0
+        exported = np.asarray(matrix._data)
+        with pytest.raises(BufferError):
+            matrix.close()
+        assert exported[2] == 2.0
+        with pytest.raises(ValueError):
+            view[0, 0]
+        with pytest.raises(ValueError):
+            view.flush()
+        del exported
+        matrix.close()
+    
+    def test_flush_on_plain_matrix(self):
+        """Test flush and close are no-ops without a mapping."""
+        matrix = Matrix.from_rows([[1, 2]])
+        matrix.flush()
+        matrix.close()
+        assert matrix.tolist() == [[1, 2]]
 
 
 class TestStack:
@@ -124,7 +805,14 @@ class TestStack:
         stack = Stack()
         with pytest.raises(IndexError):
             stack.pop()
-
+    
+    def test_len_and_iteration(self):
+        """Test len() and bottom-to-top iteration."""
+        stack = Stack()
+        for value in [1, 2, 3]:
+            stack.push(value)
+        assert len(stack) == 3
+        assert list(stack) == [1, 2, 3]
 
 class TestQueue:
     """Test cases for Queue."""
@@ -157,6 +845,301 @@ class TestQueue:
         queue = Queue()
         with pytest.raises(IndexError):
             queue.dequeue()
+    
+    def test_len_and_iteration(self):
+        """Test len() and front-to-rear iteration."""
+        queue = Queue()
+        for value in [1, 2, 3]:
+            queue.enqueue(value)
+        queue.dequeue()
+        assert len(queue) == 2
+        assert list(queue) == [2, 3]
+    
+    def test_wraparound_matches_list(self):
+        """Test interleaved enqueues and dequeues that wrap around the buffer."""
+        rng = random.Random(42)
+        queue, expected = Queue(initial_capacity=1), []
+        for i in range(3000):
+            if rng.random() < 0.55 or not expected:
+                queue.enqueue(i)
+                expected.append(i)
+            else:
+                assert queue.dequeue() == expected.pop(0)
+            if i % 100 == 0:
+                assert list(queue) == expected and str(queue) == str(expected)
+        assert queue.peek() == expected[0] and len(queue) == len(expected)
+    
+    def test_capacity_grows_and_shrinks(self):
+        """Test the buffer stays a power of two, doubles when full and shrinks once drained."""
+        queue = Queue(initial_capacity=5)
+        assert queue.capacity == 8
+        for i in range(1000):
+            queue.enqueue(i)
+        assert queue.capacity == 1024
+        for i in range(1000):
+            assert queue.dequeue() == i
+        assert queue.capacity == 8 and queue.is_empty()
+        assert all(slot is None for slot in queue._data)
+
+
+class TestBoundedQueue:
+    """Test cases for BoundedQueue."""
+    
+    def test_fifo_and_bound(self):
+        """Test FIFO order and that try_enqueue refuses once maxsize is reached."""
+        queue = BoundedQueue(3)
+        assert all(queue.try_enqueue(i) for i in range(3))
+        assert not queue.try_enqueue(3)
+        assert len(queue) == 3 and list(queue) == [0, 1, 2] and queue.peek() == 0
+        assert queue.try_dequeue() == (True, 0)
+        assert queue.dequeue() == 1 and queue.dequeue() == 2
+        assert queue.try_dequeue() == (False, None)
+        with pytest.raises(ValueError):
+            BoundedQueue(0)
+    
+    def test_timeouts(self):
+        """Test blocking calls give up with TimeoutError."""
+        queue = BoundedQueue(1)
+        with pytest.raises(TimeoutError):
+            queue.dequeue(timeout=0.01)
+        queue.enqueue('a')
+        with pytest.raises(TimeoutError):
+            queue.enqueue('b', timeout=0.01)
+        assert list(queue) == ['a']
+    
+    def test_blocked_producer_resumes(self):
+        """Test a producer blocked on a full queue continues once a consumer frees space."""
+        queue = BoundedQueue(1)
+        queue.enqueue(1)
+        producer = threading.Thread(target=queue.enqueue, args=(2,))
+        producer.start()
+        time.sleep(0.02)
+        assert producer.is_alive() and len(queue) == 1
+        assert queue.dequeue(timeout=1) == 1
+        producer.join(timeout=1)
+        assert not producer.is_alive() and queue.dequeue(timeout=1) == 2
+    
+    def test_batches(self):
+        """Test enqueue_many fills free space and dequeue_many returns up to max_n items."""
+        queue = BoundedQueue(4)
+        assert queue.enqueue_many(range(3)) == 3
+        assert queue.enqueue_many(range(3, 6), timeout=0.01) == 1
+        assert queue.dequeue_many(3) == [0, 1, 2]
+        assert queue.dequeue_many(10) == [3]
+        assert queue.dequeue_many(10, timeout=0.01) == []
+        with pytest.raises(ValueError):
+            queue.dequeue_many(0)
+    
+    def test_enqueue_many_total_timeout(self):
+        """Test enqueue_many's timeout bounds the whole call while a slow consumer frees space."""
+        queue, stop = BoundedQueue(1), threading.Event()
+        
+        def consume():
+            while not stop.wait(0.02):
+                queue.try_dequeue()
+        
+        consumer = threading.Thread(target=consume, daemon=True)
+        consumer.start()
+        try:
+            start = time.monotonic()
+            added = queue.enqueue_many(range(100), timeout=0.1)
+            elapsed = time.monotonic() - start
+        finally:
+            stop.set()
+            consumer.join(timeout=1)
+        assert 0 < added < 100
+        assert elapsed < 0.5
+    
+    def test_many_producers_and_consumers(self):
+        """Test every item arrives exactly once with several threads on each side."""
+        queue, received, lock = BoundedQueue(8), [], threading.Lock()
+        
+        def produce(start):
+            for i in range(start, start + 500, 50):
+                queue.enqueue_many(range(i, i + 50), timeout=5)
+        
+        def consume():
+            count = 0
+            while count < 500:
+                if count % 2:
+                    batch = queue.dequeue_many(min(7, 500 - count), timeout=5)
+                else:
+                    batch = [queue.dequeue(timeout=5)]
+                count += len(batch)
+                with lock:
+                    received.extend(batch)
+        
+        threads = [threading.Thread(target=produce, args=(i * 500,), daemon=True) for i in range(4)]
+        threads += [threading.Thread(target=consume, daemon=True) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert not any(thread.is_alive() for thread in threads)
+        assert sorted(received) == list(range(2000))
+
+
+class TestAsyncQueue:
+    """Test cases for AsyncQueue and AsyncStack."""
+    
+    def test_order(self):
+        """Test the queue is FIFO, the stack LIFO, and get_many returns up to max_n items."""
+        async def main():
+            queue, stack = AsyncQueue(), AsyncStack()
+            for i in range(5):
+                await queue.put(i)
+                await stack.put(i)
+            assert await queue.get() == 0 and await stack.get() == 4
+            assert await queue.get_many(3) == [1, 2, 3]
+            assert await stack.get_many(10) == [3, 2, 1, 0]
+            assert queue.try_get() == (True, 4) and queue.try_get() == (False, None)
+            with pytest.raises(ValueError):
+                await queue.get_many(0)
+        
+        asyncio.run(main())
+    
+    def test_bound_blocks_producer(self):
+        """Test put waits while the queue is full and resumes once a get frees a slot."""
+        async def main():
+            queue = AsyncQueue(2)
+            await queue.put('a')
+            await queue.put('b')
+            assert queue.full() and not queue.try_put('x')
+            producer = asyncio.ensure_future(queue.put('c'))
+            await asyncio.sleep(0)
+            assert not producer.done() and len(queue) == 2
+            assert await queue.get() == 'a'
+            await asyncio.wait_for(producer, 1)
+            assert list(queue) == ['b', 'c']
+        
+        asyncio.run(main())
+    
+    def test_fair_wakeups(self):
+        """Test waiting getters and putters are served in arrival order."""
+        async def main():
+            queue = AsyncQueue(1)
+            getters = [asyncio.ensure_future(queue.get()) for _ in range(3)]
+            await asyncio.sleep(0)
+            for i in range(3):
+                await queue.put(i)
+            assert [await getter for getter in getters] == [0, 1, 2]
+            
+            await queue.put('first')
+            putters = [asyncio.ensure_future(queue.put(name)) for name in ('second', 'third')]
+            await asyncio.sleep(0)
+            assert not queue.try_put('late')
+            assert [await queue.get() for _ in range(3)] == ['first', 'second', 'third']
+            await asyncio.gather(*putters)
+        
+        asyncio.run(main())
+    
+    def test_cancelled_getter_is_skipped(self):
+        """Test a cancelled get does not swallow the next element."""
+        async def main():
+            queue = AsyncQueue()
+            cancelled = asyncio.ensure_future(queue.get())
+            waiting = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await queue.put(1)
+            assert await asyncio.wait_for(waiting, 1) == 1
+        
+        asyncio.run(main())
+    
+    def test_close_and_async_iteration(self):
+        """Test async for drains the queue after close and waiting getters are released."""
+        async def main():
+            queue, stack = AsyncQueue(), AsyncStack()
+            blocked = asyncio.ensure_future(stack.get())
+            await asyncio.sleep(0)
+            stack.close()
+            with pytest.raises(IndexError):
+                await blocked
+            
+            async def produce():
+                for i in range(100):
+                    await queue.put(i)
+                queue.close()
+            
+            producer = asyncio.ensure_future(produce())
+            received = [value async for value in queue]
+            await producer
+            assert received == list(range(100))
+            with pytest.raises(RuntimeError):
+                await queue.put(0)
+        
+        asyncio.run(main())
+
+
+class TestPriorityQueue:
+    """Test cases for PriorityQueue and IndexedPriorityQueue."""
+    
+    @pytest.mark.parametrize("d", [2, 3, 4, 8])
+    def test_heap_order(self, d):
+        """Test push/pop, heapify and pushpop return elements in sorted order."""
+        rng = random.Random(d)
+        values = [rng.randint(0, 100) for _ in range(200)]
+        heap = PriorityQueue(values, d=d)
+        assert len(heap) == 200 and heap.peek() == min(values)
+        assert [heap.pop() for _ in range(200)] == sorted(values)
+        
+        heap = PriorityQueue(d=d)
+        for value in values:
+            heap.push(value)
+        assert heap.pushpop(-1) == -1
+        assert heap.pushpop(1000) == min(values)
+        assert [heap.pop() for _ in range(len(heap))] == sorted(values)[1:] + [1000]
+        with pytest.raises(IndexError):
+            heap.pop()
+        with pytest.raises(ValueError):
+            PriorityQueue(d=1)
+    
+    @pytest.mark.parametrize("d", [2, 4])
+    def test_indexed_decrease_key_and_remove(self, d):
+        """Test entries can be lowered and removed by handle."""
+        rng = random.Random(d)
+        queue = IndexedPriorityQueue(d=d)
+        priorities = {queue.push(f"v{i}", rng.randint(0, 1000)): None for i in range(300)}
+        for handle in priorities:
+            priorities[handle] = queue.priority(handle)
+        for handle in rng.sample(list(priorities), 100):
+            priorities[handle] -= rng.randint(0, 500)
+            queue.decrease_key(handle, priorities[handle])
+        for handle in rng.sample(list(priorities), 50):
+            assert queue.remove(handle) == f"v{handle}"
+            del priorities[handle]
+            assert handle not in queue
+        popped = [queue.pop()[1] for _ in range(len(queue))]
+        assert popped == sorted(priorities.values()) and queue.is_empty()
+    
+    def test_indexed_errors(self):
+        """Test increasing a key and unknown handles are rejected."""
+        queue = IndexedPriorityQueue()
+        handle = queue.push('a', 5)
+        assert queue.peek() == ('a', 5)
+        with pytest.raises(ValueError):
+            queue.decrease_key(handle, 6)
+        assert queue.pop() == ('a', 5)
+        with pytest.raises(KeyError):
+            queue.remove(handle)
+        with pytest.raises(IndexError):
+            queue.pop()
+    
+    def test_dijkstra(self):
+        """Test decrease_key drives Dijkstra's shortest paths on a small graph."""
+        graph = {'a': {'b': 7, 'c': 9, 'f': 14}, 'b': {'c': 10, 'd': 15}, 'c': {'d': 11, 'f': 2},
+                 'd': {'e': 6}, 'e': {}, 'f': {'e': 9}}
+        queue = IndexedPriorityQueue()
+        handles = {node: queue.push(node, 0 if node == 'a' else float('inf')) for node in graph}
+        dist = {}
+        while queue:
+            node, d = queue.pop()
+            dist[node] = d
+            for neighbor, weight in graph[node].items():
+                handle = handles[neighbor]
+                if handle in queue and d + weight < queue.priority(handle):
+                    queue.decrease_key(handle, d + weight)
+        assert dist == {'a': 0, 'b': 7, 'c': 9, 'd': 20, 'e': 20, 'f': 11}
 
 
 class TestLinkedList:
@@ -216,7 +1199,15 @@ class TestLinkedList:
         ll.append(1)
         with pytest.raises(IndexError):
             ll.get(1)
-
+    
+    def test_iteration(self):
+        """Test iteration from head to tail."""
+        ll = LinkedList()
+        assert list(ll) == []
+        ll.append(2)
+        ll.prepend(1)
+        ll.append(3)
+        assert list(ll) == [1, 2, 3]
 
 class TestTree:
     """Test cases for Tree."""
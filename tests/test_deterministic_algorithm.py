@@ -5,8 +5,13 @@ Author: Carlos Gutierrez
 Course: MSCS532 - Data Structures and Algorithms
 """
 
+import array
+
 import pytest
-from src.deterministic_algorithm import deterministic_select, find_median
+from src.data_structures import DynamicArray, LinkedList, Queue, Stack
+from src.deterministic_algorithm import (
+    deterministic_select, find_median, argselect, argselect_many
+)
 
 
 class TestDeterministicSelect:
@@ -75,6 +80,104 @@ class TestDeterministicSelect:
         assert deterministic_select(arr, 100) == 100
 
 
+class TestBufferInputs:
+    """Test cases for buffer-protocol inputs."""
+    
+    def test_array_double(self):
+        """Test selection over array.array('d')."""
+        buf = array.array('d', [3.5, 1.5, 4.5, 1.0, 5.5])
+        assert deterministic_select(buf, 1) == 1.0
+        assert deterministic_select(buf, 3) == 3.5
+        assert list(buf) == [3.5, 1.5, 4.5, 1.0, 5.5]
+    
+    def test_memoryview(self):
+        """Test selection over a memoryview of an int array."""
+        view = memoryview(array.array('q', range(20, 0, -1)))
+        for i in range(1, 21):
+            assert deterministic_select(view, i) == i
+    
+    def test_bytes(self):
+        """Test selection over bytes and bytearray."""
+        assert deterministic_select(b'\x05\x01\x03', 2) == 3
+        assert deterministic_select(bytearray([9, 7, 8]), 1) == 7
+    
+    def test_multidimensional_memoryview(self):
+        """Test that every cell of a 2-D buffer is considered."""
+        view = memoryview(bytes([6, 5, 4, 3, 2, 1])).cast('B', shape=[2, 3])
+        assert deterministic_select(view, 1) == 1
+        assert deterministic_select(view, 6) == 6
+        assert find_median(view) == 3
+    
+    def test_in_place(self):
+        """Test in-place selection partitions the buffer itself."""
+        buf = array.array('i', [5, 3, 1, 4, 2])
+        assert deterministic_select(buf, 3, in_place=True) == 3
+        assert sorted(buf) == [1, 2, 3, 4, 5]
+    
+    def test_readonly_buffer_copied(self):
+        """Test in-place request on a read-only buffer falls back to a copy."""
+        data = bytes([3, 2, 1])
+        assert deterministic_select(data, 1, in_place=True) == 1
+        assert data == bytes([3, 2, 1])
+    
+    def test_empty_buffer(self):
+        """Test selection over an empty buffer."""
+        with pytest.raises(IndexError):
+            deterministic_select(array.array('d'), 1)
+
+
+
+class TestContainerInputs:
+    """Test cases for selecting directly from the project's containers."""
+    
+    def test_each_container(self):
+        """Test DynamicArray, LinkedList, Stack and Queue inputs."""
+        values = [(i * 37) % 101 for i in range(50)]
+        containers = [DynamicArray(), LinkedList(), Stack(), Queue()]
+        for value in values:
+            containers[0].append(value)
+            containers[1].append(value)
+            containers[2].push(value)
+            containers[3].enqueue(value)
+        expected = sorted(values)
+        for container in containers:
+            assert deterministic_select(container, 10) == expected[9]
+            assert find_median(container) == expected[24]
+            assert argselect(container, 1) == values.index(expected[0])
+            assert list(container) == values
+    
+    def test_dynamic_array_in_place(self):
+        """Test in-place selection reorders the DynamicArray's elements."""
+        arr = DynamicArray()
+        for value in [5.5, 2.5, 9.5, 1.5, 7.5]:
+            arr.append(value)
+        assert deterministic_select(arr, 2, in_place=True) == 2.5
+        assert sorted(arr) == [1.5, 2.5, 5.5, 7.5, 9.5]
+        assert len(arr) == 5
+
+
+class TestCountingDispatch:
+    """Test cases for the automatic counting engine on narrow integer ranges."""
+    
+    def test_narrow_range_matches_partitioning(self):
+        """Test the histogram path agrees with partitioning."""
+        arr = [(i * 37) % 101 for i in range(500)]
+        for k in [1, 100, 250, 500]:
+            assert deterministic_select(arr, k) == deterministic_select(arr, k, counting=False)
+    
+    def test_int_buffer(self):
+        """Test the histogram path on an integer buffer."""
+        buf = array.array('h', [200, 404, 500, 301] * 50)
+        assert deterministic_select(buf, 51) == 301
+    
+    def test_mixed_types_not_counted(self):
+        """Test bools and floats keep their original values."""
+        arr = [True, False] * 40
+        assert deterministic_select(arr, 1) is False
+        arr = [1.5, 2, 3] * 30
+        assert deterministic_select(arr, 1) == 1.5
+
+
 class TestFindMedian:
     """Test cases for find_median function."""
     
@@ -98,3 +201,54 @@ class TestFindMedian:
         with pytest.raises(ValueError):
             find_median([])
 
+
+
+class TestArgselect:
+    """Test cases for argselect and argselect_many."""
+    
+    def test_basic_indices(self):
+        """Test that original indices are returned."""
+        arr = [30, 10, 20, 40]
+        assert argselect(arr, 1) == 1
+        assert argselect(arr, 2) == 2
+        assert argselect(arr, 4) == 3
+    
+    def test_original_not_modified(self):
+        """Test the caller's data is left untouched."""
+        arr = [5, 4, 3, 2, 1]
+        argselect(arr, 3)
+        assert arr == [5, 4, 3, 2, 1]
+    
+    def test_ties_are_stable(self):
+        """Test duplicate keys resolve to the stable-sort position."""
+        arr = [2, 1, 2, 1, 2]
+        assert [argselect(arr, k) for k in range(1, 6)] == [1, 3, 0, 2, 4]
+    
+    def test_key_function(self):
+        """Test argselect with a key over records."""
+        records = [{'id': 'a', 'v': 3}, {'id': 'b', 'v': 1}, {'id': 'c', 'v': 2}]
+        assert argselect(records, 1, key=lambda r: r['v']) == 1
+    
+    def test_buffer_input(self):
+        """Test argselect over an array.array."""
+        buf = array.array('d', [0.5, 0.25, 0.75])
+        assert argselect(buf, 3) == 2
+    
+    def test_many_matches_sorted_order(self):
+        """Test argselect_many against a stable sort."""
+        arr = [7, 3, 9, 3, 1, 8, 2, 7, 5, 0] * 5
+        order = sorted(range(len(arr)), key=lambda i: arr[i])
+        ks = [50, 1, 25, 25, 13]
+        assert argselect_many(arr, ks) == [order[k - 1] for k in ks]
+    
+    def test_all_equal_large(self):
+        """Test many equal keys do not degrade into deep recursion."""
+        arr = [1] * 3000
+        assert argselect(arr, 1500) == 1499
+    
+    def test_invalid_k(self):
+        """Test invalid ranks and empty input."""
+        with pytest.raises(ValueError):
+            argselect_many([1, 2, 3], [1, 4])
+        with pytest.raises(IndexError):
+            argselect([], 1)
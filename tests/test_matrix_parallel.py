@@ -0,0 +1,80 @@
+"""
+Unit tests for tiled and parallel semiring matrix multiplication.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import math
+import operator
+import random
+from fractions import Fraction
+
+import pytest
+from src.data_structures import Matrix
+from src.matrix_parallel import (
+    BOOLEAN, MAX_PLUS, MIN_PLUS, PLUS_TIMES, Semiring, parallel_matmul, tiled_matmul
+)
+
+
+def fraction_matrix(rows, cols, seed):
+    """Build a matrix of random Fractions."""
+    rng = random.Random(seed)
+    cells = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(rows * cols)]
+    return Matrix.from_iterable(cells, rows, cols)
+
+
+class TestTiledMatmul:
+    """Test cases for tiled_matmul and parallel_matmul."""
+    
+    def test_matches_matmul_operator(self):
+        """Test tiles of every size (including ragged edges) give the exact product."""
+        a, b = fraction_matrix(7, 5, seed=1), fraction_matrix(5, 9, seed=2)
+        expected = (a @ b).tolist()
+        for block_size in (1, 2, 4, 64):
+            assert tiled_matmul(a, b, block_size=block_size).tolist() == expected
+        assert a.matmul(b).tolist() == expected
+    
+    def test_views(self):
+        """Test transposed and strided views as operands."""
+        a = fraction_matrix(6, 6, seed=3)
+        assert tiled_matmul(a.T, a[:, ::2], block_size=4).tolist() == (a.T @ a[:, ::2]).tolist()
+    
+    def test_worker_processes(self):
+        """Test tiles computed in worker processes match the in-process result."""
+        a, b = fraction_matrix(6, 4, seed=4), fraction_matrix(4, 5, seed=5)
+        result = parallel_matmul(a, b, block_size=2, workers=2)
+        assert result.tolist() == (a @ b).tolist()
+    
+    def test_min_plus_shortest_paths(self):
+        """Test min-plus squaring finds shortest paths of at most two hops."""
+        inf = math.inf
+        distances = Matrix.from_rows([[0, 1, inf], [inf, 0, 2], [5, inf, 0]])
+        two_hops = distances.matmul(distances, MIN_PLUS, block_size=2)
+        assert two_hops.tolist() == [[0, 1, 3], [7, 0, 2], [5, 6, 0]]
+        assert parallel_matmul(distances, two_hops, MIN_PLUS, block_size=1, workers=2).tolist() == [
+            [0, 1, 3], [7, 0, 2], [5, 6, 0]
+        ]
+    
+    def test_other_semirings(self):
+        """Test max-plus, boolean and a semiring without a fold."""
+        matrix = Matrix.from_rows([[1, 4], [2, 3]])
+        assert tiled_matmul(matrix, matrix, MAX_PLUS).tolist() == [[6, 7], [5, 6]]
+        edges = Matrix.from_rows([[False, True, False], [False, False, True], [False, False, False]])
+        assert tiled_matmul(edges, edges, BOOLEAN).tolist() == [
+            [False, False, True], [False, False, False], [False, False, False]
+        ]
+        pairwise = Semiring(operator.add, operator.mul, 0)
+        assert tiled_matmul(matrix, matrix, pairwise).tolist() == tiled_matmul(matrix, matrix, PLUS_TIMES).tolist()
+    
+    def test_empty_inner_dimension(self):
+        """Test an empty inner dimension yields the additive identity."""
+        assert tiled_matmul(Matrix(2, 0), Matrix(0, 3)).tolist() == [[0, 0, 0], [0, 0, 0]]
+        assert tiled_matmul(Matrix(2, 0), Matrix(0, 1), MIN_PLUS).tolist() == [[math.inf], [math.inf]]
+    
+    def test_invalid_arguments(self):
+        """Test mismatched shapes and block sizes."""
+        with pytest.raises(ValueError):
+            tiled_matmul(Matrix(2, 3), Matrix(2, 3))
+        with pytest.raises(ValueError):
+            tiled_matmul(Matrix(2, 2), Matrix(2, 2), block_size=0)
@@ -0,0 +1,113 @@
+"""
+Unit tests for partial sorting.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import itertools
+import random
+
+import pytest
+from src.partial_sort import partial_sort, iter_sorted
+
+
+class TestPartialSort:
+    """Test cases for partial_sort function."""
+    
+    def test_basic(self):
+        """Test the k smallest are returned in order."""
+        arr = [3, 1, 4, 1, 5, 9, 2, 6]
+        assert partial_sort(arr, 3, seed=42) == [1, 1, 2]
+        assert partial_sort(arr, len(arr), seed=42) == sorted(arr)
+    
+    def test_zero(self):
+        """Test k=0 returns an empty list, even for empty input."""
+        assert partial_sort([3, 1], 0) == []
+        assert partial_sort([], 0) == []
+    
+    def test_original_not_modified(self):
+        """Test the input is not reordered."""
+        arr = [5, 4, 3, 2, 1]
+        partial_sort(arr, 2, seed=42)
+        assert arr == [5, 4, 3, 2, 1]
+    
+    def test_key_function(self):
+        """Test partial sort with a key function."""
+        arr = [{'v': 3}, {'v': 1}, {'v': 2}]
+        result = partial_sort(arr, 2, key=lambda x: x['v'], seed=42)
+        assert [x['v'] for x in result] == [1, 2]
+    
+    def test_duplicates(self):
+        """Test heavy duplicates."""
+        arr = [2, 1] * 2000
+        assert partial_sort(arr, 2001, seed=42) == [1] * 2000 + [2]
+    
+    def test_buffer_input(self):
+        """Test partial sort over an array.array."""
+        buf = array.array('d', [0.3, 0.1, 0.2])
+        assert partial_sort(buf, 2, seed=42) == [0.1, 0.2]
+    
+    def test_matches_sorted(self):
+        """Test against sorted() on random inputs."""
+        rng = random.Random(7)
+        for _ in range(50):
+            arr = [rng.randint(0, 50) for _ in range(rng.randint(1, 200))]
+            k = rng.randint(0, len(arr))
+            assert partial_sort(arr, k) == sorted(arr)[:k]
+    
+    def test_every_path(self):
+        """Test the heap, histogram and quickselect paths against sorted()."""
+        rng = random.Random(3)
+        narrow = [rng.randint(0, 50) for _ in range(2000)]
+        wide = [rng.random() for _ in range(2000)]
+        pairs = [(rng.randint(0, 5), i) for i in range(2000)]
+        for arr, k in ((narrow, 10), (narrow, 700), (wide, 10), (wide, 700)):
+            assert partial_sort(arr, k, seed=1) == sorted(arr)[:k]
+        first = lambda pair: pair[0]
+        for k in (10, 700):
+            assert partial_sort(pairs, k, key=first, seed=1)[-1][0] == sorted(pairs, key=first)[k - 1][0]
+        assert partial_sort(pairs, 10, key=first) == sorted(pairs, key=first)[:10]
+    
+    def test_invalid_k(self):
+        """Test with invalid k values."""
+        with pytest.raises(ValueError):
+            partial_sort([1, 2, 3], -1)
+        with pytest.raises(ValueError):
+            partial_sort([1, 2, 3], 4)
+
+
+class TestIterSorted:
+    """Test cases for iter_sorted generator."""
+    
+    def test_full_drain(self):
+        """Test draining yields a full sort."""
+        arr = [9, 3, 7, 1, 8, 2, 6, 4, 5, 0] * 10
+        assert list(iter_sorted(arr, seed=42)) == sorted(arr)
+    
+    def test_lazy_prefix(self):
+        """Test taking a prefix from the generator."""
+        arr = list(range(1000, 0, -1))
+        prefix = list(itertools.islice(iter_sorted(arr, seed=42), 5))
+        assert prefix == [1, 2, 3, 4, 5]
+    
+    def test_small_chunks(self):
+        """Test correctness with the smallest chunk size."""
+        rng = random.Random(3)
+        arr = [rng.randint(0, 5) for _ in range(300)]
+        assert list(iter_sorted(arr, chunk_size=1)) == sorted(arr)
+    
+    def test_key_function(self):
+        """Test iteration with a key function."""
+        arr = ['ccc', 'a', 'bb']
+        assert list(iter_sorted(arr, key=len)) == ['a', 'bb', 'ccc']
+    
+    def test_empty(self):
+        """Test iterating an empty array."""
+        assert list(iter_sorted([])) == []
+    
+    def test_invalid_chunk_size(self):
+        """Test chunk_size must be positive."""
+        with pytest.raises(ValueError):
+            list(iter_sorted([1], chunk_size=0))
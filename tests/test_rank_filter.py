@@ -0,0 +1,98 @@
+"""
+Unit tests for 2-D median and rank filters.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import random
+import sys
+
+import pytest
+from src.rank_filter import median_filter, rank_filter
+
+
+def naive_rank_filter(grid, size, k):
+    """Reference filter that sorts a fresh, edge-replicated window per cell."""
+    rows, cols = len(grid), len(grid[0])
+    radius = size // 2
+    clamp = lambda x, n: min(max(x, 0), n - 1)
+    return [
+        [
+            sorted(
+                grid[clamp(i + di, rows)][clamp(j + dj, cols)]
+                for di in range(-radius, radius + 1)
+                for dj in range(-radius, radius + 1)
+            )[k - 1]
+            for j in range(cols)
+        ]
+        for i in range(rows)
+    ]
+
+
+class TestRankFilter:
+    """Test cases for rank_filter and median_filter."""
+    
+    def test_removes_outlier(self):
+        """Test a 3x3 median filter removes salt noise."""
+        grid = [[10, 10, 10, 10], [10, 255, 10, 10], [10, 10, 10, 0]]
+        assert median_filter(grid, 3) == [[10] * 4] * 3
+    
+    def test_integers_match_reference(self):
+        """Test the histogram window against sorting every window."""
+        random.seed(42)
+        for _ in range(30):
+            rows, cols = random.randint(1, 12), random.randint(1, 12)
+            size = random.choice([1, 3, 5, 7])
+            k = random.randint(1, size * size)
+            grid = [[random.randint(-20, 20) for _ in range(cols)] for _ in range(rows)]
+            assert rank_filter(grid, size, k) == naive_rank_filter(grid, size, k)
+    
+    def test_sparse_16bit_range_matches_reference(self):
+        """Test the block-skipping histogram walk on values clustered at both ends of 16 bits."""
+        random.seed(11)
+        for _ in range(20):
+            rows, cols = random.randint(1, 10), random.randint(1, 10)
+            size = random.choice([1, 3, 5])
+            k = random.randint(1, size * size)
+            grid = [[random.choice([0, 1, 65534, 65535, random.randrange(65536)]) for _ in range(cols)]
+                    for _ in range(rows)]
+            assert rank_filter(grid, size, k) == naive_rank_filter(grid, size, k)
+    
+    def test_floats_match_reference(self):
+        """Test the sorted window against sorting every window."""
+        random.seed(7)
+        for _ in range(30):
+            rows, cols = random.randint(1, 12), random.randint(1, 12)
+            size = random.choice([1, 3, 5])
+            k = random.randint(1, size * size)
+            grid = [[random.random() for _ in range(cols)] for _ in range(rows)]
+            assert rank_filter(grid, size, k) == naive_rank_filter(grid, size, k)
+    
+    def test_wide_integer_range_uses_sorted_window(self, monkeypatch):
+        """Test integers too spread out for a histogram still filter correctly."""
+        monkeypatch.setattr(sys.modules['src.rank_filter'], 'HISTOGRAM_MAX_RANGE', 4)
+        grid = [[0, 100, 7], [3, 50, 9]]
+        assert median_filter(grid, 3) == naive_rank_filter(grid, 3, 5)
+    
+    def test_window_larger_than_grid(self):
+        """Test windows that extend past every edge."""
+        grid = [[3, 1], [2, 4]]
+        assert rank_filter(grid, 5, 1) == [[1, 1], [1, 1]]
+        assert median_filter(grid, 5) == naive_rank_filter(grid, 5, 13)
+    
+    def test_empty(self):
+        """Test empty grids."""
+        assert median_filter([], 3) == []
+        assert median_filter([[], []], 3) == [[], []]
+    
+    def test_invalid_arguments(self):
+        """Test invalid size, k and ragged rows."""
+        with pytest.raises(ValueError):
+            median_filter([[1, 2]], 2)
+        with pytest.raises(ValueError):
+            median_filter([[1, 2]], 0)
+        with pytest.raises(ValueError):
+            rank_filter([[1, 2]], 3, 10)
+        with pytest.raises(ValueError):
+            median_filter([[1, 2], [3]], 3)
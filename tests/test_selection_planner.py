@@ -0,0 +1,172 @@
+"""
+Unit tests for the cost-based selection planner.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import random
+
+import pytest
+from src import selection_planner
+from src.selection_planner import (
+    SelectionPlanner, STRATEGIES, default_planner, select, select_many,
+    batch_select, batch_select_many
+)
+
+
+class TestSelect:
+    """Test cases for the select front door."""
+    
+    def test_every_strategy(self):
+        """Test every engine returns the same answer."""
+        rng = random.Random(11)
+        arr = [rng.randint(0, 10 ** 6) for _ in range(500)]
+        expected = sorted(arr)
+        for strategy in STRATEGIES:
+            for k in [1, 100, 250, 500]:
+                assert select(arr, k, strategy=strategy, seed=42) == expected[k - 1]
+    
+    def test_records_choice(self):
+        """Test every call is recorded in the planner history."""
+        planner = SelectionPlanner(history_size=2)
+        planner.select([3, 1, 2], 2)
+        planner.select([3, 1, 2], 1, strategy='heap')
+        planner.select([3, 1, 2], 3, strategy='deterministic')
+        assert [plan.engine for plan in planner.history] == ['heap', 'deterministic']
+        assert planner.last_plan.k == 3
+    
+    def test_default_planner(self):
+        """Test the module-level select uses the default planner."""
+        select([5, 4, 3], 1)
+        assert default_planner.last_plan.n == 3
+    
+    def test_key_function(self):
+        """Test selection with a key function."""
+        arr = [{'v': 3}, {'v': 1}, {'v': 2}]
+        assert select(arr, 2, key=lambda x: x['v'])['v'] == 2
+    
+    def test_buffer_input(self):
+        """Test selection over an array.array."""
+        assert select(array.array('d', [0.3, 0.1, 0.2]), 1) == 0.1
+    
+    def test_errors(self):
+        """Test invalid strategy, k and empty input."""
+        with pytest.raises(ValueError):
+            select([1, 2], 1, strategy='bogus')
+        with pytest.raises(ValueError):
+            select([1, 2], 3)
+        with pytest.raises(IndexError):
+            select([], 1)
+        with pytest.raises(ValueError):
+            select(['b', 'a'], 1, strategy='counting', key=str.upper)
+        with pytest.raises(ValueError):
+            select([0.5, 2.5, 1.5], 1, strategy='radix')
+        with pytest.raises(ValueError):
+            select(['b', 'a'], 1, strategy='counting')
+
+
+class TestSelectMany:
+    """Test cases for select_many."""
+    
+    def test_every_strategy(self):
+        """Test several ranks at once with every engine."""
+        rng = random.Random(12)
+        arr = [rng.random() for _ in range(300)]
+        expected = sorted(arr)
+        ks = [300, 1, 150, 150]
+        for strategy in STRATEGIES:
+            if strategy in ('counting', 'radix'):
+                continue
+            assert select_many(arr, ks, strategy=strategy, seed=1) == [expected[k - 1] for k in ks]
+    
+    def test_integer_engines(self):
+        """Test counting and radix answer several ranks."""
+        arr = [(i * 7919) % 1000 for i in range(1000)]
+        for strategy in ('counting', 'radix', 'auto'):
+            assert select_many(arr, [1, 500, 1000], strategy=strategy) == [0, 499, 999]
+    
+    def test_empty_ranks(self):
+        """Test no ranks returns no results."""
+        assert select_many([1, 2], []) == []
+
+
+class TestPlan:
+    """Test cases for engine choice."""
+    
+    def test_small_input_sorts(self):
+        """Test tiny inputs use the built-in sort."""
+        assert SelectionPlanner().plan([3, 1, 2], [2]).engine == 'sort'
+    
+    def test_edge_uses_heap(self):
+        """Test k near either end uses heapq."""
+        arr = [random.random() for _ in range(5000)]
+        planner = SelectionPlanner()
+        assert planner.plan(arr, [3]).engine == 'heap'
+        assert planner.plan(arr, [4998]).engine == 'heap'
+    
+    def test_narrow_ints_use_counting(self):
+        """Test narrow integer ranges use the histogram."""
+        rng = random.Random(3)
+        arr = [rng.randint(1, 1000) for _ in range(5000)]
+        plan = SelectionPlanner().plan(arr, [2500])
+        assert plan.engine == 'counting'
+        assert plan.signals['int_range'] < 1000
+    
+    def test_presorted_uses_sort(self):
+        """Test presorted input is left to Timsort."""
+        planner = SelectionPlanner()
+        assert planner.plan(list(range(5000)), [2500]).engine == 'sort'
+        assert planner.plan(list(range(5000, 0, -1)), [2500]).engine == 'sort'
+    
+    def test_wide_ints_use_radix(self, monkeypatch):
+        """Test large wide-range integers use radix passes."""
+        monkeypatch.setattr(selection_planner, 'RADIX_MIN_SIZE', 1000)
+        rng = random.Random(4)
+        arr = [rng.randint(-2 ** 60, 2 ** 60) for _ in range(2000)]
+        assert SelectionPlanner().plan(arr, [1000]).engine == 'radix'
+    
+    def test_large_objects_use_quickselect(self, monkeypatch):
+        """Test large inputs with costly comparisons use quickselect."""
+        monkeypatch.setattr(selection_planner, 'QUICKSELECT_MIN_SIZE', 1000)
+        rng = random.Random(5)
+        arr = [str(rng.random()) for _ in range(2000)]
+        assert SelectionPlanner().plan(arr, [1000]).engine == 'randomized'
+        dupes = ['a', 'b'] * 1000
+        assert SelectionPlanner().plan(dupes, [1000]).engine == 'sort'
+
+
+class TestBatchSelect:
+    """Test cases for batch_select and batch_select_many."""
+    
+    def test_same_rank(self):
+        """Test one rank applied to every sequence."""
+        assert batch_select([[3, 1, 2], [9, 7, 8]], 1) == [1, 7]
+    
+    def test_rank_per_sequence(self):
+        """Test one rank per sequence."""
+        assert batch_select([[3, 1, 2], [9, 7, 8]], [3, 2]) == [3, 8]
+    
+    def test_ragged_and_objects(self):
+        """Test ragged and non-numeric sequences fall back to select()."""
+        assert batch_select([[3, 1], [5], ['b', 'a', 'c']], [2, 1, 2]) == [3, 5, 'b']
+    
+    def test_key_function(self):
+        """Test batch selection with a key."""
+        assert batch_select([['aaa', 'b'], ['cc', 'd']], 1, key=len) == ['b', 'd']
+    
+    def test_many(self):
+        """Test the same ranks from every sequence."""
+        rows = [[3.0, 1.0, 2.0], [9.0, 7.0, 8.0]]
+        assert batch_select_many(rows, [3, 1]) == [[3.0, 1.0], [9.0, 7.0]]
+        assert batch_select_many([['b', 'a']], [1, 2]) == [['a', 'b']]
+    
+    def test_errors(self):
+        """Test mismatched ranks, empty sequences and invalid k."""
+        with pytest.raises(ValueError):
+            batch_select([[1], [2]], [1])
+        with pytest.raises(IndexError):
+            batch_select([[]], 1)
+        with pytest.raises(ValueError):
+            batch_select_many([[1, 2]], [3])
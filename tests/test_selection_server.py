@@ -0,0 +1,153 @@
+"""
+Unit tests for the asyncio selection query server.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import asyncio
+import json
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.selection_server import SelectionServer, SelectionClient
+
+
+def run_with_server(scenario, **server_options):
+    """Start a loopback server, run scenario(server, client) and shut down."""
+    async def main():
+        server_options.setdefault('executor', ThreadPoolExecutor(max_workers=2))
+        server = SelectionServer(**server_options)
+        await server.start()
+        client = await SelectionClient.connect(port=server.port)
+        try:
+            return await scenario(server, client)
+        finally:
+            await client.close()
+            await server.close()
+    return asyncio.run(main())
+
+
+class TestSelectionServer:
+    """Test cases for SelectionServer and SelectionClient."""
+    
+    def test_queries(self):
+        """Test k-th, median and quantile queries over an uploaded dataset."""
+        data = [random.Random(42).randint(0, 1000) for _ in range(501)]
+        expected = sorted(data)
+        
+        async def scenario(server, client):
+            assert await client.upload('values', data) == 501
+            assert await client.kth('values', 1) == expected[0]
+            assert await client.kth('values', 100) == expected[99]
+            assert await client.median('values') == expected[250]
+            assert await client.quantiles('values', [0, 0.5, 1]) == [expected[0], expected[250], expected[-1]]
+        
+        run_with_server(scenario)
+    
+    def test_float_and_string_datasets(self):
+        """Test datasets that are not integers."""
+        async def scenario(server, client):
+            await client.upload('floats', [2.5, -1.0, 7.25])
+            await client.upload('words', ['pear', 'apple', 'fig'])
+            assert await client.median('floats') == 2.5
+            assert await client.kth('words', 1) == 'apple'
+        
+        run_with_server(scenario)
+    
+    def test_concurrent_queries_are_coalesced(self):
+        """Test concurrent queries on one dataset share one selection pass."""
+        data = list(range(1000, 0, -1))
+        
+        async def scenario(server, client):
+            await client.upload('values', data)
+            results = await asyncio.gather(*(client.kth('values', k) for k in range(1, 21)))
+            assert results == list(range(1, 21))
+            assert server.batches == 1
+        
+        run_with_server(scenario, coalesce_delay=0.1)
+    
+    def test_latency_reported(self):
+        """Test every response and the stats summary carry latencies."""
+        async def scenario(server, client):
+            await client.upload('values', [3, 1, 2])
+            response = await client.request({'op': 'median', 'name': 'values'})
+            assert response['ok'] and response['result'] == 2
+            assert response['latency_ms'] >= 0
+            stats = await client.call({'op': 'stats'})
+            assert stats['datasets'] == {'values': 3}
+            assert stats['requests'] == 2
+            assert stats['latency_ms']['max'] >= stats['latency_ms']['p50']
+        
+        run_with_server(scenario)
+    
+    def test_errors(self):
+        """Test bad requests get error responses and the connection survives."""
+        async def scenario(server, client):
+            await client.upload('values', [1, 2, 3])
+            with pytest.raises(RuntimeError, match='unknown dataset'):
+                await client.kth('missing', 1)
+            with pytest.raises(RuntimeError, match='k must be between'):
+                await client.kth('values', 4)
+            with pytest.raises(RuntimeError, match='k must be between'):
+                await client.kth('values', True)
+            with pytest.raises(RuntimeError, match='unknown op'):
+                await client.call({'op': 'mode', 'name': 'values'})
+            with pytest.raises(RuntimeError):
+                await client.upload('empty', [])
+            assert await client.call({'op': 'drop', 'name': 'values'}) is True
+            with pytest.raises(RuntimeError, match='unknown dataset'):
+                await client.median('values')
+        
+        run_with_server(scenario)
+    
+    def test_malformed_line(self):
+        """Test a line that is not JSON gets an error response."""
+        async def scenario(server, client):
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(b'not json\n')
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            writer.close()
+            assert response['ok'] is False
+        
+        run_with_server(scenario)
+    
+    def test_process_pool(self, monkeypatch):
+        """Test batches over large datasets run in the default process pool."""
+        monkeypatch.setattr(sys.modules['src.selection_server'], 'INLINE_MAX_SIZE', 10)
+        data = random.Random(7).sample(range(10000), 500)
+        expected = sorted(data)
+        
+        async def scenario(server, client):
+            await client.upload('values', data)
+            results = await asyncio.gather(client.median('values'), client.kth('values', 3))
+            assert results == [expected[249], expected[2]]
+        
+        run_with_server(scenario, executor=None, max_workers=1)
+    
+    def test_process_pool_keeps_datasets_shared(self, monkeypatch):
+        """Test numeric datasets are shared with workers once and released on replace and drop."""
+        monkeypatch.setattr(sys.modules['src.selection_server'], 'INLINE_MAX_SIZE', 10)
+        data = random.Random(8).sample(range(10000), 500)
+        
+        async def scenario(server, client):
+            await client.upload('values', data)
+            await client.upload('words', [str(value) for value in data])
+            assert await client.kth('values', 1) == min(data)
+            segment = server._shared['values'].name
+            assert await client.kth('values', 500) == max(data)
+            assert server._shared['values'].name == segment
+            assert await client.kth('words', 1) == min(map(str, data))
+            assert list(server._shared) == ['values']
+            
+            await client.upload('values', [0.5] * 20)
+            assert 'values' not in server._shared
+            assert await client.median('values') == 0.5
+            assert server._shared['values'].name != segment
+            await client.call({'op': 'drop', 'name': 'values'})
+            assert server._shared == {}
+        
+        run_with_server(scenario, executor=None, max_workers=1)
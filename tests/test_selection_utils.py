@@ -0,0 +1,156 @@
+"""
+Unit tests for the shared selection helpers.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+
+import pytest
+from src.data_structures import DynamicArray, LinkedList, Queue, Stack
+from src.selection_utils import (
+    as_indexable, container_items, element_count, is_buffer, make_scratch,
+    quantile_rank, numeric_matrix
+)
+
+
+class TestIsBuffer:
+    """Test cases for is_buffer."""
+    
+    def test_buffers(self):
+        """Test buffer-protocol objects are detected."""
+        assert is_buffer(array.array('d'))
+        assert is_buffer(memoryview(b'ab'))
+        assert is_buffer(b'ab')
+        assert is_buffer(bytearray(b'ab'))
+    
+    def test_sequences(self):
+        """Test plain sequences are not treated as buffers."""
+        assert not is_buffer([1, 2])
+        assert not is_buffer((1, 2))
+        assert not is_buffer('ab')
+
+
+class TestMakeScratch:
+    """Test cases for make_scratch."""
+    
+    def test_list_is_copied(self):
+        """Test lists are copied unless in-place is requested."""
+        data = [3, 1, 2]
+        scratch = make_scratch(data)
+        assert scratch == data and scratch is not data
+        assert make_scratch(data, in_place=True) is data
+    
+    def test_immutable_sequence_copied_in_place(self):
+        """Test in-place requests on tuples and ranges fall back to a list copy."""
+        assert make_scratch((3, 1, 2), in_place=True) == [3, 1, 2]
+        assert make_scratch(range(3), in_place=True) == [0, 1, 2]
+    
+    def test_array_keeps_format(self):
+        """Test array.array inputs yield a typed copy of the same format."""
+        data = array.array('d', [1.5, 2.5])
+        scratch = make_scratch(data)
+        assert isinstance(scratch, array.array)
+        assert scratch.typecode == 'd'
+        assert scratch == data and scratch is not data
+    
+    def test_memoryview_is_copied_typed(self):
+        """Test memoryviews are copied into a typed array."""
+        scratch = make_scratch(memoryview(array.array('i', [4, 5, 6])))
+        assert isinstance(scratch, array.array)
+        assert scratch.typecode == 'i'
+        assert list(scratch) == [4, 5, 6]
+    
+    def test_non_contiguous_view(self):
+        """Test strided memoryviews are copied in logical order."""
+        view = memoryview(array.array('q', range(10)))[::3]
+        assert list(make_scratch(view)) == [0, 3, 6, 9]
+    
+    def test_unsupported_format_boxed(self):
+        """Test formats array.array cannot hold fall back to a list."""
+        view = memoryview(bytes([1, 0, 1])).cast('?')
+        assert make_scratch(view) == [True, False, True]
+
+
+
+class TestContainerItems:
+    """Test cases for selection over the project's containers."""
+    
+    def _filled(self, container, add):
+        """Fill a container with the same values."""
+        for value in [5, 3, 9, 1]:
+            add(container, value)
+        return container
+    
+    def test_dynamic_array_slice(self):
+        """Test a DynamicArray is sliced out of its backing storage."""
+        arr = self._filled(DynamicArray(initial_capacity=16), DynamicArray.append)
+        items = container_items(arr)
+        assert items == [5, 3, 9, 1]
+        assert items is not arr._data
+    
+    def test_dynamic_array_in_place(self):
+        """Test in-place mode partitions the trimmed backing list itself."""
+        arr = self._filled(DynamicArray(initial_capacity=16), DynamicArray.append)
+        items = make_scratch(arr, in_place=True)
+        assert items is arr._data and len(items) == 4
+        items.sort()
+        assert list(arr) == [1, 3, 5, 9]
+        arr.append(7)
+        assert list(arr) == [1, 3, 5, 9, 7]
+    
+    def test_drained_containers(self):
+        """Test linked lists, stacks and queues are drained into lists."""
+        assert container_items(self._filled(LinkedList(), LinkedList.append)) == [5, 3, 9, 1]
+        assert container_items(self._filled(Stack(), Stack.push)) == [5, 3, 9, 1]
+        assert make_scratch(self._filled(Queue(), Queue.enqueue), in_place=True) == [5, 3, 9, 1]
+    
+    def test_other_inputs(self):
+        """Test non-container inputs are left to the other paths."""
+        assert container_items([1, 2]) is None
+        assert as_indexable(self._filled(LinkedList(), LinkedList.append)) == [5, 3, 9, 1]
+
+
+class TestElementCount:
+    """Test cases for element_count."""
+    
+    def test_counts(self):
+        """Test element counting for sequences and buffers."""
+        assert element_count([1, 2, 3]) == 3
+        assert element_count(array.array('d', [1.0, 2.0])) == 2
+        view = memoryview(bytes(12)).cast('B', shape=[3, 4])
+        assert element_count(view) == 12
+
+
+class TestQuantileRank:
+    """Test cases for quantile_rank."""
+    
+    def test_ranks(self):
+        """Test nearest-rank definition and the lower median."""
+        assert quantile_rank(0, 10) == 1
+        assert quantile_rank(1, 10) == 10
+        assert quantile_rank(0.5, 10) == 5
+        assert quantile_rank(0.5, 5) == 3
+    
+    def test_invalid(self):
+        """Test quantiles outside [0, 1]."""
+        with pytest.raises(ValueError):
+            quantile_rank(-0.1, 10)
+
+
+class TestNumericMatrix:
+    """Test cases for numeric_matrix."""
+    
+    def test_numeric_rows(self):
+        """Test rectangular numeric rows become a 2-D array."""
+        pytest.importorskip('numpy')
+        matrix = numeric_matrix([[1, 2], [3, 4.5]])
+        assert matrix.shape == (2, 2)
+    
+    def test_rejected_rows(self):
+        """Test ragged, boolean and object rows are rejected."""
+        assert numeric_matrix([[1, 2], [3]]) is None
+        assert numeric_matrix([[True, False]]) is None
+        assert numeric_matrix([['a']]) is None
+        assert numeric_matrix([]) is None
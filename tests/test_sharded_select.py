@@ -0,0 +1,90 @@
+"""
+Unit tests for selection across multiple sequences.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+import random
+
+import pytest
+from src import sharded_select
+from src.sharded_select import select_across
+
+
+class TestSelectAcrossSorted:
+    """Test cases for select_across on sorted shards."""
+    
+    def test_basic(self):
+        """Test every rank across interleaved sorted shards."""
+        shards = [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+        for k in range(1, 10):
+            assert select_across(shards, k, assume_sorted=True) == k
+    
+    def test_auto_detects_sorted(self):
+        """Test sortedness is detected when not given."""
+        shards = [[1, 2, 3], [10, 20], [4, 5]]
+        assert select_across(shards, 4) == 4
+    
+    def test_large_shards(self, monkeypatch):
+        """Test the binary-search rounds on shards above the gather threshold."""
+        monkeypatch.setattr(sharded_select, 'GATHER_THRESHOLD', 8)
+        rng = random.Random(1)
+        shards = [sorted(rng.randint(0, 100) for _ in range(rng.randint(0, 300))) for _ in range(5)]
+        merged = sorted(x for shard in shards for x in shard)
+        for k in [1, len(merged) // 3, len(merged) // 2, len(merged)]:
+            assert select_across(shards, k, assume_sorted=True) == merged[k - 1]
+    
+    def test_key_function(self):
+        """Test sorted shards ordered by key."""
+        shards = [[{'v': 1}, {'v': 5}], [{'v': 2}, {'v': 3}]]
+        result = select_across(shards, 3, key=lambda x: x['v'], assume_sorted=True)
+        assert result['v'] == 3
+    
+    def test_buffer_shards(self):
+        """Test sorted array.array shards."""
+        shards = [array.array('d', [0.1, 0.4]), array.array('d', [0.2, 0.3])]
+        assert select_across(shards, 2, assume_sorted=True) == 0.2
+
+
+class TestSelectAcrossUnsorted:
+    """Test cases for select_across on unsorted shards."""
+    
+    def test_basic(self):
+        """Test selection across small unsorted shards."""
+        shards = [[7, 1, 4], [8, 2], [9, 3, 6, 5]]
+        assert select_across(shards, 5, seed=42) == 5
+    
+    def test_counting_rounds(self, monkeypatch):
+        """Test the sampling rounds against a full sort."""
+        monkeypatch.setattr(sharded_select, 'GATHER_THRESHOLD', 16)
+        rng = random.Random(2)
+        shards = [[rng.random() for _ in range(rng.randint(0, 400))] for _ in range(6)]
+        merged = sorted(x for shard in shards for x in shard)
+        for k in [1, 7, len(merged) // 2, len(merged) - 3, len(merged)]:
+            assert select_across(shards, k, assume_sorted=False, seed=k) == merged[k - 1]
+    
+    def test_duplicates(self, monkeypatch):
+        """Test shards dominated by a single value."""
+        monkeypatch.setattr(sharded_select, 'GATHER_THRESHOLD', 16)
+        shards = [[5] * 300 + [1, 9], [5] * 200 + [0]]
+        merged = sorted(x for shard in shards for x in shard)
+        for k in [1, 2, 250, len(merged)]:
+            assert select_across(shards, k, assume_sorted=False, seed=42) == merged[k - 1]
+
+
+class TestSelectAcrossErrors:
+    """Test cases for select_across error handling."""
+    
+    def test_empty(self):
+        """Test selection over empty shards."""
+        with pytest.raises(IndexError):
+            select_across([[], []], 1)
+    
+    def test_invalid_k(self):
+        """Test with invalid k values."""
+        with pytest.raises(ValueError):
+            select_across([[1], [2]], 0)
+        with pytest.raises(ValueError):
+            select_across([[1], [2]], 3)
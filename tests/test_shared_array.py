@@ -0,0 +1,123 @@
+"""
+Unit tests for the shared-memory dynamic array.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from src.deterministic_algorithm import deterministic_select
+from src.shared_array import SharedDynamicArray
+
+
+def read_in_child(name):
+    """Attach to a shared array in a worker process and return its contents."""
+    shared = SharedDynamicArray.attach(name)
+    try:
+        return shared.version, shared.tolist()
+    finally:
+        shared.close()
+
+
+class TestSharedDynamicArray:
+    """Test cases for SharedDynamicArray."""
+    
+    def test_writer_operations(self):
+        """Test append, extend, item assignment and clear on the writer."""
+        with SharedDynamicArray('q', initial_capacity=2) as shared:
+            shared.append(5)
+            shared.extend([3, 9, 1])
+            shared[-1] = 7
+            assert shared.tolist() == [5, 3, 9, 7]
+            assert shared[0] == 5 and len(shared) == 4
+            with pytest.raises(IndexError):
+                shared[4]
+            shared.clear()
+            assert len(shared) == 0 and list(shared) == []
+    
+    def test_attach_follows_growth(self):
+        """Test a reader sees appends, including ones that moved the data segment."""
+        with SharedDynamicArray('d', initial_capacity=1) as shared:
+            reader = SharedDynamicArray.attach(shared.name)
+            try:
+                assert reader.typecode == 'd' and len(reader) == 0
+                for i in range(100):
+                    shared.append(i / 2)
+                assert reader.tolist() == [i / 2 for i in range(100)]
+                assert reader[-1] == 49.5
+                assert reader.version == shared.version and reader.version % 2 == 0
+                snapshot = reader.snapshot()
+                assert isinstance(snapshot, array.array) and snapshot.typecode == 'd'
+            finally:
+                reader.close()
+    
+    def test_readers_are_read_only(self):
+        """Test attached arrays reject writes."""
+        with SharedDynamicArray() as shared:
+            shared.append(1)
+            reader = SharedDynamicArray.attach(shared.name)
+            try:
+                with pytest.raises(PermissionError):
+                    reader.append(2)
+                with pytest.raises(PermissionError):
+                    reader[0] = 2
+            finally:
+                reader.close()
+    
+    def test_consistent_read_retries_after_write(self):
+        """Test a read overlapped by a write is retried on the new contents."""
+        with SharedDynamicArray(initial_capacity=4) as shared:
+            shared.extend([1, 2, 3])
+            reader = SharedDynamicArray.attach(shared.name)
+            calls = []
+            
+            def read(view):
+                calls.append(view.tolist())
+                if len(calls) == 1:
+                    shared.extend(range(10))  # Grows into a new segment mid-read
+                return sum(view)
+            
+            try:
+                assert reader.consistent_read(read) == 6 + 45
+                assert calls == [[1, 2, 3], [1, 2, 3] + list(range(10))]
+            finally:
+                reader.close()
+    
+    def test_view_outlives_growth(self):
+        """Test a held view keeps the old segment mapped until it is released."""
+        with SharedDynamicArray(initial_capacity=2) as shared:
+            shared.extend([4, 2])
+            reader = SharedDynamicArray.attach(shared.name)
+            try:
+                view = reader.view()
+                shared.extend(range(100))
+                assert len(reader) == 102 and reader[2] == 0
+                assert view.tolist() == [4, 2]
+                view.release()
+            finally:
+                reader.close()
+    
+    def test_attach_unknown_name(self):
+        """Test attaching to a missing array raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            SharedDynamicArray.attach('no_such_shared_array')
+    
+    def test_selection_uses_snapshot(self):
+        """Test selection reads a shared array through its snapshot."""
+        with SharedDynamicArray() as shared:
+            shared.extend([5, 3, 9, 1, 7])
+            assert deterministic_select(shared, 2) == 3
+            assert shared.tolist() == [5, 3, 9, 1, 7]
+    
+    def test_child_process_reader(self):
+        """Test worker processes attach by name and read the writer's contents."""
+        with SharedDynamicArray('q', initial_capacity=8) as shared:
+            shared.extend(range(1000))
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(read_in_child, [shared.name] * 3))
+            for version, values in results:
+                assert version == shared.version
+                assert values == list(range(1000))
@@ -0,0 +1,102 @@
+"""
+Unit tests for the sparse matrix.
+
+Author: Carlos Gutierrez
+Course: MSCS532 - Data Structures and Algorithms
+"""
+
+import random
+from fractions import Fraction
+
+import pytest
+from src.data_structures import Matrix
+from src.sparse_matrix import SparseMatrix
+
+
+def random_sparse(rows, cols, nnz, seed):
+    """Build a random sparse matrix with small integer values."""
+    rng = random.Random(seed)
+    sparse = SparseMatrix(rows, cols)
+    for _ in range(nnz):
+        sparse[rng.randrange(rows), rng.randrange(cols)] = rng.randint(-5, 5)
+    return sparse
+
+
+class TestSparseMatrix:
+    """Test cases for SparseMatrix."""
+    
+    def test_get_set(self):
+        """Test unset cells read as zero and zero assignments remove entries."""
+        sparse = SparseMatrix(100000, 100000)
+        sparse[5, 99999] = 3
+        sparse[70000, 2] = 1.5
+        assert sparse[5, 99999] == 3 and sparse[0, 0] == 0
+        assert sparse.nnz == 2
+        sparse[5, 99999] = 0
+        assert sparse.nnz == 1 and sparse[5, 99999] == 0
+        with pytest.raises(IndexError):
+            sparse[100000, 0]
+        with pytest.raises(IndexError):
+            sparse[0, -1] = 1
+    
+    def test_constructors(self):
+        """Test building from dense rows, a Matrix and summed COO triplets."""
+        rows = [[1, 0, 2], [0, 0, 3], [4, 5, 0]]
+        assert SparseMatrix.from_dense(rows).to_dense().tolist() == rows
+        assert SparseMatrix.from_dense(Matrix.from_rows(rows)).nnz == 5
+        sparse = SparseMatrix.from_coo(2, 2, [0, 1, 0], [0, 1, 0], [1, 2, 3])
+        assert sparse.to_dense().tolist() == [[4, 0], [0, 2]]
+        with pytest.raises(ValueError):
+            SparseMatrix.from_coo(2, 2, [0], [0, 1], [1])
+    
+    def test_compressed_forms(self):
+        """Test CSR/CSC arrays and row/column iteration."""
+        sparse = SparseMatrix.from_dense([[1, 0, 2], [0, 0, 3], [4, 5, 0]])
+        indptr, indices, values = sparse.to_csr()
+        assert list(indptr) == [0, 2, 3, 5]
+        assert list(indices) == [0, 2, 2, 0, 1] and values == [1, 2, 3, 4, 5]
+        indptr, indices, values = sparse.to_csc()
+        assert list(indptr) == [0, 2, 3, 5] and values == [1, 4, 5, 2, 3]
+        assert sparse.row(2) == [(0, 4), (1, 5)]
+        assert sparse.column(2) == [(0, 2), (1, 3)]
+        assert list(sparse.iter_rows())[1] == [(2, 3)]
+        sparse[1, 1] = 7
+        assert sparse.row(1) == [(1, 7), (2, 3)]
+    
+    def test_products_match_dense(self):
+        """Test matvec, rmatvec and both matmuls against dense Matrix products."""
+        a = random_sparse(30, 20, 60, seed=1)
+        b = random_sparse(20, 25, 50, seed=2)
+        dense_a, dense_b = a.to_dense(), b.to_dense()
+        vector = list(range(20))
+        assert a @ vector == [row[0] for row in (dense_a @ Matrix.from_iterable(vector, 20, 1)).tolist()]
+        assert list(range(30)) @ a == (Matrix.from_iterable(range(30), 1, 30) @ dense_a).tolist()[0]
+        assert (a @ b).to_dense().tolist() == (dense_a @ dense_b).tolist()
+        assert (a @ dense_b).tolist() == (dense_a @ dense_b).tolist()
+        assert a.T.to_dense().tolist() == dense_a.T.tolist()
+        with pytest.raises(ValueError):
+            a @ a
+        with pytest.raises(ValueError):
+            a @ [1, 2]
+    
+    def test_cancellation_is_dropped(self):
+        """Test products that cancel to zero store no entry."""
+        a = SparseMatrix.from_dense([[1, 1]])
+        b = SparseMatrix.from_dense([[1], [-1]])
+        product = a @ b
+        assert product.nnz == 0 and product[0, 0] == 0
+    
+    def test_object_values(self):
+        """Test Fraction values keep exact arithmetic."""
+        sparse = SparseMatrix(2, 2)
+        sparse[0, 1] = Fraction(1, 3)
+        sparse.add(0, 1, Fraction(1, 6))
+        assert sparse[0, 1] == Fraction(1, 2)
+        assert sparse @ [0, 4] == [2, 0]
+    
+    def test_memory_usage(self):
+        """Test the memory report against the dense size without allocating it."""
+        sparse = random_sparse(100000, 100000, 1000, seed=3)
+        usage = sparse.memory_usage()
+        assert usage['dense'] > 100000 * 100000
+        assert usage['coo'] + usage['csr'] + usage['values'] < usage['dense'] / 1000